@@ -0,0 +1,25 @@
+"""add (deleted, status, submitted_at) index to jobs
+
+Revision ID: c3d8e1f2a4b5
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'c3d8e1f2a4b5'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_deleted_status_submitted', 'jobs',
+                    ['deleted', 'status', 'submitted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_deleted_status_submitted', table_name='jobs')
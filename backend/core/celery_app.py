@@ -14,10 +14,35 @@ Usage:
 
 import os
 import logging
+import zlib
+from typing import Optional
+
 from celery import Celery
+from kombu.serialization import register
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# -- Message serialisation --
+# orjson encodes task payloads (spec_dict) several times faster than the
+# stdlib.  Workers accept both content types so messages published by an
+# older producer still decode.
+if orjson is not None:
+    register(
+        "orjson",
+        orjson.dumps,
+        orjson.loads,
+        content_type="application/x-orjson",
+        content_encoding="utf-8",
+    )
+    TASK_SERIALIZER = "orjson"
+else:
+    TASK_SERIALIZER = "json"
+
 # -- Broker & backend URLs --
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
@@ -28,6 +53,28 @@ REDIS_DB_BACKEND = int(os.getenv("REDIS_DB_BACKEND", "1"))
 broker_url = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB_BROKER}"
 backend_url = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB_BACKEND}"
 
+# -- Job queue sharding (opt-in) --
+# By default every job lands on the single ``docker_jobs`` queue.  Setting
+# CELERY_PLUGIN_QUEUES=1 routes plugin jobs to ``plugin-<plugin_id>`` and
+# CELERY_WORKFLOW_SHARDS=N spreads workflow jobs over ``workflow-0..N-1``.
+# Workers must then be started with the matching ``-Q`` list, e.g.
+#   -Q docker_jobs,plugin-freesurfer_recon,workflow-0,workflow-1,celery
+DEFAULT_JOB_QUEUE = "docker_jobs"
+PLUGIN_QUEUES = os.getenv("CELERY_PLUGIN_QUEUES", "0").lower() in ("1", "true", "yes")
+WORKFLOW_SHARDS = int(os.getenv("CELERY_WORKFLOW_SHARDS", "0"))
+
+
+def job_queue(job_id: str, plugin_id: Optional[str] = None, execution_mode: str = "plugin") -> str:
+    """Pick the broker queue for a job according to the sharding settings."""
+    if execution_mode == "workflow":
+        if WORKFLOW_SHARDS > 0:
+            return f"workflow-{zlib.crc32(job_id.encode()) % WORKFLOW_SHARDS}"
+        return DEFAULT_JOB_QUEUE
+    if PLUGIN_QUEUES and plugin_id:
+        return f"plugin-{plugin_id}"
+    return DEFAULT_JOB_QUEUE
+
+
 # -- Create Celery app --
 celery_app = Celery(
     "neuroinsight",
@@ -37,8 +84,8 @@ celery_app = Celery(
 
 celery_app.conf.update(
     # Serialisation
-    task_serializer="json",
-    accept_content=["json"],
+    task_serializer=TASK_SERIALIZER,
+    accept_content=["json", "orjson"] if orjson is not None else ["json"],
     result_serializer="json",
 
     # Timezone
@@ -52,11 +99,11 @@ celery_app.conf.update(
     # Results expire after 7 days
     result_expires=60 * 60 * 24 * 7,
 
-    # Task routing
+    # Task routing (default when the caller does not pass queue=)
     task_routes={
-        "backend.execution.celery_tasks.run_docker_job": {"queue": "docker_jobs"},
-        "backend.execution.celery_tasks.run_workflow_job": {"queue": "docker_jobs"},
-        "backend.execution.celery_tasks.pull_docker_image": {"queue": "docker_jobs"},
+        "backend.execution.celery_tasks.run_docker_job": {"queue": DEFAULT_JOB_QUEUE},
+        "backend.execution.celery_tasks.run_workflow_job": {"queue": DEFAULT_JOB_QUEUE},
+        "backend.execution.celery_tasks.pull_docker_image": {"queue": DEFAULT_JOB_QUEUE},
     },
 
     # Retry policy for broker connection
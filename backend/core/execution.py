@@ -5,9 +5,10 @@ Defines the core interface for job execution backends.
 All backends (Local, SLURM, PBS, etc.) implement this interface,
 allowing the application to be deployment-agnostic.
 """
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional
 from pathlib import Path
@@ -68,12 +69,32 @@ class JobInfo:
     output_dir: Optional[str] = None
 
 
+EPOCH = datetime(1970, 1, 1)
+
+
+def now_ns() -> int:
+    """Timestamp for in-memory job tracking (converted lazily)."""
+    return time.time_ns()
+
+
+def ns_to_datetime(ns: Optional[int]) -> Optional[datetime]:
+    """Naive-UTC datetime for a ``now_ns()`` stamp, matching the DB columns."""
+    if ns is None:
+        return None
+    return EPOCH + timedelta(microseconds=ns // 1000)
+
+
 @dataclass
 class JobLogs:
-    """Job execution logs."""
+    """Job execution logs.
+
+    ``stdout_offset`` is set by backends that support incremental reads: the
+    byte offset just past the returned stdout, to pass back as ``since_offset``.
+    """
     job_id: str
     stdout: str = ""
     stderr: str = ""
+    stdout_offset: Optional[int] = None
 
 
 class ExecutionBackend(ABC):
@@ -106,6 +127,23 @@ class ExecutionBackend(ABC):
         """
         pass
 
+    def submit_jobs(self, specs: List[JobSpec], job_ids: Optional[List[str]] = None) -> List[str]:
+        """Submit several jobs at once.
+
+        Backends that can amortise dispatch (one DB transaction, one broker
+        round-trip) override this; the default submits one job at a time.
+
+        Args:
+            specs: Job specifications
+            job_ids: Optional pre-generated job IDs, parallel to ``specs``
+
+        Returns:
+            Job IDs in the same order as ``specs``
+        """
+        if job_ids is None:
+            job_ids = [None] * len(specs)
+        return [self.submit_job(spec, job_id=job_id) for spec, job_id in zip(specs, job_ids)]
+
     @abstractmethod
     def get_job_status(self, job_id: str) -> JobStatus:
         """Query current job status.
@@ -35,6 +35,7 @@ YAML STRUCTURE:
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -114,6 +115,14 @@ class PipelineDefinition:
     authors: List[str] = field(default_factory=list)
     references: List[str] = field(default_factory=list)
 
+    @cached_property
+    def default_params(self) -> Dict[str, Any]:
+        """Parameters with a declared default, by name (built once).
+
+        Shared across requests: merge into a new dict, never mutate.
+        """
+        return {p.name: p.default for p in self.parameters if p.default is not None}
+
 
 class PipelineRegistry:
     """Registry for pipeline discovery and management.
@@ -10,8 +10,11 @@ Key design:
 - Hidden utility plugins (user_selectable=false) are only used by workflows
 - All computation is in plugins; workflows only orchestrate
 """
+import hashlib
+import json
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Iterable, Set
 
@@ -25,6 +28,12 @@ logger = logging.getLogger(__name__)
 EEG_DOMAINS = frozenset({"eeg", "eeg_imaging"})
 
 
+def _content_hash(raw_yaml: Dict[str, Any]) -> str:
+    """Hash a definition's parsed YAML independent of key order and formatting."""
+    yaml_str = json.dumps(raw_yaml, sort_keys=True, default=str)
+    return hashlib.sha256(yaml_str.encode()).hexdigest()[:16]
+
+
 @dataclass
 class PluginDefinition:
     """A single-tool execution unit loaded from YAML."""
@@ -55,6 +64,16 @@ class PluginDefinition:
     references: List[str] = field(default_factory=list)
     raw_yaml: Dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def yaml_text(self) -> str:
+        """``raw_yaml`` rendered back to YAML for docs/review (dumped once)."""
+        return yaml.dump(self.raw_yaml, default_flow_style=False, sort_keys=False)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Short SHA-256 of ``raw_yaml`` recorded in lockfiles."""
+        return _content_hash(self.raw_yaml)
+
     def to_api_dict(self) -> Dict[str, Any]:
         """Serialize for API response."""
         return {
@@ -110,6 +129,16 @@ class WorkflowDefinition:
     references: List[str] = field(default_factory=list)
     raw_yaml: Dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def yaml_text(self) -> str:
+        """``raw_yaml`` rendered back to YAML for docs/review (dumped once)."""
+        return yaml.dump(self.raw_yaml, default_flow_style=False, sort_keys=False)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Short SHA-256 of ``raw_yaml`` recorded in lockfiles."""
+        return _content_hash(self.raw_yaml)
+
     def to_api_dict(self, plugin_registry: Optional[Dict[str, "PluginDefinition"]] = None) -> Dict[str, Any]:
         """Serialize for API response, enriching steps with plugin metadata."""
         steps_list = []
@@ -347,31 +376,23 @@ class PluginWorkflowRegistry:
         This is useful for reproducibility: a job can record exactly which
         plugin and workflow versions were used.
         """
-        import hashlib
-        import json as _json
-
         lockfile = {
             "generated_at": __import__("datetime").datetime.utcnow().isoformat() + "Z",
             "plugins": {},
             "workflows": {},
         }
         for pid, p in sorted(self.plugins.items()):
-            # Hash the raw YAML content for integrity verification
-            yaml_str = _json.dumps(p.raw_yaml, sort_keys=True, default=str)
-            content_hash = hashlib.sha256(yaml_str.encode()).hexdigest()[:16]
             lockfile["plugins"][pid] = {
                 "version": p.version,
                 "container_image": p.container_image,
-                "content_hash": content_hash,
+                "content_hash": p.content_hash,
             }
         for wid, w in sorted(self.workflows.items()):
-            yaml_str = _json.dumps(w.raw_yaml, sort_keys=True, default=str)
-            content_hash = hashlib.sha256(yaml_str.encode()).hexdigest()[:16]
             step_plugins = [s.uses for s in w.steps]
             lockfile["workflows"][wid] = {
                 "version": w.version,
                 "step_plugins": step_plugins,
-                "content_hash": content_hash,
+                "content_hash": w.content_hash,
             }
         return lockfile
 
@@ -380,9 +401,6 @@ class PluginWorkflowRegistry:
 
         Returns a report of mismatches (version changes, missing items).
         """
-        import hashlib
-        import json as _json
-
         report: Dict[str, Any] = {"plugins": [], "workflows": [], "status": "ok"}
 
         for pid, lock_info in lockfile.get("plugins", {}).items():
@@ -399,8 +417,7 @@ class PluginWorkflowRegistry:
                 })
                 report["status"] = "mismatch"
             else:
-                yaml_str = _json.dumps(plugin.raw_yaml, sort_keys=True, default=str)
-                content_hash = hashlib.sha256(yaml_str.encode()).hexdigest()[:16]
+                content_hash = plugin.content_hash
                 if content_hash != lock_info.get("content_hash"):
                     report["plugins"].append({
                         "id": pid,
@@ -434,6 +451,7 @@ class PluginWorkflowRegistry:
         self._load_plugins()
         self._load_workflows()
         self._validate_workflows()
+        get_command_template.cache_clear()
 
     def __repr__(self) -> str:
         return f"PluginWorkflowRegistry({len(self.plugins)} plugins, {len(self.workflows)} workflows)"
@@ -461,3 +479,16 @@ def get_plugin_workflow_registry(plugins_dir=None, workflows_dir=None) -> Plugin
             excluded_domains = set(EEG_DOMAINS)
         _pw_registry = PluginWorkflowRegistry(plugins_dir, workflows_dir, excluded_domains=excluded_domains)
     return _pw_registry
+
+
+@lru_cache(maxsize=256)
+def get_command_template(plugin_id: str) -> str:
+    """Command template for a plugin (``command_template`` or ``command``).
+
+    Memoised per plugin ID; cleared by ``PluginWorkflowRegistry.reload()``.
+    Returns an empty string for unknown plugins.
+    """
+    plugin = get_plugin_workflow_registry().get_plugin(plugin_id)
+    if not plugin:
+        return ""
+    return plugin.command_template or plugin.command or ""
@@ -0,0 +1,126 @@
+"""
+Live SLURM Queue Mirror
+
+Keeps one long-running ``squeue --iterate`` on the shared SSH connection and
+mirrors its listings in memory, so status polls read queue state without a
+scheduler round trip each. The stream starts on first use and stops itself
+once nobody has asked for a while.
+
+Usage:
+    from backend.core.squeue_watcher import get_squeue_watcher
+
+    states = get_squeue_watcher().states()
+    if states is not None:
+        # {slurm_id: "RUNNING", ...}; queued jobs only -- anything missing
+        # has left the queue and needs sacct
+        ...
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between squeue listings
+SQUEUE_ITERATE_S = 5
+
+# Stop the stream when states() has not been called for this long
+SQUEUE_IDLE_S = 120.0
+
+# After a stream ends without producing a listing (no SLURM, no connection),
+# wait this long before trying again
+SQUEUE_RETRY_S = 60.0
+
+# A listing is published when the next one starts, so the newest can be up
+# to two intervals old
+_MAX_LISTING_AGE_S = 2 * SQUEUE_ITERATE_S + 5
+
+# Column header printed at the top of every listing for -o '%i|%T'
+_HEADER = "JOBID|STATE"
+
+
+class SqueueWatcher:
+    """Mirror of the SSH user's SLURM queue fed by ``squeue --iterate``."""
+
+    def __init__(self, ssh):
+        self._ssh = ssh
+        self._lock = threading.Lock()
+        self._states: Dict[str, str] = {}
+        self._listed_at = 0.0
+        self._used_at = 0.0
+        self._retry_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def states(self) -> Optional[Dict[str, str]]:
+        """Raw SLURM state of every queued job, keyed by SLURM ID.
+
+        Returns None when there is no recent listing (stream starting,
+        unavailable or failing); callers then query SLURM directly. Starts
+        the stream if it is not running.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._used_at = now
+            running = self._thread is not None and self._thread.is_alive()
+            if not running and now >= self._retry_at:
+                self._thread = threading.Thread(
+                    target=self._run, name="squeue-watch", daemon=True,
+                )
+                self._thread.start()
+            if now - self._listed_at > _MAX_LISTING_AGE_S:
+                return None
+            return self._states
+
+    def _run(self) -> None:
+        """Consume ``squeue --iterate`` until it ends or goes unused."""
+        stream_lines = getattr(self._ssh, "stream_lines", None)
+        if stream_lines is None:
+            # e.g. the host SSH broker client, which only runs whole commands
+            with self._lock:
+                self._retry_at = float("inf")
+            return
+
+        published = False
+        listing: Optional[Dict[str, str]] = None
+        lines = stream_lines(
+            f"squeue -u \"$USER\" -i {SQUEUE_ITERATE_S} -o '%i|%T' 2>/dev/null"
+        )
+        try:
+            for line in lines:
+                line = line.strip()
+                if line == _HEADER:
+                    # A new listing starts: the previous one is complete
+                    if listing is not None:
+                        with self._lock:
+                            self._states = listing
+                            self._listed_at = time.monotonic()
+                        published = True
+                    if time.monotonic() - self._used_at > SQUEUE_IDLE_S:
+                        break
+                    listing = {}
+                elif listing is not None:
+                    slurm_id, sep, state = line.partition("|")
+                    if sep:
+                        listing[slurm_id] = state
+        except Exception as e:
+            logger.debug("squeue stream ended: %s", e)
+        finally:
+            lines.close()
+            if not published:
+                with self._lock:
+                    self._retry_at = time.monotonic() + SQUEUE_RETRY_S
+
+
+_watcher: Optional[SqueueWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def get_squeue_watcher() -> SqueueWatcher:
+    """Get the queue mirror bound to the global SSH manager (singleton)."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            from backend.core.ssh_manager import get_ssh_manager
+            _watcher = SqueueWatcher(get_ssh_manager())
+        return _watcher
@@ -26,8 +26,9 @@ import os
 import stat
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import paramiko
 
@@ -39,6 +40,13 @@ DEFAULT_COMMAND_TIMEOUT = 120  # seconds
 DEFAULT_KEEPALIVE_INTERVAL = 30  # seconds
 DEFAULT_IDLE_TIMEOUT = 3600  # 1 hour -- auto-disconnect after idle
 
+# Commands run as concurrent channels on the one authenticated transport.
+# OpenSSH's default MaxSessions is 10; stay below it.
+MAX_CONCURRENT_CHANNELS = 8
+
+# SFTP channels used by put_files() for a multi-file upload
+SFTP_PARALLEL_UPLOADS = 4
+
 
 class SSHConnectionError(Exception):
     """Raised when SSH connection fails."""
@@ -69,6 +77,7 @@ class SSHManager:
         self._client: Optional[paramiko.SSHClient] = None
         self._sftp: Optional[paramiko.SFTPClient] = None
         self._lock = threading.RLock()
+        self._channel_slots = threading.BoundedSemaphore(MAX_CONCURRENT_CHANNELS)
 
         # Connection configuration
         self.host: Optional[str] = None
@@ -361,19 +370,39 @@ class SSHManager:
         if timeout is None:
             timeout = self.command_timeout
 
+        # Only connection bookkeeping needs the lock. The command itself runs
+        # on its own channel of the shared transport, so concurrent callers
+        # (status polls, log tails) multiplex instead of queueing.
         with self._lock:
             self._ensure_connected()
             self._last_activity = time.time()
             self._reset_idle_timer()
+            client = self._client
 
+        with self._channel_slots:
             try:
-                stdin, stdout_ch, stderr_ch = self._client.exec_command(
-                    command, timeout=timeout
-                )
-
-                stdout_text = stdout_ch.read().decode("utf-8", errors="replace")
-                stderr_text = stderr_ch.read().decode("utf-8", errors="replace")
-                exit_code = stdout_ch.channel.recv_exit_status()
+                try:
+                    stdin, stdout_ch, stderr_ch = client.exec_command(
+                        command, timeout=timeout
+                    )
+                except Exception:
+                    # The transport can die between the liveness check and
+                    # opening the channel. The command never started, so
+                    # reconnect and retry once; otherwise it's a real error.
+                    with self._lock:
+                        if self._client is client and self._is_alive():
+                            raise
+                        self._ensure_connected()
+                        client = self._client
+                    stdin, stdout_ch, stderr_ch = client.exec_command(
+                        command, timeout=timeout
+                    )
+                try:
+                    stdout_text = stdout_ch.read().decode("utf-8", errors="replace")
+                    stderr_text = stderr_ch.read().decode("utf-8", errors="replace")
+                    exit_code = stdout_ch.channel.recv_exit_status()
+                finally:
+                    stdout_ch.channel.close()
 
                 logger.debug(
                     f"SSH exec: '{command[:80]}...' -> exit={exit_code}"
@@ -394,6 +423,34 @@ class SSHManager:
             except Exception as e:
                 raise SSHConnectionError(f"Command execution failed: {e}")
 
+    def stream_lines(self, command: str) -> Iterator[str]:
+        """Run a long-lived command and yield its stdout line by line.
+
+        For commands that keep printing (``squeue --iterate``, ``tail -f``).
+        The channel holds one of the MAX_CONCURRENT_CHANNELS slots until the
+        command exits, the connection drops or the generator is closed.
+
+        Raises:
+            SSHConnectionError: If the channel cannot be opened
+        """
+        with self._lock:
+            self._ensure_connected()
+            self._last_activity = time.time()
+            self._reset_idle_timer()
+            client = self._client
+
+        with self._channel_slots:
+            try:
+                channel = client.get_transport().open_session()
+                channel.exec_command(command)
+            except Exception as e:
+                raise SSHConnectionError(f"Could not start '{command[:80]}': {e}")
+            try:
+                for line in channel.makefile("r"):
+                    yield line.rstrip("\n")
+            finally:
+                channel.close()
+
     def execute_check(self, command: str, timeout: Optional[int] = None) -> str:
         """Execute command and return stdout, raising on non-zero exit.
 
@@ -409,6 +466,9 @@ class SSHManager:
     def _get_sftp(self) -> paramiko.SFTPClient:
         """Get or create SFTP channel."""
         self._ensure_connected()
+        if self._sftp is not None and self._sftp.get_channel().closed:
+            # Server closed the SFTP subsystem; the transport is still up
+            self._sftp = None
         if self._sftp is None:
             self._sftp = self._client.open_sftp()
         self._reset_idle_timer()
@@ -432,6 +492,55 @@ class SSHManager:
             sftp.put(local_path, remote_path)
             logger.debug(f"SFTP put: {local_path} -> {remote_path}")
 
+    def put_files(
+        self, transfers: List[Tuple[str, str]], max_workers: int = SFTP_PARALLEL_UPLOADS,
+    ) -> Dict[str, Exception]:
+        """Upload several files concurrently, each worker on its own SFTP channel.
+
+        Args:
+            transfers: ``(local_path, remote_path)`` pairs
+            max_workers: Number of parallel SFTP channels
+
+        Returns:
+            ``{local_path: error}`` for uploads that failed (empty on success)
+        """
+        if not transfers:
+            return {}
+
+        with self._lock:
+            sftp = self._get_sftp()
+            self._last_activity = time.time()
+            for remote_dir in {str(PurePosixPath(r).parent) for _, r in transfers}:
+                self._mkdir_p(sftp, remote_dir)
+            client = self._client
+
+        failures: Dict[str, Exception] = {}
+
+        def _upload(batch: List[Tuple[str, str]]) -> None:
+            with self._channel_slots:
+                channel_sftp = client.open_sftp()
+                try:
+                    for local_path, remote_path in batch:
+                        try:
+                            channel_sftp.put(local_path, remote_path)
+                            logger.debug(f"SFTP put: {local_path} -> {remote_path}")
+                        except Exception as e:
+                            failures[local_path] = e
+                finally:
+                    channel_sftp.close()
+
+        workers = max(1, min(max_workers, len(transfers)))
+        batches = [transfers[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_upload, b) for b in batches]
+            for batch, future in zip(batches, futures):
+                try:
+                    future.result()
+                except Exception as e:  # the channel itself could not be opened
+                    for local_path, _ in batch:
+                        failures.setdefault(local_path, e)
+        return failures
+
     def get_file(self, remote_path: str, local_path: str) -> None:
         """Download a file from the remote host.
 
@@ -23,6 +23,7 @@ Usage:
 import io
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import BinaryIO, List, Optional
 
@@ -40,6 +41,11 @@ MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() == "true"
 BUCKET_INPUTS = os.getenv("MINIO_BUCKET_INPUTS", "neuroinsight-inputs")
 BUCKET_OUTPUTS = os.getenv("MINIO_BUCKET_OUTPUTS", "neuroinsight-outputs")
 
+# Output directories are uploaded with a small thread pool; large files go
+# up as 16 MiB multipart parts.
+UPLOAD_WORKERS = int(os.getenv("MINIO_UPLOAD_WORKERS", "8"))
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+
 
 class StorageService:
     """MinIO-backed object storage for neuroimaging data."""
@@ -108,26 +114,37 @@ class StorageService:
             file_path: Local filesystem path
         """
         key = f"{job_id}/{object_name}"
-        self.client.fput_object(BUCKET_OUTPUTS, key, file_path)
+        self.client.fput_object(BUCKET_OUTPUTS, key, file_path, part_size=UPLOAD_PART_SIZE)
         logger.debug(f"Uploaded output: {key}")
         return f"{BUCKET_OUTPUTS}/{key}"
 
     def upload_output_dir(self, job_id: str, local_dir: str, prefix: str = "") -> int:
         """Recursively upload an entire directory as job outputs.
 
+        Files are uploaded concurrently (MINIO_UPLOAD_WORKERS threads sharing
+        one thread-safe Minio client).
+
         Returns:
             Number of files uploaded
         """
-        count = 0
         base = Path(local_dir)
+        uploads = []
         for filepath in base.rglob("*"):
             if filepath.is_file():
-                rel = filepath.relative_to(base)
-                key = f"{prefix}/{rel}" if prefix else str(rel)
-                self.upload_output(job_id, key, str(filepath))
-                count += 1
-        logger.info(f"Uploaded {count} output files for job {job_id[:8]}")
-        return count
+                rel = filepath.relative_to(base).as_posix()
+                key = f"{prefix}/{rel}" if prefix else rel
+                uploads.append((key, str(filepath)))
+        if not uploads:
+            logger.info(f"Uploaded 0 output files for job {job_id[:8]}")
+            return 0
+
+        # Create the client (and buckets) once before fanning out to threads
+        _ = self.client
+        with ThreadPoolExecutor(max_workers=max(1, min(UPLOAD_WORKERS, len(uploads)))) as pool:
+            list(pool.map(lambda item: self.upload_output(job_id, *item), uploads))
+
+        logger.info(f"Uploaded {len(uploads)} output files for job {job_id[:8]}")
+        return len(uploads)
 
     def download_output(self, job_id: str, object_name: str, dest_path: str) -> str:
         """Download a job output file."""
@@ -0,0 +1,72 @@
+"""
+Command template rendering for plugin jobs.
+
+Shared by the Celery tasks and every execution backend: parameter values are
+rendered for the shell, stripped of metacharacters, and substituted into the
+plugin's ``{key}`` placeholders.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict
+
+# Shell metacharacters stripped from parameter values (str.translate table)
+DANGEROUS_TRANS = str.maketrans("", "", ";|&`$(){}!><\n\r")
+
+# ``{key}`` placeholders in plugin command templates.  Values are sanitised
+# (no braces survive), so a single left-to-right pass is equivalent to the
+# old per-key ``str.replace`` loop -- including ``${key}`` -> ``$value``.
+TEMPLATE_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+def shell_value(value) -> str:
+    """Render a parameter value for a shell command template.
+
+    Python bools must become lowercase ``true``/``false`` — command templates
+    compare with ``[ "{flag}" = "true" ]``, and ``str(True)`` is ``"True"``
+    (capital T), which silently fails the test and drops the flag (e.g.
+    dcm2niix ``compress=true`` would fall through to ``-z n``).
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def params_for_shell_template(resolved: dict) -> dict:
+    """Keys like _workflow_steps must not be substituted into shell command templates."""
+    return {k: v for k, v in resolved.items() if not str(k).startswith("_")}
+
+
+def sanitize_param(value: str) -> str:
+    """Sanitize a parameter value for safe inclusion in shell commands.
+
+    Removes shell metacharacters that could enable command injection.
+    Only allows alphanumeric, path-safe, and common flag characters.
+    """
+    return value.translate(DANGEROUS_TRANS)
+
+
+def shell_params(resolved: dict) -> Dict[str, str]:
+    """Sanitised placeholder values for ``resolved``, keyed by parameter name.
+
+    Build once per job when several templates (workflow steps) share the
+    same parameters, and render each with :func:`fill_template`.
+    """
+    return {
+        str(k): sanitize_param(shell_value(v))
+        for k, v in params_for_shell_template(resolved).items()
+    }
+
+
+def fill_template(template: str, values: Dict[str, str]) -> str:
+    """Substitute precomputed :func:`shell_params` values into a template."""
+    return TEMPLATE_PLACEHOLDER.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
+def render_command(template: str, resolved: dict) -> str:
+    """Substitute resolved parameters into a command template in one pass.
+
+    Unknown placeholders (e.g. shell ``${VAR}`` references) are left as-is.
+    """
+    return fill_template(template, shell_params(resolved))
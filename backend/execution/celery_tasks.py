@@ -14,13 +14,14 @@ import os
 import re
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional
 
 from celery import shared_task
 
 from backend.core.celery_app import celery_app  # noqa: F401 — ensure app is loaded before shared_task binds
+from backend.core.templating import render_command
 
 # ---------------------------------------------------------------------------
 # Periodic: stale-job reaper
@@ -39,22 +40,22 @@ class WorkflowJobFatal(Exception):
     """Non-retryable workflow validation/setup error (maps to Celery Reject)."""
 
 
-def _shell_value(value):
-    """Render a parameter value for a shell command template.
+# Standard job output tree. Parents come before children so each entry is a
+# single mkdir(); "_inputs" is created last and doubles as the completion marker.
+JOB_OUTPUT_SUBDIRS = ("native", "bundle", "bundle/volumes", "bundle/metrics", "bundle/qc", "logs", "_inputs")
 
-    Python bools must become lowercase ``true``/``false`` — command templates
-    compare with ``[ "{flag}" = "true" ]``, and ``str(True)`` is ``"True"``
-    (capital T), which silently fails the test and drops the flag (e.g.
-    dcm2niix ``compress=true`` would fall through to ``-z n``).
-    """
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    return str(value)
 
+def _ensure_output_layout(output_dir: Path) -> None:
+    """Create the job output directory tree, skipping it if already present.
 
-def _params_for_shell_template(resolved: dict) -> dict:
-    """Keys like _workflow_steps must not be substituted into shell command templates."""
-    return {k: v for k, v in resolved.items() if not str(k).startswith("_")}
+    Retries and local fallbacks call this for a directory that usually exists;
+    one stat on the last subdir short-circuits the seven mkdir() syscalls.
+    """
+    if (output_dir / JOB_OUTPUT_SUBDIRS[-1]).is_dir():
+        return
+    os.makedirs(output_dir, exist_ok=True)
+    for sub in JOB_OUTPUT_SUBDIRS:
+        os.makedirs(output_dir / sub, exist_ok=True)
 
 
 ALLOWED_IMAGE_PREFIXES = (
@@ -76,18 +77,6 @@ ALLOWED_IMAGE_PREFIXES = (
 )
 
 
-def _sanitize_param(value: str) -> str:
-    """Sanitize a parameter value for safe inclusion in shell commands.
-
-    Removes shell metacharacters that could enable command injection.
-    Only allows alphanumeric, path-safe, and common flag characters.
-    """
-    # Block the most dangerous shell metacharacters
-    dangerous = set(";|&`$(){}!><\n\r")
-    sanitized = "".join(c for c in value if c not in dangerous)
-    return sanitized
-
-
 def _validate_image(image: str) -> bool:
     """Check if a Docker image is in the allow list.
 
@@ -98,58 +87,71 @@ def _validate_image(image: str) -> bool:
     return any(image_base.startswith(prefix) for prefix in ALLOWED_IMAGE_PREFIXES)
 
 
+def _db_timestamp(value: datetime) -> datetime:
+    """Normalise a timestamp for the naive-UTC ``DateTime`` columns on ``Job``."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+_SYNC_FIELDS = (
+    "started_at", "completed_at", "exit_code", "error_message",
+    "backend_job_id", "progress", "current_phase",
+)
+
+
 def _sync_job_to_db(job_id: str, status: str, **kwargs) -> None:
-    """Update job row in PostgreSQL.
+    """Update job row in PostgreSQL with a single UPDATE statement.
 
     kwargs may include: started_at, completed_at, exit_code, error_message,
-    backend_job_id, progress (int), current_phase (str).
+    backend_job_id, progress (int), current_phase (str). Timestamps may be
+    tz-aware; they are stored as naive UTC.
     """
     try:
+        from sqlalchemy import update
         from backend.core.database import get_db_context
-        from backend.models.job import Job, JobStatusEnum
+        from backend.models.job import Job
+
+        values = {"status": status}
+        for field in _SYNC_FIELDS:
+            if field in kwargs:
+                values[field] = kwargs[field]
+        for field in ("started_at", "completed_at"):
+            if values.get(field) is not None:
+                values[field] = _db_timestamp(values[field])
 
         with get_db_context() as db:
-            job = db.query(Job).filter_by(id=job_id).first()
-            if not job:
+            result = db.execute(update(Job).where(Job.id == job_id).values(**values))
+            if result.rowcount == 0:
                 logger.error(f"Job {job_id} not found in database")
                 return
-
-            job.status = status
-
-            if "started_at" in kwargs:
-                job.started_at = kwargs["started_at"]
-            if "completed_at" in kwargs:
-                job.completed_at = kwargs["completed_at"]
-            if "exit_code" in kwargs:
-                job.exit_code = kwargs["exit_code"]
-            if "error_message" in kwargs:
-                job.error_message = kwargs["error_message"]
-            if "backend_job_id" in kwargs:
-                job.backend_job_id = kwargs["backend_job_id"]
-            if "progress" in kwargs:
-                job.progress = kwargs["progress"]
-            if "current_phase" in kwargs:
-                job.current_phase = kwargs["current_phase"]
-
             db.commit()
             logger.debug(f"Synced job {job_id[:8]} status={status}")
     except Exception as e:
         logger.error(f"Failed to sync job {job_id[:8]} to DB: {e}")
 
 
+def _report_running(task, **meta) -> None:
+    """Publish RUNNING task state, tagged with the executing worker's hostname.
+
+    cancel_job reads the hostname back to revoke on that worker only.
+    """
+    task.update_state(state="RUNNING", meta={**meta, "hostname": task.request.hostname})
+
+
 def _update_progress(job_id: str, progress: int, phase_label: str = "") -> None:
     """Lightweight DB update for progress tracking only (no status change)."""
     try:
+        from sqlalchemy import update
         from backend.core.database import get_db_context
         from backend.models.job import Job
 
+        values = {"progress": progress}
+        if phase_label:
+            values["current_phase"] = phase_label
         with get_db_context() as db:
-            job = db.query(Job).filter_by(id=job_id).first()
-            if job:
-                job.progress = progress
-                if phase_label:
-                    job.current_phase = phase_label
-                db.commit()
+            db.execute(update(Job).where(Job.id == job_id).values(**values))
+            db.commit()
     except Exception as e:
         logger.error(f"Failed to update progress for job {job_id[:8]}: {e}")
 
@@ -441,8 +443,7 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
     output_dir = data_dir / "outputs" / job_id
 
     # Create output directory structure
-    for sub in ("native", "bundle/volumes", "bundle/metrics", "bundle/qc", "logs", "_inputs"):
-        (output_dir / sub).mkdir(parents=True, exist_ok=True)
+    _ensure_output_layout(output_dir)
 
     # Save job spec for audit trail
     spec_file = output_dir / "job_spec.json"
@@ -462,7 +463,7 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
         "has_command_template": spec_dict.get("command_template") is not None,
     }, indent=2))
 
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
 
     # Load phase milestones for progress tracking
     from backend.core.phase_milestones import get_milestones
@@ -474,7 +475,7 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
 
     # Mark job as running
     _sync_job_to_db(job_id, "running", started_at=now, progress=1, current_phase="Queued")
-    self.update_state(state="RUNNING", meta={"started_at": now.isoformat(), "progress": 1})
+    _report_running(self, started_at=now.isoformat(), progress=1)
 
     # ---- Non-retryable validation (raise Reject to skip retries) ----
     from celery.exceptions import Reject
@@ -534,11 +535,7 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
 
         if command_template:
             # Substitute parameters into command template with shell-safe escaping
-            command = command_template
-            for key, value in _params_for_shell_template(resolved_params).items():
-                safe_value = _sanitize_param(_shell_value(value))
-                command = command.replace(f"{{{key}}}", safe_value)
-                command = command.replace(f"${{{key}}}", safe_value)
+            command = render_command(command_template, resolved_params)
         elif spec_dict.get("execution_mode") == "plugin":
             # Plugin jobs require a command template -- fail fast
             plugin_id = spec_dict.get("plugin_id", "unknown")
@@ -647,20 +644,14 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
                         if re.search(marker, log_buffer):
                             current_progress = pct
                             _update_progress(job_id, pct, label)
-                            self.update_state(
-                                state="RUNNING",
-                                meta={"progress": pct, "current_phase": label},
-                            )
+                            _report_running(self, progress=pct, current_phase=label)
                             break  # Only advance one milestone at a time
                     except re.error:
                         # Treat as substring match if regex fails
                         if marker in log_buffer:
                             current_progress = pct
                             _update_progress(job_id, pct, label)
-                            self.update_state(
-                                state="RUNNING",
-                                meta={"progress": pct, "current_phase": label},
-                            )
+                            _report_running(self, progress=pct, current_phase=label)
                             break
 
         # Wait for container to finish
@@ -684,10 +675,11 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
             logger.warning(f"Failed to capture final logs: {e}")
 
         if exit_code == 0:
-            logger.info(f"Job {job_id[:8]} completed successfully")
+            now = datetime.now(timezone.utc)
+            logger.info(f"Job {job_id[:8]} completed successfully at {now.isoformat()}")
             _sync_job_to_db(
                 job_id, "completed",
-                completed_at=datetime.utcnow(),
+                completed_at=now,
                 exit_code=0,
                 progress=100,
                 current_phase="Completed",
@@ -711,17 +703,24 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
             except Exception as e:
                 logger.warning(f"Stats CSV generation failed for {job_id[:8]}: {e}")
 
-            return {"status": "completed", "exit_code": 0, "output_dir": str(output_dir)}
+            return {
+                "status": "completed", "exit_code": 0, "output_dir": str(output_dir),
+                "completed_at": now.isoformat(),
+            }
         else:
+            now = datetime.now(timezone.utc)
             error_message = f"Container exited with code {exit_code}"
-            logger.error(f"Job {job_id[:8]} failed: {error_message}")
+            logger.error(f"Job {job_id[:8]} failed at {now.isoformat()}: {error_message}")
             _sync_job_to_db(
                 job_id, "failed",
-                completed_at=datetime.utcnow(),
+                completed_at=now,
                 exit_code=exit_code,
                 error_message=error_message,
             )
-            return {"status": "failed", "exit_code": exit_code, "output_dir": str(output_dir)}
+            return {
+                "status": "failed", "exit_code": exit_code, "output_dir": str(output_dir),
+                "completed_at": now.isoformat(),
+            }
 
     except Reject:
         # Explicit non-retryable failures (validation, bad spec).
@@ -737,7 +736,7 @@ def run_docker_job(self, job_id: str, spec_dict: dict) -> dict:
             # Final attempt failed -- mark as permanently failed
             _sync_job_to_db(
                 job_id, "failed",
-                completed_at=datetime.utcnow(),
+                completed_at=datetime.now(timezone.utc),
                 exit_code=-1,
                 error_message=f"Failed after {retry_num + 1} attempts: {error_message}",
             )
@@ -926,8 +925,7 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
     data_dir = Path(spec_dict.get("data_dir", "./data")).resolve()
     output_dir = data_dir / "outputs" / job_id
 
-    for sub in ("native", "bundle/volumes", "bundle/metrics", "bundle/qc", "logs", "_inputs"):
-        (output_dir / sub).mkdir(parents=True, exist_ok=True)
+    _ensure_output_layout(output_dir)
 
     # Save job spec
     spec_file = output_dir / "job_spec.json"
@@ -942,10 +940,10 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
         "execution_mode": "workflow",
     }, indent=2))
 
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     _sync_job_to_db(job_id, "running", started_at=now, progress=1, current_phase="Preparing workflow")
     if celery_task:
-        celery_task.update_state(state="RUNNING", meta={"started_at": now.isoformat(), "progress": 1})
+        _report_running(celery_task, started_at=now.isoformat(), progress=1)
 
     # Get workflow steps (plugin IDs)
     workflow_steps = spec_dict.get("parameters", {}).get("_workflow_steps", [])
@@ -987,7 +985,7 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
     def update_fn(progress: int, phase: str):
         _update_progress(job_id, progress, phase)
         if celery_task:
-            celery_task.update_state(state="RUNNING", meta={"progress": progress, "current_phase": phase})
+            _report_running(celery_task, progress=progress, current_phase=phase)
 
     # Keep original user-supplied inputs so later steps can access files
     # that aren't produced by earlier steps (e.g. T2w scan for step 2).
@@ -1036,11 +1034,7 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
         # Build command
         command = None
         if cmd_template:
-            command = cmd_template
-            for key, value in _params_for_shell_template(resolved_params).items():
-                safe_value = _sanitize_param(_shell_value(value))
-                command = command.replace(f"{{{key}}}", safe_value)
-                command = command.replace(f"${{{key}}}", safe_value)
+            command = render_command(cmd_template, resolved_params)
             wf_id = spec_dict.get("parameters", {}).get("_workflow_id") or spec_dict.get("workflow_id")
             command = apply_workflow_nir_input_root_command_overrides(
                 workflow_steps=workflow_steps,
@@ -1074,23 +1068,31 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
                 update_fn=update_fn,
             )
         except Exception as e:
+            now = datetime.now(timezone.utc)
             msg = f"Step {step_idx + 1} ({step_plugin_id}) failed: {e}"
-            logger.error(f"Workflow {job_id[:8]}: {msg}")
-            _sync_job_to_db(job_id, "failed", completed_at=datetime.utcnow(), error_message=msg, exit_code=-1)
-            return {"status": "failed", "exit_code": -1, "error": msg, "output_dir": str(output_dir)}
+            logger.error(f"Workflow {job_id[:8]} at {now.isoformat()}: {msg}")
+            _sync_job_to_db(job_id, "failed", completed_at=now, error_message=msg, exit_code=-1)
+            return {
+                "status": "failed", "exit_code": -1, "error": msg, "output_dir": str(output_dir),
+                "completed_at": now.isoformat(),
+            }
 
         all_exit_codes.append(exit_code)
 
         if exit_code != 0:
+            now = datetime.now(timezone.utc)
             msg = f"Step {step_idx + 1} ({step_plugin_id}) exited with code {exit_code}"
-            logger.error(f"Workflow {job_id[:8]}: {msg}")
+            logger.error(f"Workflow {job_id[:8]} at {now.isoformat()}: {msg}")
             _sync_job_to_db(
                 job_id, "failed",
-                completed_at=datetime.utcnow(),
+                completed_at=now,
                 exit_code=exit_code,
                 error_message=msg,
             )
-            return {"status": "failed", "exit_code": exit_code, "error": msg, "output_dir": str(output_dir)}
+            return {
+                "status": "failed", "exit_code": exit_code, "error": msg, "output_dir": str(output_dir),
+                "completed_at": now.isoformat(),
+            }
 
         # Build inputs for the next step: step outputs first (highest
         # priority for name-matching), then original user files so that
@@ -1102,10 +1104,11 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
         logger.info(f"Workflow {job_id[:8]} step {step_idx + 1} completed. Next inputs: {current_input_files}")
 
     # All steps completed successfully
-    logger.info(f"Workflow {job_id[:8]} completed all {total_steps} steps successfully")
+    now = datetime.now(timezone.utc)
+    logger.info(f"Workflow {job_id[:8]} completed all {total_steps} steps successfully at {now.isoformat()}")
     _sync_job_to_db(
         job_id, "completed",
-        completed_at=datetime.utcnow(),
+        completed_at=now,
         exit_code=0,
         progress=100,
         current_phase="Completed",
@@ -1132,7 +1135,10 @@ def execute_workflow_job_impl(celery_task, job_id: str, spec_dict: dict) -> dict
     except Exception as e:
         logger.warning(f"Stats CSV generation failed for workflow {job_id[:8]}: {e}")
 
-    return {"status": "completed", "exit_code": 0, "output_dir": str(output_dir)}
+    return {
+        "status": "completed", "exit_code": 0, "output_dir": str(output_dir),
+        "completed_at": now.isoformat(),
+    }
 
 
 @shared_task(
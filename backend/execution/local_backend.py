@@ -14,6 +14,7 @@ Thread Safety:
     - Job tracking dict is protected by a threading lock
     - Each job runs in its own Celery task or thread
 """
+import codecs
 import json
 import logging
 import os
@@ -21,10 +22,42 @@ import shutil
 import threading
 import time
 import uuid
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
-
+from typing import Dict, List, Optional, Tuple
+
+from celery import group
+from celery.result import AsyncResult
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
+
+try:
+    import docker
+    from docker.errors import ImageNotFound
+except ImportError:  # Docker SDK is only needed by this backend
+    docker = None
+    ImageNotFound = None
+
+from backend.core.celery_app import celery_app, job_queue
+from backend.core.database import get_db_context
+from backend.core.phase_milestones import get_milestones
+from backend.core.plugin_registry import get_plugin_workflow_registry
+from backend.core.templating import render_command
+from backend.execution.celery_tasks import (
+    WorkflowJobFatal,
+    _ensure_output_layout,
+    _extract_bundle,
+    _prepare_volumes,
+    _resolve_parameters,
+    _sync_job_to_db,
+    _upload_outputs_to_minio,
+    execute_workflow_job_impl,
+    run_docker_job,
+    run_workflow_job,
+)
+from backend.models.job import Job
 from backend.core.execution import (
     ExecutionBackend,
     ExecutionError,
@@ -35,10 +68,47 @@ from backend.core.execution import (
     JobInfo,
     JobLogs,
     ResourceSpec,
+    now_ns,
+    ns_to_datetime,
 )
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to the Docker socket.  Each running job holds one
+# for its follow-mode log stream, so leave headroom for API calls.
+DOCKER_MAX_POOL_SIZE = 32
+
+# Whole-file log reads are cached by (mtime_ns, size) so an unchanged log is
+# not re-read on every poll.  Only small files are kept.
+LOG_CACHE_MAX_ENTRIES = 64
+LOG_CACHE_MAX_BYTES = 1024 * 1024
+
+# health_check() results are reused for this long (liveness probes hit it
+# every few seconds).
+HEALTH_CACHE_TTL_S = 2.0
+
+# How long to wait for the ``die`` event after a container's log stream
+# ends before falling back to a blocking ``container.wait()``.
+EXIT_EVENT_TIMEOUT_S = 10
+
+
+def _read_from_offset(path: Path, offset: int) -> Tuple[str, int]:
+    """Read a grow-only log file from ``offset``; returns ``(text, next_offset)``.
+
+    A multi-byte UTF-8 character cut off at the current end of file is left
+    for the next read instead of being decoded as U+FFFD. If the file shrank
+    (rotated or rewritten), reading restarts from the beginning.
+    """
+    with open(path, "rb") as f:
+        if offset > os.fstat(f.fileno()).st_size:
+            offset = 0
+        f.seek(offset)
+        data = f.read()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    text = decoder.decode(data, final=False)
+    pending = len(decoder.getstate()[0])
+    return text, offset + len(data) - pending
+
 
 class LocalDockerBackend(ExecutionBackend):
     """Docker-based local execution backend.
@@ -60,10 +130,29 @@ class LocalDockerBackend(ExecutionBackend):
         self._lock = threading.Lock()
         self._docker_client = None
 
+        # In-thread (no Celery) runners: at most max_concurrent_jobs run at
+        # once, and a single `docker events` consumer reports exit codes.
+        self._job_slots = threading.BoundedSemaphore(max(1, max_concurrent_jobs))
+        self._exit_futures: Dict[str, Future] = {}  # job_id -> exit code
+        self._events_thread: Optional[threading.Thread] = None
+        self._log_cache: "OrderedDict[str, tuple]" = OrderedDict()  # path -> (stamp, (text, offset))
+        self._health_cache: Tuple[float, Optional[dict]] = (0.0, None)  # (monotonic ts, result)
+
+        # cleanup_job renames output dirs into .trash; a daemon thread deletes them
+        self._trash_dir = self.data_dir / ".trash"
+        self._trash_pending = False
+        self._trash_thread: Optional[threading.Thread] = None
+
         # Ensure directories exist
         (self.data_dir / "outputs").mkdir(parents=True, exist_ok=True)
         (self.data_dir / "uploads").mkdir(parents=True, exist_ok=True)
 
+        # Finish deleting anything a previous process left behind
+        if self._trash_dir.is_dir():
+            with os.scandir(self._trash_dir) as it:
+                if any(it):
+                    self._schedule_trash_sweep()
+
         logger.info(
             f"LocalDockerBackend initialized: data_dir={self.data_dir}, "
             f"max_concurrent={self.max_concurrent_jobs}"
@@ -71,38 +160,114 @@ class LocalDockerBackend(ExecutionBackend):
 
     @property
     def docker_client(self):
-        """Lazy-initialize Docker client."""
+        """Lazy-initialize a shared Docker client.
+
+        The client keeps a connection pool to the Docker socket and is
+        reused by every method (and job thread) instead of calling
+        ``docker.from_env()`` per operation.
+        """
         if self._docker_client is None:
+            if docker is None:
+                raise BackendUnavailableError("Docker is not available: docker SDK is not installed")
             try:
-                import docker
-                self._docker_client = docker.from_env()
-                self._docker_client.ping()
+                client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
+                client.ping()
             except Exception as e:
                 raise BackendUnavailableError(f"Docker is not available: {e}")
+            with self._lock:
+                if self._docker_client is None:
+                    self._docker_client = client
         return self._docker_client
 
     @property
     def backend_type(self) -> str:
         return "local"
 
-    def submit_job(self, spec: JobSpec, job_id: Optional[str] = None) -> str:
-        """Submit a job for execution via Celery or in-thread fallback.
+    def _update_job(self, job_id: str, **fields) -> None:
+        """Apply tracking-field updates in one lock hold (no-op once cleaned up)."""
+        with self._lock:
+            info = self._jobs.get(job_id)
+            if info is not None:
+                info.update(fields)
 
-        Args:
-            spec: Job specification
-            job_id: Optional pre-generated job ID
+    def _schedule_trash_sweep(self) -> None:
+        """Ask the trash janitor to run, starting it if it is idle."""
+        with self._lock:
+            self._trash_pending = True
+            if self._trash_thread is None:
+                self._trash_thread = threading.Thread(
+                    target=self._sweep_trash, name="trash-janitor", daemon=True,
+                )
+                self._trash_thread.start()
 
-        Returns:
-            Job ID string
-        """
-        if job_id is None:
-            job_id = str(uuid.uuid4())
+    def _sweep_trash(self) -> None:
+        """Delete everything under data_dir/.trash until no more sweeps are requested."""
+        while True:
+            with self._lock:
+                if not self._trash_pending:
+                    self._trash_thread = None
+                    return
+                self._trash_pending = False
+            try:
+                with os.scandir(self._trash_dir) as it:
+                    entries = list(it)
+            except FileNotFoundError:
+                entries = []
+            for entry in entries:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            if entries:
+                logger.info(f"Deleted {len(entries)} trashed job output dir(s)")
+
+    def _start_job_thread(self, target, name: str) -> None:
+        """Run an in-thread job on a daemon thread once a concurrency slot is free."""
+
+        def _gated():
+            with self._job_slots:
+                target()
+
+        threading.Thread(target=_gated, name=name, daemon=True).start()
+
+    def _ensure_events_watcher(self) -> None:
+        """Start the shared ``docker events`` consumer on first use."""
+        with self._lock:
+            if self._events_thread is not None and self._events_thread.is_alive():
+                return
+            self._events_thread = threading.Thread(
+                target=self._watch_container_events, name="docker-events", daemon=True,
+            )
+            self._events_thread.start()
 
-        # Create output directory
-        output_dir = self.data_dir / "outputs" / job_id
-        output_dir.mkdir(parents=True, exist_ok=True)
+    def _watch_container_events(self) -> None:
+        """Resolve pending exit-code futures from container ``die`` events."""
+        while True:
+            try:
+                events = self.docker_client.events(
+                    decode=True,
+                    filters={"type": "container", "event": "die", "label": "managed-by=neuroinsight"},
+                )
+                for event in events:
+                    attrs = event.get("Actor", {}).get("Attributes", {})
+                    with self._lock:
+                        future = self._exit_futures.pop(attrs.get("neuroinsight.job_id"), None)
+                    if future is not None and not future.done():
+                        future.set_result(int(attrs.get("exitCode", -1)))
+            except Exception as e:
+                logger.warning("Docker events stream interrupted, reconnecting: %s", e)
+                time.sleep(5)
 
-        # Build spec dict for serialization
+    def _wait_for_exit(self, job_id: str, future: Future, container) -> int:
+        """Exit code from the events watcher, falling back to ``container.wait()``."""
+        try:
+            return future.result(timeout=EXIT_EVENT_TIMEOUT_S)
+        except FutureTimeoutError:
+            logger.debug("No die event for job %s, falling back to container.wait()", job_id[:8])
+            return container.wait(timeout=5).get("StatusCode", -1)
+        finally:
+            with self._lock:
+                self._exit_futures.pop(job_id, None)
+
+    def _build_spec_dict(self, spec: JobSpec, output_dir: Path) -> dict:
+        """Serialise a JobSpec into the JSON-safe dict handed to Celery."""
         spec_dict = {
             "pipeline_name": spec.pipeline_name,
             "container_image": spec.container_image,
@@ -124,7 +289,6 @@ class LocalDockerBackend(ExecutionBackend):
 
         # Get command template from plugin (extracted from execution.stages[0].command_template)
         try:
-            from backend.core.plugin_registry import get_plugin_workflow_registry
             registry = get_plugin_workflow_registry()
             plugin = registry.get_plugin(spec.plugin_id) if spec.plugin_id else None
             if plugin:
@@ -135,29 +299,59 @@ class LocalDockerBackend(ExecutionBackend):
         except Exception as e:
             logger.debug("Could not load command_template for %s: %s", spec.plugin_id, e)
 
+        return spec_dict
+
+    @staticmethod
+    def _new_tracking_entry(job_id: str, spec_dict: dict) -> dict:
+        """Initial in-memory tracking record for a freshly submitted job."""
+        return {
+            "job_id": job_id,
+            "status": JobStatus.PENDING,
+            "spec": spec_dict,
+            "output_dir": spec_dict["output_dir"],
+            "submitted_at": now_ns(),
+            "started_at": None,
+            "completed_at": None,
+            "container_id": None,
+            "celery_task_id": None,
+            "exit_code": None,
+            "error_message": None,
+            "progress": 0,
+            "current_phase": "Queued",
+        }
+
+    def _run_fallback_in_thread(self, job_id: str, spec_dict: dict) -> None:
+        """Run a job without Celery, picking the workflow or single-plugin runner."""
+        if spec_dict.get("execution_mode") == "workflow":
+            self._run_workflow_in_thread(job_id, spec_dict)
+        else:
+            self._run_in_thread(job_id, spec_dict)
+
+    def submit_job(self, spec: JobSpec, job_id: Optional[str] = None) -> str:
+        """Submit a job for execution via Celery or in-thread fallback.
+
+        Args:
+            spec: Job specification
+            job_id: Optional pre-generated job ID
+
+        Returns:
+            Job ID string
+        """
+        if job_id is None:
+            job_id = str(uuid.uuid4())
+
+        # Create output directory
+        output_dir = self.data_dir / "outputs" / job_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        spec_dict = self._build_spec_dict(spec, output_dir)
+
         # Track job locally
         with self._lock:
-            self._jobs[job_id] = {
-                "job_id": job_id,
-                "status": JobStatus.PENDING,
-                "spec": spec_dict,
-                "output_dir": str(output_dir),
-                "submitted_at": datetime.utcnow(),
-                "started_at": None,
-                "completed_at": None,
-                "container_id": None,
-                "celery_task_id": None,
-                "exit_code": None,
-                "error_message": None,
-                "progress": 0,
-                "current_phase": "Queued",
-            }
+            self._jobs[job_id] = self._new_tracking_entry(job_id, spec_dict)
 
         # Create DB record
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             job_model = Job.from_spec(job_id, "local_docker", spec)
             with get_db_context() as db:
                 db.add(job_model)
@@ -169,97 +363,142 @@ class LocalDockerBackend(ExecutionBackend):
         # Dispatch to Celery -- pick the right task for single-plugin vs workflow
         try:
             is_workflow = spec_dict.get("execution_mode") == "workflow"
+            queue = job_queue(job_id, spec.plugin_id, spec.execution_mode)
             if is_workflow:
-                from backend.execution.celery_tasks import run_workflow_job
-                result = run_workflow_job.delay(job_id, spec_dict)
+                result = run_workflow_job.apply_async(args=[job_id, spec_dict], queue=queue)
             else:
-                from backend.execution.celery_tasks import run_docker_job
-                result = run_docker_job.delay(job_id, spec_dict)
-            with self._lock:
-                self._jobs[job_id]["celery_task_id"] = result.id
+                result = run_docker_job.apply_async(args=[job_id, spec_dict], queue=queue)
+            self._update_job(job_id, celery_task_id=result.id)
             task_name = "run_workflow_job" if is_workflow else "run_docker_job"
-            logger.info(f"Dispatched job {job_id[:8]} to Celery ({task_name}, task_id={result.id})")
+            logger.info(
+                f"Dispatched job {job_id[:8]} to Celery ({task_name}, queue={queue}, task_id={result.id})"
+            )
         except Exception as e:
             logger.warning(f"Celery dispatch failed for job {job_id[:8]}: {e}. Running in-thread.")
-            if spec_dict.get("execution_mode") == "workflow":
-                self._run_workflow_in_thread(job_id, spec_dict)
-            else:
-                self._run_in_thread(job_id, spec_dict)
+            self._run_fallback_in_thread(job_id, spec_dict)
 
         return job_id
 
+    def submit_jobs(self, specs: List[JobSpec], job_ids: Optional[List[str]] = None) -> List[str]:
+        """Submit a burst of jobs with one DB transaction and one Celery group.
+
+        The broker sees a single pipelined publish for the whole batch
+        instead of one round-trip per job.
+
+        Args:
+            specs: Job specifications
+            job_ids: Optional pre-generated job IDs, parallel to ``specs``
+
+        Returns:
+            Job IDs in the same order as ``specs``
+        """
+        if not specs:
+            return []
+
+        if job_ids is None:
+            job_ids = [str(uuid.uuid4()) for _ in specs]
+        spec_dicts = []
+        for job_id, spec in zip(job_ids, specs):
+            output_dir = self.data_dir / "outputs" / job_id
+            output_dir.mkdir(parents=True, exist_ok=True)
+            spec_dicts.append(self._build_spec_dict(spec, output_dir))
+
+        with self._lock:
+            for job_id, spec_dict in zip(job_ids, spec_dicts):
+                self._jobs[job_id] = self._new_tracking_entry(job_id, spec_dict)
+
+        # Create all DB records in one transaction
+        try:
+            with get_db_context() as db:
+                db.add_all([
+                    Job.from_spec(job_id, "local_docker", spec)
+                    for job_id, spec in zip(job_ids, specs)
+                ])
+                db.commit()
+                logger.info(f"Created {len(job_ids)} DB records in one batch")
+        except Exception as e:
+            logger.error(f"Failed to create DB records for batch of {len(job_ids)} jobs: {e}")
+
+        # Dispatch the whole batch as one Celery group over a single producer
+        try:
+            signatures = [
+                (run_workflow_job if spec.execution_mode == "workflow" else run_docker_job).s(
+                    job_id, spec_dict
+                ).set(queue=job_queue(job_id, spec.plugin_id, spec.execution_mode))
+                for job_id, spec, spec_dict in zip(job_ids, specs, spec_dicts)
+            ]
+            with celery_app.producer_pool.acquire(block=True) as producer:
+                group_result = group(signatures).apply_async(producer=producer)
+            with self._lock:
+                for job_id, result in zip(job_ids, group_result.results):
+                    self._jobs[job_id]["celery_task_id"] = result.id
+            logger.info(f"Dispatched {len(job_ids)} jobs to Celery as one group (group_id={group_result.id})")
+        except Exception as e:
+            logger.warning(f"Celery group dispatch failed for {len(job_ids)} jobs: {e}. Running in-thread.")
+            for job_id, spec_dict in zip(job_ids, spec_dicts):
+                self._run_fallback_in_thread(job_id, spec_dict)
+
+        return job_ids
+
     def _run_workflow_in_thread(self, job_id: str, spec_dict: dict) -> None:
         """Fallback: run full multi-step workflow without Celery."""
 
         def _execute():
             try:
-                from backend.execution.celery_tasks import (
-                    WorkflowJobFatal,
-                    execute_workflow_job_impl,
-                )
-
                 result = execute_workflow_job_impl(None, job_id, spec_dict)
-                with self._lock:
-                    if result.get("status") == "completed":
-                        self._jobs[job_id]["status"] = JobStatus.COMPLETED
-                        self._jobs[job_id]["exit_code"] = 0
-                    else:
-                        self._jobs[job_id]["status"] = JobStatus.FAILED
-                        self._jobs[job_id]["exit_code"] = result.get("exit_code", -1)
-                        self._jobs[job_id]["error_message"] = result.get("error", "")
-                    self._jobs[job_id]["completed_at"] = datetime.utcnow()
+                if result.get("status") == "completed":
+                    self._update_job(
+                        job_id, status=JobStatus.COMPLETED, exit_code=0,
+                        completed_at=now_ns(),
+                    )
+                else:
+                    self._update_job(
+                        job_id, status=JobStatus.FAILED,
+                        exit_code=result.get("exit_code", -1),
+                        error_message=result.get("error", ""),
+                        completed_at=now_ns(),
+                    )
             except WorkflowJobFatal as ex:
                 logger.error(f"In-thread workflow rejected for job {job_id[:8]}: {ex}")
-                with self._lock:
-                    self._jobs[job_id]["status"] = JobStatus.FAILED
-                    self._jobs[job_id]["error_message"] = str(ex)
-                    self._jobs[job_id]["completed_at"] = datetime.utcnow()
+                self._update_job(
+                    job_id, status=JobStatus.FAILED, error_message=str(ex),
+                    completed_at=now_ns(),
+                )
             except Exception as ex:
                 logger.error(f"In-thread workflow failed for job {job_id[:8]}: {ex}")
-                with self._lock:
-                    self._jobs[job_id]["status"] = JobStatus.FAILED
-                    self._jobs[job_id]["error_message"] = str(ex)
-                    self._jobs[job_id]["completed_at"] = datetime.utcnow()
+                self._update_job(
+                    job_id, status=JobStatus.FAILED, error_message=str(ex),
+                    completed_at=now_ns(),
+                )
 
-        thread = threading.Thread(target=_execute, name=f"wf-{job_id[:8]}", daemon=True)
-        thread.start()
+        self._start_job_thread(_execute, name=f"wf-{job_id[:8]}")
 
     def _run_in_thread(self, job_id: str, spec_dict: dict) -> None:
         """Fallback: run job in a background thread when Celery is unavailable."""
 
         def _execute():
             try:
-                from backend.execution.celery_tasks import (
-                    _sync_job_to_db,
-                    _resolve_parameters,
-                    _prepare_volumes,
-                    _upload_outputs_to_minio,
-                    _extract_bundle,
-                )
-                import docker as _docker
-                from docker.errors import ImageNotFound
-
-                client = _docker.from_env()
+                client = self.docker_client
                 output_dir = Path(spec_dict["output_dir"])
 
-                for sub in ("native", "bundle/volumes", "bundle/metrics", "bundle/qc", "logs", "_inputs"):
-                    (output_dir / sub).mkdir(parents=True, exist_ok=True)
-
-                now = datetime.utcnow()
-                with self._lock:
-                    self._jobs[job_id]["status"] = JobStatus.RUNNING
-                    self._jobs[job_id]["started_at"] = now
-
-                _sync_job_to_db(job_id, "running", started_at=now, progress=1)
+                _ensure_output_layout(output_dir)
 
                 image = spec_dict.get("container_image", "")
-
-                # Pull if needed
                 try:
                     client.images.get(image)
+                    needs_pull = False
                 except ImageNotFound:
-                    _sync_job_to_db(job_id, "running", progress=2, current_phase="Pulling image")
+                    needs_pull = True
+
+                # One write for the running transition (and pull phase, if any)
+                started_ns = now_ns()
+                now = ns_to_datetime(started_ns)
+                self._update_job(job_id, status=JobStatus.RUNNING, started_at=started_ns)
+                if needs_pull:
+                    _sync_job_to_db(job_id, "running", started_at=now, progress=2, current_phase="Pulling image")
                     client.images.pull(image)
+                else:
+                    _sync_job_to_db(job_id, "running", started_at=now, progress=1)
 
                 # Resolve and prepare
                 resolved_params = _resolve_parameters(spec_dict)
@@ -267,12 +506,7 @@ class LocalDockerBackend(ExecutionBackend):
 
                 command_template = spec_dict.get("command_template", "")
                 if command_template:
-                    command = command_template
-                    from backend.execution.celery_tasks import _params_for_shell_template, _sanitize_param
-                    for key, value in _params_for_shell_template(resolved_params).items():
-                        safe_value = _sanitize_param(str(value))
-                        command = command.replace(f"{{{key}}}", safe_value)
-                        command = command.replace(f"${{{key}}}", safe_value)
+                    command = render_command(command_template, resolved_params)
                 else:
                     command = None
 
@@ -303,20 +537,25 @@ class LocalDockerBackend(ExecutionBackend):
                     user="root",
                     security_opt=["no-new-privileges"],
                     network_mode="none",
+                    labels={"neuroinsight.job_id": job_id, "managed-by": "neuroinsight"},
                 )
                 if override_entrypoint is not None:
                     run_kwargs["entrypoint"] = override_entrypoint
 
+                # Register for the die event before the container can exit
+                self._ensure_events_watcher()
+                exit_future: Future = Future()
+                with self._lock:
+                    self._exit_futures[job_id] = exit_future
+
                 container = client.containers.run(**run_kwargs)
 
-                with self._lock:
-                    self._jobs[job_id]["container_id"] = container.id[:12]
+                self._update_job(job_id, container_id=container.id[:12])
 
                 _sync_job_to_db(job_id, "running", backend_job_id=container.id[:12],
                                progress=3, current_phase="Starting container")
 
                 # Stream logs and update progress (mirrors Celery task logic)
-                from backend.core.phase_milestones import get_milestones
                 plugin_id = spec_dict.get("plugin_id", "")
                 milestones = get_milestones(plugin_id)
                 current_progress = 3
@@ -340,13 +579,10 @@ class LocalDockerBackend(ExecutionBackend):
                             _sync_job_to_db(job_id, "running",
                                             progress=current_progress,
                                             current_phase=label)
-                            with self._lock:
-                                self._jobs[job_id]["progress"] = current_progress
-                                self._jobs[job_id]["current_phase"] = label
+                            self._update_job(job_id, progress=current_progress, current_phase=label)
                             break
 
-                result = container.wait(timeout=5)
-                exit_code = result.get("StatusCode", -1)
+                exit_code = self._wait_for_exit(job_id, exit_future, container)
 
                 # Save full log
                 try:
@@ -354,14 +590,13 @@ class LocalDockerBackend(ExecutionBackend):
                 except Exception as e:
                     logger.debug("Could not save logs for job %s: %s", job_id[:8], e)
 
-                completed_at = datetime.utcnow()
-                with self._lock:
-                    self._jobs[job_id]["completed_at"] = completed_at
-                    self._jobs[job_id]["exit_code"] = exit_code
+                completed_ns = now_ns()
+                completed_at = ns_to_datetime(completed_ns)
 
                 if exit_code == 0:
-                    with self._lock:
-                        self._jobs[job_id]["status"] = JobStatus.COMPLETED
+                    self._update_job(
+                        job_id, status=JobStatus.COMPLETED, exit_code=0, completed_at=completed_ns,
+                    )
                     _sync_job_to_db(
                         job_id, "completed",
                         completed_at=completed_at,
@@ -378,9 +613,10 @@ class LocalDockerBackend(ExecutionBackend):
                     except Exception as e:
                         logger.warning("Bundle extraction failed for job %s: %s", job_id[:8], e)
                 else:
-                    with self._lock:
-                        self._jobs[job_id]["status"] = JobStatus.FAILED
-                        self._jobs[job_id]["error_message"] = f"Exit code {exit_code}"
+                    self._update_job(
+                        job_id, status=JobStatus.FAILED, exit_code=exit_code,
+                        error_message=f"Exit code {exit_code}", completed_at=completed_ns,
+                    )
                     _sync_job_to_db(
                         job_id, "failed",
                         completed_at=completed_at,
@@ -397,34 +633,33 @@ class LocalDockerBackend(ExecutionBackend):
             except Exception as e:
                 logger.error(f"In-thread execution failed for job {job_id[:8]}: {e}")
                 with self._lock:
-                    self._jobs[job_id]["status"] = JobStatus.FAILED
-                    self._jobs[job_id]["error_message"] = str(e)
+                    self._exit_futures.pop(job_id, None)
+                completed_ns = now_ns()
+                self._update_job(
+                    job_id, status=JobStatus.FAILED, error_message=str(e), completed_at=completed_ns,
+                )
                 try:
-                    from backend.execution.celery_tasks import _sync_job_to_db
                     _sync_job_to_db(
                         job_id, "failed",
-                        completed_at=datetime.utcnow(),
+                        completed_at=ns_to_datetime(completed_ns),
                         exit_code=-1,
                         error_message=str(e),
                     )
                 except Exception as e2:
                     logger.error("Failed to sync failed job %s to DB: %s", job_id[:8], e2)
 
-        thread = threading.Thread(target=_execute, name=f"job-{job_id[:8]}", daemon=True)
-        thread.start()
+        self._start_job_thread(_execute, name=f"job-{job_id[:8]}")
 
     def get_job_status(self, job_id: str) -> JobStatus:
         """Query current job status."""
         # Check local cache first
         with self._lock:
-            if job_id in self._jobs:
-                return self._jobs[job_id]["status"]
+            info = self._jobs.get(job_id)
+        if info is not None:
+            return info["status"]
 
         # Fall back to database
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             with get_db_context() as db:
                 job = db.query(Job).filter_by(id=job_id).first()
                 if job:
@@ -445,9 +680,6 @@ class LocalDockerBackend(ExecutionBackend):
         """Get detailed job information."""
         # Try database first for most current info
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             with get_db_context() as db:
                 job = db.query(Job).filter_by(id=job_id).first()
                 if job:
@@ -478,23 +710,24 @@ class LocalDockerBackend(ExecutionBackend):
 
         # Fall back to local cache
         with self._lock:
-            if job_id in self._jobs:
-                info = self._jobs[job_id]
-                return JobInfo(
-                    job_id=job_id,
-                    status=info["status"],
-                    pipeline_name=info.get("spec", {}).get("pipeline_name", ""),
-                    container_image=info.get("spec", {}).get("container_image", ""),
-                    backend_job_id=info.get("container_id"),
-                    progress=info.get("progress", 0),
-                    current_phase=info.get("current_phase"),
-                    submitted_at=info.get("submitted_at"),
-                    started_at=info.get("started_at"),
-                    completed_at=info.get("completed_at"),
-                    exit_code=info.get("exit_code"),
-                    error_message=info.get("error_message"),
-                    output_dir=info.get("output_dir"),
-                )
+            info = self._jobs.get(job_id)
+            info = dict(info) if info is not None else None
+        if info is not None:
+            return JobInfo(
+                job_id=job_id,
+                status=info["status"],
+                pipeline_name=info.get("spec", {}).get("pipeline_name", ""),
+                container_image=info.get("spec", {}).get("container_image", ""),
+                backend_job_id=info.get("container_id"),
+                progress=info.get("progress", 0),
+                current_phase=info.get("current_phase"),
+                submitted_at=ns_to_datetime(info.get("submitted_at")),
+                started_at=ns_to_datetime(info.get("started_at")),
+                completed_at=ns_to_datetime(info.get("completed_at")),
+                exit_code=info.get("exit_code"),
+                error_message=info.get("error_message"),
+                output_dir=info.get("output_dir"),
+            )
 
         raise JobNotFoundError(f"Job {job_id} not found")
 
@@ -504,8 +737,7 @@ class LocalDockerBackend(ExecutionBackend):
         Survives backend restarts where the in-memory cache is lost.
         """
         try:
-            import docker
-            client = docker.from_env()
+            client = self.docker_client
             containers = client.containers.list(
                 filters={"label": f"neuroinsight.job_id={job_id}"}
             )
@@ -525,9 +757,6 @@ class LocalDockerBackend(ExecutionBackend):
         if not job_info:
             # No in-memory cache (e.g. after restart) -- use DB + label lookup
             try:
-                from backend.core.database import get_db_context
-                from backend.models.job import Job
-
                 with get_db_context() as db:
                     job = db.query(Job).filter_by(id=job_id).first()
                     if not job:
@@ -548,8 +777,7 @@ class LocalDockerBackend(ExecutionBackend):
         container_id = job_info.get("container_id")
         if container_id:
             try:
-                import docker
-                client = docker.from_env()
+                client = self.docker_client
                 container = client.containers.get(container_id)
                 container.stop(timeout=10)
                 logger.info(f"Stopped container {container_id} for job {job_id[:8]}")
@@ -563,90 +791,139 @@ class LocalDockerBackend(ExecutionBackend):
         celery_task_id = job_info.get("celery_task_id")
         if celery_task_id:
             try:
-                from backend.core.celery_app import celery_app
-                celery_app.control.revoke(celery_task_id, terminate=True)
-                logger.info(f"Revoked Celery task {celery_task_id} for job {job_id[:8]}")
+                # Once the task is running its state names the worker; revoke
+                # there only. A not-yet-started task must still be broadcast
+                # so whichever worker picks it up will discard it.
+                meta = AsyncResult(celery_task_id, app=celery_app).info
+                hostname = meta.get("hostname") if isinstance(meta, dict) else None
+                celery_app.control.revoke(
+                    celery_task_id, terminate=True,
+                    destination=[hostname] if hostname else None,
+                )
+                logger.info(
+                    f"Revoked Celery task {celery_task_id} for job {job_id[:8]}"
+                    f" on {hostname or 'all workers'}"
+                )
             except Exception as e:
                 logger.warning(f"Failed to revoke Celery task: {e}")
 
         # Update status
-        with self._lock:
-            self._jobs[job_id]["status"] = JobStatus.CANCELLED
-            self._jobs[job_id]["completed_at"] = datetime.utcnow()
+        completed_ns = now_ns()
+        self._update_job(job_id, status=JobStatus.CANCELLED, completed_at=completed_ns)
 
         try:
-            from backend.execution.celery_tasks import _sync_job_to_db
             _sync_job_to_db(
                 job_id, "cancelled",
-                completed_at=datetime.utcnow(),
+                completed_at=ns_to_datetime(completed_ns),
             )
         except Exception as e:
             logger.warning("Failed to sync cancelled status for job %s: %s", job_id[:8], e)
 
         return True
 
-    def get_job_logs(self, job_id: str) -> JobLogs:
-        """Retrieve job logs from Docker container or log files."""
+    def _read_log(self, path: Path, since_offset: int = 0) -> Tuple[str, int]:
+        """Read a log file, reusing the cached text when a full read is unchanged.
+
+        Raises:
+            FileNotFoundError: If the log does not exist (yet)
+        """
+        if since_offset:
+            return _read_from_offset(path, since_offset)
+
+        st = os.stat(path)
+        key = str(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._log_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        result = _read_from_offset(path, 0)
+        if st.st_size <= LOG_CACHE_MAX_BYTES:
+            with self._lock:
+                self._log_cache[key] = (stamp, result)
+                self._log_cache.move_to_end(key)
+                while len(self._log_cache) > LOG_CACHE_MAX_ENTRIES:
+                    self._log_cache.popitem(last=False)
+        return result
+
+    def get_job_logs(self, job_id: str, since_offset: int = 0, tail: Optional[int] = None) -> JobLogs:
+        """Retrieve job logs from Docker container or log files.
+
+        Args:
+            job_id: Job identifier
+            since_offset: Byte offset into the stdout log to resume from.
+                Pass back the returned ``stdout_offset`` to poll only new output.
+            tail: Number of lines to fetch when falling back to live container logs
+        """
         # Try log files first
         output_dir = self.data_dir / "outputs" / job_id / "logs"
         stdout = ""
         stderr = ""
+        stdout_offset = None
 
         stdout_file = output_dir / "stdout.log"
         stderr_file = output_dir / "stderr.log"
         container_log = output_dir / "container.log"
 
-        if stdout_file.exists():
-            stdout = stdout_file.read_text()
-        elif container_log.exists():
-            stdout = container_log.read_text()
+        try:
+            stdout, stdout_offset = self._read_log(stdout_file, since_offset)
+        except FileNotFoundError:
+            try:
+                stdout, stdout_offset = self._read_log(container_log, since_offset)
+            except FileNotFoundError:
+                pass
 
-        if stderr_file.exists():
-            stderr = stderr_file.read_text()
+        try:
+            stderr, _ = self._read_log(stderr_file)
+        except FileNotFoundError:
+            pass
 
         # If no log files yet, try Docker container directly
-        if not stdout:
+        job_info = None
+        if stdout_offset is None:
             with self._lock:
                 job_info = self._jobs.get(job_id)
             container_id = job_info.get("container_id") if job_info else None
             if container_id:
                 try:
-                    import docker
-                    client = docker.from_env()
+                    client = self.docker_client
                     container = client.containers.get(container_id)
-                    stdout = container.logs(stdout=True, stderr=False).decode("utf-8", errors="replace")
-                    stderr = container.logs(stdout=False, stderr=True).decode("utf-8", errors="replace")
+                    tail_arg = tail if tail else "all"
+                    stdout = container.logs(stdout=True, stderr=False, tail=tail_arg).decode("utf-8", errors="replace")
+                    stderr = container.logs(stdout=False, stderr=True, tail=tail_arg).decode("utf-8", errors="replace")
                 except Exception as e:
                     logger.debug("Could not read container logs for job %s: %s", job_id[:8], e)
 
         if not stdout and not stderr:
             # Check if job exists at all
-            with self._lock:
-                if job_id not in self._jobs:
-                    try:
-                        from backend.core.database import get_db_context
-                        from backend.models.job import Job
-                        with get_db_context() as db:
-                            if not db.query(Job).filter_by(id=job_id).first():
-                                raise JobNotFoundError(f"Job {job_id} not found")
-                    except JobNotFoundError:
-                        raise
+            if job_info is None:
+                with get_db_context() as db:
+                    if not db.query(Job).filter_by(id=job_id).first():
+                        raise JobNotFoundError(f"Job {job_id} not found")
 
-        return JobLogs(job_id=job_id, stdout=stdout, stderr=stderr)
+        return JobLogs(job_id=job_id, stdout=stdout, stderr=stderr, stdout_offset=stdout_offset)
 
     def list_jobs(self, status_filter: Optional[List[str]] = None, limit: int = 100) -> List[JobInfo]:
         """List jobs from database with optional filtering."""
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             with get_db_context() as db:
-                query = db.query(Job).filter(Job.deleted == False)
+                # Only the columns JobInfo needs -- skips the JSON blobs
+                # (input_files, parameters, resources) on every row.
+                stmt = (
+                    select(Job)
+                    .options(load_only(
+                        Job.id, Job.status, Job.pipeline_name, Job.container_image,
+                        Job.backend_job_id, Job.progress, Job.current_phase,
+                        Job.submitted_at, Job.started_at, Job.completed_at,
+                        Job.exit_code, Job.error_message, Job.output_dir,
+                    ))
+                    .where(Job.deleted == False)  # noqa: E712
+                )
                 if status_filter:
-                    query = query.filter(Job.status.in_(status_filter))
-                query = query.order_by(Job.submitted_at.desc()).limit(limit)
+                    stmt = stmt.where(Job.status.in_(status_filter))
+                stmt = stmt.order_by(Job.submitted_at.desc()).limit(limit)
 
-                jobs = []
                 status_map = {
                     "pending": JobStatus.PENDING,
                     "running": JobStatus.RUNNING,
@@ -654,8 +931,8 @@ class LocalDockerBackend(ExecutionBackend):
                     "failed": JobStatus.FAILED,
                     "cancelled": JobStatus.CANCELLED,
                 }
-                for job in query.all():
-                    jobs.append(JobInfo(
+                return [
+                    JobInfo(
                         job_id=job.id,
                         status=status_map.get(job.status, JobStatus.UNKNOWN),
                         pipeline_name=job.pipeline_name or "",
@@ -669,22 +946,22 @@ class LocalDockerBackend(ExecutionBackend):
                         exit_code=job.exit_code,
                         error_message=job.error_message,
                         output_dir=job.output_dir,
-                    ))
-                return jobs
+                    )
+                    for job in db.execute(stmt).scalars()
+                ]
         except Exception as e:
             logger.error(f"Failed to list jobs from DB: {e}")
             # Fall back to local cache
             with self._lock:
-                results = []
-                for job_id, info in list(self._jobs.items())[:limit]:
-                    if status_filter and info["status"].value not in status_filter:
-                        continue
-                    results.append(JobInfo(
+                return [
+                    JobInfo(
                         job_id=job_id,
                         status=info["status"],
                         pipeline_name=info.get("spec", {}).get("pipeline_name", ""),
-                    ))
-                return results
+                    )
+                    for job_id, info in islice(self._jobs.items(), limit)
+                    if not status_filter or info["status"].value in status_filter
+                ]
 
     def cleanup_job(self, job_id: str) -> bool:
         """Clean up job resources (container, temp files)."""
@@ -699,8 +976,7 @@ class LocalDockerBackend(ExecutionBackend):
             container_id = job_info.get("container_id")
             if container_id:
                 try:
-                    import docker
-                    client = docker.from_env()
+                    client = self.docker_client
                     container = client.containers.get(container_id)
                     container.stop(timeout=5)
                     container.remove(force=True)
@@ -708,21 +984,27 @@ class LocalDockerBackend(ExecutionBackend):
                 except Exception as e:
                     logger.debug("Could not remove container during cleanup for %s: %s", job_id[:8], e)
 
-        # Remove output directory
+        # Remove output directory: an O(1) rename into .trash, with the
+        # (possibly huge) tree deleted in the background.
         output_dir = self.data_dir / "outputs" / job_id
         if output_dir.exists():
             try:
-                shutil.rmtree(str(output_dir))
+                self._trash_dir.mkdir(exist_ok=True)
+                os.rename(output_dir, self._trash_dir / f"{job_id}-{uuid.uuid4().hex[:8]}")
+                self._schedule_trash_sweep()
                 cleaned = True
                 logger.info(f"Cleaned up output directory for job {job_id[:8]}")
-            except Exception as e:
-                logger.warning(f"Failed to clean up {output_dir}: {e}")
+            except OSError as e:
+                logger.debug("Could not move %s to trash (%s); deleting in place", output_dir, e)
+                try:
+                    shutil.rmtree(str(output_dir))
+                    cleaned = True
+                    logger.info(f"Cleaned up output directory for job {job_id[:8]}")
+                except Exception as e2:
+                    logger.warning(f"Failed to clean up {output_dir}: {e2}")
 
         # Soft-delete DB record
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             with get_db_context() as db:
                 job = db.query(Job).filter_by(id=job_id).first()
                 if job:
@@ -735,18 +1017,27 @@ class LocalDockerBackend(ExecutionBackend):
         return cleaned
 
     def health_check(self) -> dict:
-        """Check backend health and Docker availability."""
+        """Check backend health and Docker availability.
+
+        Results are cached for HEALTH_CACHE_TTL_S. The low-level API is used
+        so containers and images come back as plain dicts/ids rather than
+        wrapped model objects.
+        """
+        now = time.monotonic()
+        ts, cached = self._health_cache
+        if cached is not None and now - ts < HEALTH_CACHE_TTL_S:
+            return cached
+
         try:
-            import docker
-            client = docker.from_env()
-            info = client.info()
+            api = self.docker_client.api
+            info = api.info()
 
             # Count active containers
-            active_containers = len(client.containers.list(
-                filters={"label": "neuroinsight"}
+            active_containers = len(api.containers(
+                filters={"label": "managed-by=neuroinsight"}
             ))
 
-            return {
+            result = {
                 "healthy": True,
                 "message": "Docker is available",
                 "details": {
@@ -756,11 +1047,11 @@ class LocalDockerBackend(ExecutionBackend):
                     "active_job_containers": active_containers,
                     "max_concurrent_jobs": self.max_concurrent_jobs,
                     "data_dir": str(self.data_dir),
-                    "images_cached": len(client.images.list()),
+                    "images_cached": len(api.images(quiet=True)),
                 },
             }
         except Exception as e:
-            return {
+            result = {
                 "healthy": False,
                 "message": f"Docker is not available: {e}",
                 "details": {
@@ -768,3 +1059,6 @@ class LocalDockerBackend(ExecutionBackend):
                     "error": str(e),
                 },
             }
+
+        self._health_cache = (now, result)
+        return result
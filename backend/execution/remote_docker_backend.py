@@ -19,11 +19,21 @@ Architecture:
 """
 import json
 import logging
+import os
 import re
+import shlex
+import threading
+import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
 
 from backend.core.execution import (
     ExecutionBackend,
@@ -35,6 +45,8 @@ from backend.core.execution import (
     JobInfo,
     JobLogs,
     ResourceSpec,
+    now_ns,
+    ns_to_datetime,
 )
 from backend.core.ssh_manager import (
     SSHManager,
@@ -42,16 +54,13 @@ from backend.core.ssh_manager import (
     SSHCommandError,
     get_ssh_manager,
 )
+from backend.core.templating import fill_template, render_command, shell_params
 
 logger = logging.getLogger(__name__)
 
-
-def _shell_value(value):
-    """Render a param for a shell template: Python bools -> lowercase true/false
-    (templates test `[ "{flag}" = "true" ]`; str(True) is "True" and would fail)."""
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    return str(value)
+# Parser for inspect output, status files and the cache journal.  orjson's
+# JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # Map Docker container states to our JobStatus
@@ -65,6 +74,180 @@ _DOCKER_STATE_MAP = {
     "dead": JobStatus.FAILED,
 }
 
+# Containers in these states never change again, so their inspect result is
+# cached until the job is cancelled or cleaned up.
+_TERMINAL_DOCKER_STATES = frozenset({"exited", "dead"})
+
+_TERMINAL_JOB_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# How long an inspect result for a live container is reused.  UI polling
+# calls get_job_status and get_job_info back to back for every job.
+INSPECT_CACHE_TTL_S = 2.0
+
+
+# Append-only journal on the remote host recording tracked jobs, terminal
+# container states and present images.  It is replayed on first use after a
+# restart so none of that has to be rediscovered over SSH; once it grows past
+# CACHE_MAX_LINES it is rewritten as a compact snapshot.
+CACHE_FILENAME = ".neuroinsight_cache.json"
+CACHE_MAX_LINES = 500
+
+# Mutable tags are normally trusted once present.  With this enabled, each
+# use re-reads the tag's manifest digest from the registry (one cheap
+# `docker manifest inspect`) and pulls only when it differs from the digest
+# seen last time.
+REFRESH_MUTABLE_TAGS = os.getenv("REMOTE_DOCKER_REFRESH_MUTABLE_TAGS", "").lower() in ("1", "true", "yes")
+_MUTABLE_TAGS = frozenset({"latest"})
+
+# Container states for every neuroinsight container, one "name|state|status"
+# line each.
+_PS_STATES_CMD = (
+    'docker ps -a --no-trunc --filter "name=neuroinsight_" '
+    '--format "{{.Names}}|{{.State}}|{{.Status}}"'
+)
+
+# A small watcher on the remote host snapshots _PS_STATES_CMD into
+# {work_dir}/.states every WATCHER_INTERVAL_S, so a status refresh is one
+# `cat` however many jobs exist.  Each refresh renews a lease file; the
+# watcher exits once the lease is WATCHER_LEASE_S old (nobody is polling).
+# Snapshots older than STATES_MAX_AGE_S are ignored in favour of a live
+# `docker ps`, which also (re)starts the watcher.
+WATCHER_INTERVAL_S = 2
+WATCHER_LEASE_S = 300
+STATES_MAX_AGE_S = 10
+
+_WATCHER_SCRIPT = """#!/bin/sh
+# NeuroInsight container-state watcher (started by RemoteDockerBackend)
+D="$1"
+echo $$ > "$D/.watcher.pid"
+while [ $(( $(date +%%s) - $(stat -c %%Y "$D/.watcher_lease" 2>/dev/null || echo 0) )) -lt %(lease)d ]; do
+    %(ps)s > "$D/.states.tmp" 2>/dev/null && mv -f "$D/.states.tmp" "$D/.states"
+    sleep %(interval)d
+done
+rm -f "$D/.watcher.pid"
+""" % {"lease": WATCHER_LEASE_S, "ps": _PS_STATES_CMD, "interval": WATCHER_INTERVAL_S}
+
+_REFRESH_STATES_SCRIPT = (
+    'touch "$D/.watcher_lease"; '
+    'if [ -f "$D/.states" ] && '
+    '[ $(( $(date +%%s) - $(stat -c %%Y "$D/.states") )) -lt %(max_age)d ]; then '
+    'cat "$D/.states"; '
+    'else '
+    '%(ps)s; '
+    '{ { [ -f "$D/.watcher.pid" ] && kill -0 "$(cat "$D/.watcher.pid")" 2>/dev/null; } '
+    '|| { [ -f "$D/.ni_watcher.sh" ] && nohup sh "$D/.ni_watcher.sh" "$D"; }; } '
+    '</dev/null >/dev/null 2>&1 & '
+    'fi'
+) % {"max_age": STATES_MAX_AGE_S, "ps": _PS_STATES_CMD}
+
+# Lines of container log kept per job and returned by get_job_logs.
+LOG_TAIL_LINES = 1000
+
+# Exit code embedded in `docker ps` status text, e.g. "Exited (137) 2 hours ago"
+_PS_EXIT_RE = re.compile(r"\((-?\d+)\)")
+
+# Only the State object is fetched -- a full inspect dump is mostly config.
+_STATE_FMT = "--format '{{json .State}}'"
+
+
+def _parse_docker_ts(ts: Optional[str]) -> Optional[datetime]:
+    """Parse a Docker State timestamp to a naive UTC datetime (None if unset).
+
+    Docker always emits ``YYYY-MM-DDTHH:MM:SS[.fraction]Z``; the first 19
+    characters are the whole-second UTC time.
+    """
+    if not ts or ts.startswith("0001"):
+        return None
+    try:
+        return datetime.fromisoformat(ts[:19])
+    except ValueError:
+        return None
+
+
+# get_system_info / health_check probes, fused into one SSH command each and
+# run concurrently on the remote (wall time is the slowest probe, typically
+# nvidia-smi or docker, not the sum).  Every probe prints ``key=value`` lines
+# (gpu lines repeat) well under PIPE_BUF, so concurrent writes do not
+# interleave; a failing probe just prints an empty value.  $NI_WORK_DIR is
+# set by the caller.
+_SYSINFO_SCRIPT = (
+    '{ echo "os=$(. /etc/os-release 2>/dev/null; echo "$PRETTY_NAME")"; } & '
+    "{ echo \"cpu_model=$(lscpu 2>/dev/null | sed -n 's/^Model name:[[:space:]]*//p' | head -1)\"; } & "
+    '{ echo "cpus=$(nproc)"; } & '
+    "{ echo \"mem=$(free -g | awk '/^Mem:/{print $2}')\"; } & "
+    "{ echo \"disk=$(df -BG \"$NI_WORK_DIR\" 2>/dev/null | tail -1 | awk '{print $4}')\"; } & "
+    '{ echo "docker=$(docker --version 2>/dev/null)"; } & '
+    '{ echo "running=$(docker ps --filter name=neuroinsight_ -q | wc -l)"; } & '
+    "{ nvidia-smi --query-gpu=name,memory.total --format=csv,noheader 2>/dev/null | sed 's/^/gpu=/'; } & "
+    "wait"
+)
+
+# Exits non-zero (docker's error on stderr) when the daemon is unreachable;
+# the resource probes run alongside `docker info`.
+_HEALTH_SCRIPT = (
+    '{ echo "cpus=$(nproc)"; } & '
+    "{ echo \"mem=$(free -g | awk '/^Mem:/{print $2}')\"; } & "
+    '{ echo "gpus=$(nvidia-smi --query-gpu=name --format=csv,noheader 2>/dev/null | wc -l)"; } & '
+    "v=$(docker info --format '{{.ServerVersion}}') || exit 1; "
+    'echo "docker=$v"; '
+    "wait"
+)
+
+
+def _parse_probe_output(stdout: str) -> Dict[str, List[str]]:
+    """Parse ``key=value`` probe lines; repeated keys keep every value."""
+    values: Dict[str, List[str]] = {}
+    for line in stdout.splitlines():
+        key, sep, val = line.partition("=")
+        if sep:
+            values.setdefault(key.strip(), []).append(val.strip())
+    return values
+
+
+def _image_ref(image: str) -> str:
+    """Normalise an image reference to ``repo:tag`` as `docker images` prints it."""
+    if "@" in image or ":" in image.rsplit("/", 1)[-1]:
+        return image
+    return f"{image}:latest"
+
+
+def _log_ts_key(ts: str) -> str:
+    """Sortable form of a `docker logs --timestamps` RFC3339Nano stamp.
+
+    Docker trims trailing zeros from the fraction, so raw strings do not
+    compare correctly; pad it to nanoseconds.
+    """
+    whole, _, frac = ts.rstrip("Z").partition(".")
+    return f"{whole}.{frac.ljust(9, '0')}"
+
+
+def _int_or_zero(text: str) -> int:
+    return int(text) if text.isdigit() else 0
+
+
+def _status_from_state(state: dict) -> JobStatus:
+    """Map a ``docker inspect`` State dict to a JobStatus."""
+    docker_state = str(state.get("Status", "")).lower()
+    if docker_state == "exited":
+        return JobStatus.COMPLETED if state.get("ExitCode") == 0 else JobStatus.FAILED
+    return _DOCKER_STATE_MAP.get(docker_state, JobStatus.UNKNOWN)
+
+
+@lru_cache(maxsize=64)
+def _resource_flags(cpus: int, memory_gb: int, gpu_flag: str = "") -> Tuple[str, ...]:
+    """``docker run`` resource limits and thread-count env for a ResourceSpec.
+
+    Returned as argv tokens, cached on the ResourceSpec fields so bulk
+    submissions with the same resources reuse one tuple.
+    """
+    return (
+        f"--cpus={cpus}",
+        f"--memory={memory_gb}g",
+        "-e", f"OMP_NUM_THREADS={cpus}",
+        "-e", f"ITK_GLOBAL_DEFAULT_NUMBER_OF_THREADS={cpus}",
+        *shlex.split(gpu_flag),
+    )
+
 
 class RemoteDockerBackend(ExecutionBackend):
     """Remote Docker execution backend.
@@ -87,8 +270,29 @@ class RemoteDockerBackend(ExecutionBackend):
         self._max_concurrent_jobs = max_concurrent_jobs
         self._gpu_flag = gpu_flag
 
-        # Track jobs: job_id -> {container_name, spec, submitted_at, ...}
+        # Track jobs: job_id -> {container_name, spec, submitted_ns, ...}
         self._jobs: Dict[str, dict] = {}
+        # Reverse index: container_name -> job_id
+        self._container_to_job: Dict[str, str] = {}
+
+        # container_name -> (monotonic fetch time, inspect State dict)
+        self._inspect_cache: Dict[str, Tuple[float, dict]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Images known to be present on the remote host (repo:tag), seeded
+        # lazily from one `docker images` listing.
+        self._image_present_cache: Optional[set] = None
+        # repo:tag -> registry manifest digest at the last pull (mutable tags)
+        self._image_digest_cache: Dict[str, str] = {}
+        self._cache_loaded = False
+        # Journal lines waiting to ride along with the next remote command
+        self._journal_pending: List[str] = []
+        self._watcher_installed = False
+        # Remote directories already created by _ensure_dirs_batch
+        self._known_dirs: set = set()
+
+        # job_id -> (sort key of the newest log timestamp seen, buffered lines)
+        self._log_state: Dict[str, Tuple[str, List[str]]] = {}
 
         logger.info(
             f"RemoteDockerBackend initialized: {ssh_user}@{ssh_host}, "
@@ -110,17 +314,308 @@ class RemoteDockerBackend(ExecutionBackend):
             raise BackendUnavailableError(
                 "SSH not connected. Connect to the remote server first."
             )
+        if not self._cache_loaded:
+            self._cache_loaded = True
+            self._load_cache(mgr)
         return mgr
 
+    # ------------------------------------------------------------------
+    # Persistent cache (remote journal)
+    # ------------------------------------------------------------------
+
+    @property
+    def _cache_path(self) -> str:
+        return f"{self._work_dir}/{CACHE_FILENAME}"
+
+    def _load_cache(self, ssh: SSHManager) -> None:
+        """Replay the remote cache journal into the in-memory caches."""
+        try:
+            content = ssh.read_file(self._cache_path)
+        except Exception as e:
+            logger.debug("No remote cache journal at %s: %s", self._cache_path, e)
+            return
+
+        lines = content.splitlines()
+        with self._cache_lock:
+            for line in lines:
+                try:
+                    entry = _json_loads(line)
+                except json.JSONDecodeError:
+                    logger.debug("Skipping malformed cache journal line: %.80s", line)
+                    continue
+                op = entry.get("op")
+                if op == "job":
+                    if entry["job_id"] not in self._jobs:
+                        self._track_job(entry["job_id"], dict(entry["meta"]))
+                elif op == "drop":
+                    self._untrack_job(entry["job_id"])
+                    self._inspect_cache.pop(entry.get("container_name", ""), None)
+                elif op == "state":
+                    self._inspect_cache[entry["container_name"]] = (0.0, entry["state"])
+                elif op == "images":
+                    self._image_present_cache = set(entry["images"])
+                elif op == "image" and self._image_present_cache is not None:
+                    self._image_present_cache.add(entry["image"])
+                elif op == "digest":
+                    self._image_digest_cache[entry["image"]] = entry["digest"]
+        logger.info(
+            "Loaded remote cache journal: %d jobs, %d container states",
+            len(self._jobs), len(self._inspect_cache),
+        )
+
+        if len(lines) > CACHE_MAX_LINES:
+            self._compact_cache(ssh)
+
+    def _compact_cache(self, ssh: SSHManager) -> None:
+        """Rewrite the journal as one entry per live fact."""
+        with self._cache_lock:
+            entries = [
+                {"op": "job", "job_id": job_id, "meta": self._journal_meta(meta)}
+                for job_id, meta in self._jobs.items()
+            ]
+            entries.extend(
+                {"op": "state", "container_name": name, "state": state}
+                for name, (_, state) in self._inspect_cache.items()
+                if str(state.get("Status", "")).lower() in _TERMINAL_DOCKER_STATES
+                and "StartedAt" in state
+            )
+            if self._image_present_cache is not None:
+                entries.append({"op": "images", "images": sorted(self._image_present_cache)})
+            entries.extend(
+                {"op": "digest", "image": ref, "digest": digest}
+                for ref, digest in self._image_digest_cache.items()
+            )
+        try:
+            ssh.write_file(self._cache_path, "".join(json.dumps(e) + "\n" for e in entries))
+        except Exception as e:
+            logger.debug("Could not compact remote cache journal: %s", e)
+
+    @staticmethod
+    def _journal_meta(meta: dict) -> dict:
+        """Tracking metadata in JSON-serialisable form."""
+        return {k: v for k, v in meta.items() if k != "info"}
+
+    def _journal(self, entry: dict, flush: bool = False) -> None:
+        """Queue one entry for the remote cache journal (best-effort).
+
+        Entries are appended by the next ``_run`` rather than costing a round
+        trip each; ``flush`` writes them out immediately.
+        """
+        with self._cache_lock:
+            self._journal_pending.append(json.dumps(entry))
+        if flush:
+            try:
+                self._run(":", timeout=10)
+            except Exception as e:
+                logger.debug("Could not append to remote cache journal: %s", e)
+
     def _run(self, cmd: str, timeout: int = 120, check: bool = False):
         """Execute a command on the remote host via SSH."""
+        with self._cache_lock:
+            pending, self._journal_pending = self._journal_pending, []
+        if pending:
+            cmd = f"printf '%s\\n' {shlex.join(pending)} >> {self._cache_path} 2>/dev/null; {cmd}"
         return self._ssh().execute(cmd, timeout=timeout, check=check)
 
+    def _inspect(self, container_name: str, full: bool = False) -> Optional[dict]:
+        """Return the container's ``State`` from ``docker inspect``, cached.
+
+        Terminal states are cached until invalidated; live states for
+        INSPECT_CACHE_TTL_S. Returns None if the container does not exist.
+
+        Args:
+            container_name: Docker container name
+            full: Require timestamps, i.e. ignore the status-only entries
+                seeded by refresh_all_statuses()
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._inspect_cache.get(container_name)
+        if cached is not None and not (full and "StartedAt" not in cached[1]):
+            ts, state = cached
+            if (
+                str(state.get("Status", "")).lower() in _TERMINAL_DOCKER_STATES
+                or now - ts < INSPECT_CACHE_TTL_S
+            ):
+                return state
+
+        exit_code, stdout, _ = self._run(
+            f"docker inspect {_STATE_FMT} {container_name} 2>/dev/null", timeout=10,
+        )
+        if exit_code != 0 or not stdout.strip():
+            return None
+        try:
+            state = _json_loads(stdout)
+        except json.JSONDecodeError as e:
+            logger.debug("Could not parse Docker inspect for %s: %s", container_name, e)
+            return None
+        if not isinstance(state, dict):
+            return None
+
+        self._cache_state(container_name, state, now)
+        return state
+
+    def _cache_state(self, container_name: str, state: dict, now: float) -> None:
+        """Store a full inspect State (journalled once it is terminal)."""
+        with self._cache_lock:
+            self._inspect_cache[container_name] = (now, state)
+        if str(state.get("Status", "")).lower() in _TERMINAL_DOCKER_STATES:
+            self._journal({"op": "state", "container_name": container_name, "state": state})
+
+    def refresh_all_statuses(self) -> int:
+        """Refresh the cached state of every neuroinsight container at once.
+
+        One ``docker ps -a`` replaces a per-job ``docker inspect`` round trip;
+        get_job_status then answers from the cache. Full inspect results
+        already cached are left alone.
+
+        The snapshot normally comes from the remote watcher's ``.states``
+        file (see _WATCHER_SCRIPT) rather than a live ``docker ps``.
+
+        Returns:
+            Number of containers seen
+        """
+        cmd = f"D={shlex.quote(self._work_dir)}; "
+        if not self._watcher_installed:
+            cmd += (
+                f'mkdir -p "$D" && printf %s {shlex.quote(_WATCHER_SCRIPT)} '
+                f'> "$D/.ni_watcher.sh"; '
+            )
+        exit_code, stdout, _ = self._run(cmd + _REFRESH_STATES_SCRIPT, timeout=10)
+        if exit_code != 0:
+            return 0
+        self._watcher_installed = True
+
+        now = time.monotonic()
+        seen = 0
+        with self._cache_lock:
+            for line in stdout.splitlines():
+                name, _, rest = line.strip().partition("|")
+                docker_state, _, status_text = rest.partition("|")
+                if not name or not docker_state:
+                    continue
+                seen += 1
+                docker_state = docker_state.lower()
+                cached = self._inspect_cache.get(name)
+                if cached is not None and cached[1].get("Status") == docker_state:
+                    self._inspect_cache[name] = (now, cached[1])
+                    continue
+                state = {"Status": docker_state}
+                if docker_state == "exited":
+                    m = _PS_EXIT_RE.search(status_text)
+                    state["ExitCode"] = int(m.group(1)) if m else -1
+                self._inspect_cache[name] = (now, state)
+        return seen
+
+    def _ensure_image(self, image: str) -> None:
+        """Pull ``image`` on the remote host unless it is already present.
+
+        Presence is answered from an in-process set seeded by a single
+        ``docker images`` call, so resubmitting a pipeline costs no round trip.
+        """
+        ref = _image_ref(image)
+        with self._cache_lock:
+            present = self._image_present_cache
+        if present is None:
+            exit_code, stdout, _ = self._run(
+                'docker images --format "{{.Repository}}:{{.Tag}}"', timeout=15,
+            )
+            present = set(stdout.split()) if exit_code == 0 else set()
+            with self._cache_lock:
+                self._image_present_cache = present
+            self._journal({"op": "images", "images": sorted(present)})
+        if ref in present:
+            if REFRESH_MUTABLE_TAGS and ref.rsplit(":", 1)[-1] in _MUTABLE_TAGS:
+                self._refresh_mutable_image(image, ref)
+            return
+
+        exit_code, _, stderr = self._run(
+            f"docker image inspect {image} > /dev/null 2>&1 || docker pull {image}",
+            timeout=600,
+        )
+        if exit_code == 0:
+            with self._cache_lock:
+                present.add(ref)
+            self._journal({"op": "image", "image": ref})
+        else:
+            logger.warning("Could not pull image %s on remote: %s", image, stderr.strip()[:200])
+
+    def _registry_digest(self, image: str) -> Optional[str]:
+        """Manifest digest(s) the registry currently serves for ``image``."""
+        exit_code, stdout, _ = self._run(
+            f"docker manifest inspect -v {image} 2>/dev/null", timeout=30,
+        )
+        if exit_code != 0 or not stdout.strip():
+            return None
+        try:
+            manifest = _json_loads(stdout)
+        except json.JSONDecodeError:
+            return None
+        # Multi-arch tags list one descriptor per platform
+        entries = manifest if isinstance(manifest, list) else [manifest]
+        digests = sorted(
+            e.get("Descriptor", {}).get("digest", "") for e in entries if isinstance(e, dict)
+        )
+        return ",".join(d for d in digests if d) or None
+
+    def _refresh_mutable_image(self, image: str, ref: str) -> None:
+        """Pull a present mutable-tag image only if its registry digest moved."""
+        digest = self._registry_digest(image)
+        if digest is None or self._image_digest_cache.get(ref) == digest:
+            return
+        exit_code, _, stderr = self._run(f"docker pull {image}", timeout=600)
+        if exit_code != 0:
+            logger.warning("Could not refresh image %s on remote: %s", image, stderr.strip()[:200])
+            return
+        with self._cache_lock:
+            self._image_digest_cache[ref] = digest
+        self._journal({"op": "digest", "image": ref, "digest": digest})
+
+    def _invalidate_inspect(self, container_name: str) -> None:
+        """Drop a cached inspect result (after cancel/cleanup)."""
+        with self._cache_lock:
+            self._inspect_cache.pop(container_name, None)
+
+    def _track_job(self, job_id: str, meta: dict) -> None:
+        """Record a job and index it by container name."""
+        self._jobs[job_id] = meta
+        if meta.get("container_name"):
+            self._container_to_job[meta["container_name"]] = job_id
+
+    def _untrack_job(self, job_id: str) -> None:
+        """Forget a job and its container-name index entry."""
+        meta = self._jobs.pop(job_id, None)
+        if meta and meta.get("container_name"):
+            self._container_to_job.pop(meta["container_name"], None)
+
     def _container_name(self, job_id: str) -> str:
         """Generate a unique Docker container name for a job."""
         short_id = job_id[:12].replace("-", "")
         return f"neuroinsight_{short_id}"
 
+    def _job_dirs(self, job_id: str, workflow: bool = False) -> List[str]:
+        """Remote directories a job needs before its inputs are staged."""
+        job_dir = f"{self._work_dir}/jobs/{job_id}"
+        outputs = ["outputs/native", "outputs/bundle"] if workflow else ["outputs"]
+        return [f"{job_dir}/{sub}" for sub in ("inputs", *outputs, "logs", "scripts")]
+
+    def _ensure_dirs_batch(self, paths: List[str]) -> None:
+        """Create the given remote directories with at most one ``mkdir -p``.
+
+        Directories created earlier in this process are skipped, so a job
+        whose directories were made by submit_jobs costs no round trip.
+        """
+        with self._cache_lock:
+            missing = [p for p in dict.fromkeys(paths) if p not in self._known_dirs]
+        if not missing:
+            return
+        exit_code, _, stderr = self._run(f"mkdir -p {shlex.join(missing)}")
+        if exit_code != 0:
+            logger.warning("mkdir on remote failed: %s", stderr.strip())
+            return
+        with self._cache_lock:
+            self._known_dirs.update(missing)
+
     # ------------------------------------------------------------------
     # Job submission
     # ------------------------------------------------------------------
@@ -188,6 +683,24 @@ class RemoteDockerBackend(ExecutionBackend):
         finally:
             os.unlink(tmp.name)
 
+    def _put_files(self, ssh, transfers: List[Tuple[str, str]]) -> None:
+        """Upload input files, in parallel SFTP channels when the manager supports it."""
+        put_files = getattr(ssh, "put_files", None)
+        if put_files is not None and len(transfers) > 1:
+            failures = put_files(transfers)
+        else:
+            failures = {}
+            for local_path, remote_path in transfers:
+                try:
+                    ssh.put_file(local_path, remote_path)
+                except Exception as e:
+                    failures[local_path] = e
+        for local_path, remote_path in transfers:
+            if local_path in failures:
+                logger.warning("Could not upload input %s: %s", local_path, failures[local_path])
+            else:
+                logger.info("Uploaded file %s -> %s", Path(local_path).name, remote_path)
+
     def submit_job(self, spec: JobSpec, job_id: Optional[str] = None) -> str:
         """Submit a job to run in Docker on the remote machine.
 
@@ -208,12 +721,13 @@ class RemoteDockerBackend(ExecutionBackend):
 
         # Create working directories on remote
         job_dir = f"{self._work_dir}/jobs/{job_id}"
-        self._run(f"mkdir -p {job_dir}/inputs {job_dir}/outputs {job_dir}/logs {job_dir}/scripts")
+        self._ensure_dirs_batch(self._job_dirs(job_id))
 
         # Stage inputs under the plugin's declared input keys (e.g. dicom_dir) so
         # command templates resolve, matching the local backend. Files upload
         # directly; directories upload recursively.
         keymap = self._resolve_input_keymap(spec.plugin_id, spec.input_files)
+        file_uploads: List[Tuple[str, str]] = []
         for i, input_file in enumerate(spec.input_files):
             if not (input_file.startswith("/") or input_file.startswith("./")):
                 continue  # already a remote path reference
@@ -230,75 +744,55 @@ class RemoteDockerBackend(ExecutionBackend):
                     ext = "".join(local_path.suffixes)
                     base = keymap.get(i)
                     name = f"{base}{ext}" if base else local_path.name
-                    ssh.put_file(str(local_path), f"{job_dir}/inputs/{name}")
-                    logger.info("Uploaded file %s -> inputs/%s", local_path.name, name)
+                    file_uploads.append((str(local_path), f"{job_dir}/inputs/{name}"))
             except Exception as e:
                 logger.warning("Could not upload input %s: %s", input_file, e)
+        self._put_files(ssh, file_uploads)
 
         # Build docker run command
         image = spec.container_image
         resources = spec.resources if isinstance(spec.resources, ResourceSpec) else ResourceSpec()
 
+        flags = _resource_flags(
+            resources.cpus, resources.memory_gb, self._gpu_flag if resources.gpu else "",
+        )
         docker_args = [
-            "docker run -d",
-            f"--name {container_name}",
-            f"--cpus={resources.cpus}",
-            f"--memory={resources.memory_gb}g",
-            f"-v {job_dir}/inputs:/data/inputs:ro",
-            f"-v {job_dir}/outputs:/data/outputs:rw",
+            "docker", "run", "-d", "--name", container_name, *flags,
+            "-v", f"{job_dir}/inputs:/data/inputs:ro",
+            "-v", f"{job_dir}/outputs:/data/outputs:rw",
+            "-e", f"NEUROINSIGHT_JOB_ID={job_id}",
         ]
 
-        # GPU support
-        if resources.gpu:
-            docker_args.append(self._gpu_flag)
-
-        # Environment variables
-        docker_args.append(f"-e OMP_NUM_THREADS={resources.cpus}")
-        docker_args.append(f"-e ITK_GLOBAL_DEFAULT_NUMBER_OF_THREADS={resources.cpus}")
-        docker_args.append(f"-e NEUROINSIGHT_JOB_ID={job_id}")
-
         # Build command from template or use container default
         command_template = spec.parameters.get("_command_template", "")
         if not command_template:
             # Try to get from plugin registry
             try:
-                from backend.core.plugin_registry import get_plugin_workflow_registry
-                registry = get_plugin_workflow_registry()
-                plugin = registry.get_plugin(spec.plugin_id) if spec.plugin_id else None
-                if plugin:
-                    command_template = plugin.command_template or plugin.command
+                from backend.core.plugin_registry import get_command_template
+                if spec.plugin_id:
+                    command_template = get_command_template(spec.plugin_id)
             except Exception as e:
                 logger.debug("Could not load command_template for %s: %s", spec.plugin_id, e)
 
         if command_template:
-            # Substitute parameters into template with sanitization
-            cmd = command_template
-            dangerous = set(";|&`$(){}!><\n\r")
-            for key, value in spec.parameters.items():
-                if not key.startswith("_"):
-                    safe_val = "".join(c for c in _shell_value(value) if c not in dangerous)
-                    cmd = cmd.replace(f"{{{key}}}", safe_val)
-                    cmd = cmd.replace(f"${{{key}}}", safe_val)
+            # Substitute parameters into template with sanitization (one pass)
+            cmd = render_command(command_template, spec.parameters)
             # Write the (possibly multi-line) script to a file and run it via a
             # mounted path. This overrides image ENTRYPOINTs that aren't a shell
             # (e.g. heudiconv, fmriprep, qsiprep) and avoids fragile multi-layer
             # shell quoting when the run command is sent over SSH.
             ssh.write_file(f"{job_dir}/scripts/run.sh", cmd, mode=0o755)
-            docker_args.append(f"-v {job_dir}/scripts/run.sh:/nir_run.sh:ro")
-            docker_args.append("--entrypoint /bin/bash")
-            docker_args.append(image)
-            docker_args.append("/nir_run.sh")
+            docker_args += [
+                "-v", f"{job_dir}/scripts/run.sh:/nir_run.sh:ro",
+                "--entrypoint", "/bin/bash", image, "/nir_run.sh",
+            ]
         else:
             docker_args.append(image)
-
-        full_cmd = " ".join(docker_args)
+        full_cmd = shlex.join(docker_args)
         logger.info(f"Submitting remote Docker job: {container_name}")
 
         # Pull image first if not present
-        exit_code, stdout, stderr = self._run(
-            f"docker image inspect {image} > /dev/null 2>&1 || docker pull {image}",
-            timeout=600,
-        )
+        self._ensure_image(image)
 
         # Run the container
         exit_code, stdout, stderr = self._run(full_cmd, timeout=30)
@@ -311,16 +805,16 @@ class RemoteDockerBackend(ExecutionBackend):
         logger.info(f"Remote container started: {container_name} ({container_id})")
 
         # Track the job
-        now = datetime.utcnow()
-        self._jobs[job_id] = {
+        submitted_ns = now_ns()
+        self._track_job(job_id, {
             "container_name": container_name,
             "container_id": container_id,
             "job_dir": job_dir,
             "pipeline_name": spec.pipeline_name,
             "image": image,
             "plugin_id": spec.plugin_id,
-            "submitted_at": now,
-        }
+            "submitted_ns": submitted_ns,
+        })
 
         # Save job metadata on remote for persistence
         meta = {
@@ -328,12 +822,13 @@ class RemoteDockerBackend(ExecutionBackend):
             "container_name": container_name,
             "pipeline_name": spec.pipeline_name,
             "image": image,
-            "submitted_at": now.isoformat(),
+            "submitted_at": ns_to_datetime(submitted_ns).isoformat(),
         }
         ssh.write_file(
             f"{job_dir}/job_meta.json",
             json.dumps(meta, indent=2),
         )
+        self._journal({"op": "job", "job_id": job_id, "meta": self._journal_meta(self._jobs[job_id])}, flush=True)
 
         # Create DB record for persistence across restarts
         try:
@@ -351,6 +846,25 @@ class RemoteDockerBackend(ExecutionBackend):
 
         return job_id
 
+    def submit_jobs(self, specs: List[JobSpec], job_ids: Optional[List[str]] = None) -> List[str]:
+        """Submit several jobs, creating all their remote directories in one call.
+
+        Args:
+            specs: Job specifications
+            job_ids: Optional pre-generated job IDs, parallel to ``specs``
+
+        Returns:
+            Job IDs in the same order as ``specs``
+        """
+        if job_ids is None:
+            job_ids = [None] * len(specs)
+        job_ids = [job_id or str(uuid.uuid4()) for job_id in job_ids]
+        dirs: List[str] = []
+        for spec, job_id in zip(specs, job_ids):
+            dirs.extend(self._job_dirs(job_id, workflow=bool(spec.parameters.get("_workflow_steps"))))
+        self._ensure_dirs_batch(dirs)
+        return [self.submit_job(spec, job_id=job_id) for spec, job_id in zip(specs, job_ids)]
+
     # ------------------------------------------------------------------
     # Workflow submission (multi-container)
     # ------------------------------------------------------------------
@@ -364,23 +878,15 @@ class RemoteDockerBackend(ExecutionBackend):
         """
         ssh = self._ssh()
         job_dir = f"{self._work_dir}/jobs/{job_id}"
-        self._run(
-            f"mkdir -p {job_dir}/inputs {job_dir}/outputs/native "
-            f"{job_dir}/outputs/bundle {job_dir}/logs {job_dir}/scripts"
-        )
+        self._ensure_dirs_batch(self._job_dirs(job_id, workflow=True))
 
         # Upload local input files
-        for input_file in spec.input_files:
-            if input_file.startswith("/") or input_file.startswith("./"):
-                try:
-                    from pathlib import Path
-                    local_path = Path(input_file)
-                    if local_path.exists():
-                        remote_input = f"{job_dir}/inputs/{local_path.name}"
-                        ssh.put_file(str(local_path), remote_input)
-                        logger.info(f"Uploaded {local_path.name} to remote for workflow")
-                except Exception as e:
-                    logger.warning(f"Could not upload input file {input_file}: {e}")
+        self._put_files(ssh, [
+            (input_file, f"{job_dir}/inputs/{Path(input_file).name}")
+            for input_file in spec.input_files
+            if (input_file.startswith("/") or input_file.startswith("./"))
+            and Path(input_file).exists()
+        ])
 
         # Collect step info from plugin registry
         from backend.core.plugin_registry import get_plugin_workflow_registry
@@ -441,10 +947,7 @@ class RemoteDockerBackend(ExecutionBackend):
         images = list({s["image"] for s in steps})
         for img in images:
             logger.info(f"Pulling image for workflow step: {img}")
-            self._run(
-                f"docker image inspect {img} > /dev/null 2>&1 || docker pull {img}",
-                timeout=600,
-            )
+            self._ensure_image(img)
 
         # Run workflow script in background
         exit_code, stdout, stderr = self._run(
@@ -460,18 +963,18 @@ class RemoteDockerBackend(ExecutionBackend):
             f"Workflow {job_id[:8]} started ({len(steps)} steps, pid={runner_pid})"
         )
 
-        now = datetime.utcnow()
-        self._jobs[job_id] = {
+        submitted_ns = now_ns()
+        self._track_job(job_id, {
             "container_name": f"ni_workflow_{job_id[:12].replace('-', '')}",
             "job_dir": job_dir,
             "pipeline_name": spec.pipeline_name,
             "image": spec.container_image,
             "plugin_id": spec.plugin_id,
-            "submitted_at": now,
+            "submitted_ns": submitted_ns,
             "is_workflow": True,
             "runner_pid": runner_pid,
             "workflow_steps": [s["plugin_id"] for s in steps],
-        }
+        })
 
         # Save metadata on remote
         meta = {
@@ -480,9 +983,10 @@ class RemoteDockerBackend(ExecutionBackend):
             "is_workflow": True,
             "runner_pid": runner_pid,
             "steps": [s["plugin_id"] for s in steps],
-            "submitted_at": now.isoformat(),
+            "submitted_at": ns_to_datetime(submitted_ns).isoformat(),
         }
         ssh.write_file(f"{job_dir}/job_meta.json", json.dumps(meta, indent=2))
+        self._journal({"op": "job", "job_id": job_id, "meta": self._journal_meta(self._jobs[job_id])}, flush=True)
 
         # DB record
         try:
@@ -513,16 +1017,6 @@ class RemoteDockerBackend(ExecutionBackend):
         Docker container sequentially, writing status to a JSON file."""
         total = len(steps)
 
-        dangerous = set(";|&`$(){}!><\n\r")
-
-        def _sub(template: str) -> str:
-            result = template
-            for key, value in resolved_params.items():
-                safe_val = "".join(c for c in _shell_value(value) if c not in dangerous)
-                result = result.replace(f"{{{key}}}", safe_val)
-                result = result.replace(f"${{{key}}}", safe_val)
-            return result
-
         lines = [
             "#!/bin/bash",
             "set -uo pipefail",
@@ -543,12 +1037,9 @@ class RemoteDockerBackend(ExecutionBackend):
 
         # Common Docker flags
         docker_common = [
-            f"--cpus={resources.cpus}",
-            f"--memory={resources.memory_gb}g",
+            *_resource_flags(resources.cpus, resources.memory_gb),
             f"-v {job_dir}/inputs:/data/inputs:ro",
             f"-v {job_dir}/outputs:/data/outputs:rw",
-            f"-e OMP_NUM_THREADS={resources.cpus}",
-            f"-e ITK_GLOBAL_DEFAULT_NUMBER_OF_THREADS={resources.cpus}",
             f"-e NEUROINSIGHT_JOB_ID={job_id}",
             "--network none",
         ]
@@ -556,6 +1047,7 @@ class RemoteDockerBackend(ExecutionBackend):
             docker_common.append(self._gpu_flag)
 
         docker_flags = " ".join(docker_common)
+        param_values = shell_params(resolved_params)
 
         for step_idx, step in enumerate(steps):
             step_num = step_idx + 1
@@ -564,7 +1056,7 @@ class RemoteDockerBackend(ExecutionBackend):
             step_pid = step["plugin_id"]
             container_name = f"ni_{job_id[:8]}_{step_pid}"
 
-            cmd_script = _sub(step["command_template"])
+            cmd_script = fill_template(step["command_template"], param_values)
 
             lines.append(f"# ---- Step {step_num}/{total}: {step_name} ----")
             lines.append(f"if [ $PIPELINE_EXIT -eq 0 ]; then")
@@ -614,38 +1106,20 @@ class RemoteDockerBackend(ExecutionBackend):
         by the background runner script.
         """
         job_meta = self._jobs.get(job_id, {})
+        if "info" in job_meta:
+            return job_meta["info"].status
 
         if job_meta.get("is_workflow"):
             return self._get_workflow_status(job_id, job_meta)
 
         container_name = self._get_container_name(job_id)
+        state = self._inspect(container_name)
 
-        exit_code, stdout, stderr = self._run(
-            f'docker inspect --format "{{{{.State.Status}}}} {{{{.State.ExitCode}}}}" {container_name} 2>/dev/null',
-            timeout=10,
-        )
-
-        if exit_code != 0:
+        if state is None:
             # Not found as a single container -- check for workflow status file
-            wf_status = self._get_workflow_status(job_id, job_meta)
-            if wf_status != JobStatus.UNKNOWN:
-                return wf_status
-            return JobStatus.UNKNOWN
-
-        parts = stdout.strip().split()
-        if len(parts) < 2:
-            return JobStatus.UNKNOWN
-
-        state = parts[0].lower()
-        container_exit_code = int(parts[1]) if parts[1].isdigit() else -1
-
-        status = _DOCKER_STATE_MAP.get(state, JobStatus.UNKNOWN)
-
-        # If container exited, check exit code to distinguish completed vs failed
-        if state == "exited":
-            status = JobStatus.COMPLETED if container_exit_code == 0 else JobStatus.FAILED
+            return self._get_workflow_status(job_id, job_meta)
 
-        return status
+        return _status_from_state(state)
 
     def _get_workflow_status(self, job_id: str, job_meta: dict) -> JobStatus:
         """Read workflow status from the JSON file on the remote host."""
@@ -674,7 +1148,7 @@ class RemoteDockerBackend(ExecutionBackend):
             return JobStatus.UNKNOWN
 
         try:
-            data = json.loads(stdout.strip())
+            data = _json_loads(stdout.strip())
             s = data.get("status", "unknown")
             if s == "completed":
                 return JobStatus.COMPLETED
@@ -687,54 +1161,51 @@ class RemoteDockerBackend(ExecutionBackend):
             return JobStatus.UNKNOWN
 
     def get_job_info(self, job_id: str) -> JobInfo:
-        """Get detailed job information from remote container or workflow."""
+        """Get detailed job information from remote container or workflow.
+
+        Once a tracked job has reached a terminal state its JobInfo no longer
+        changes, so it is memoised on the tracking entry and returned without
+        any SSH call.
+        """
         job_meta = self._jobs.get(job_id, {})
+        memo = job_meta.get("info")
+        if memo is not None:
+            return memo
+
         status = self.get_job_status(job_id)
 
         if job_meta.get("is_workflow"):
-            return self._get_workflow_info(job_id, job_meta, status)
-
-        container_name = self._get_container_name(job_id)
+            info = self._get_workflow_info(job_id, job_meta, status)
+        else:
+            container_name = self._get_container_name(job_id)
+            # Same inspect result get_job_status just fetched (cached)
+            state = self._inspect(container_name, full=True)
+            info = self._container_info(job_id, job_meta, container_name, state, status)
 
-        # Get container inspection
-        exit_code, stdout, stderr = self._run(
-            f"docker inspect {container_name} 2>/dev/null",
-            timeout=10,
-        )
+        if job_id in self._jobs and status in _TERMINAL_JOB_STATUSES:
+            self._jobs[job_id]["info"] = info
+        return info
 
+    def _container_info(
+        self, job_id: str, job_meta: dict, container_name: str,
+        state: Optional[dict], status: JobStatus,
+    ) -> JobInfo:
+        """Build JobInfo for a single-container job from its inspect State."""
         info = JobInfo(
             job_id=job_id,
             status=status,
             pipeline_name=job_meta.get("pipeline_name", "Unknown"),
             container_image=job_meta.get("image", ""),
             backend_job_id=container_name,
-            submitted_at=job_meta.get("submitted_at"),
+            submitted_at=ns_to_datetime(job_meta.get("submitted_ns")),
         )
 
-        if exit_code == 0 and stdout.strip():
-            try:
-                inspect_data = json.loads(stdout)[0]
-                state = inspect_data.get("State", {})
-
-                if state.get("StartedAt"):
-                    started = state["StartedAt"].replace("Z", "+00:00")
-                    try:
-                        info.started_at = datetime.fromisoformat(started.split(".")[0])
-                    except (ValueError, IndexError) as e:
-                        logger.debug("Could not parse StartedAt for %s: %s", job_id[:8], e)
-
-                if state.get("FinishedAt") and not state["FinishedAt"].startswith("0001"):
-                    finished = state["FinishedAt"].replace("Z", "+00:00")
-                    try:
-                        info.completed_at = datetime.fromisoformat(finished.split(".")[0])
-                    except (ValueError, IndexError) as e:
-                        logger.debug("Could not parse FinishedAt for %s: %s", job_id[:8], e)
-
-                info.exit_code = state.get("ExitCode")
-                if info.exit_code and info.exit_code != 0:
-                    info.error_message = state.get("Error", f"Exit code {info.exit_code}")
-            except (json.JSONDecodeError, IndexError, KeyError) as e:
-                logger.debug("Could not parse Docker inspect for %s: %s", job_id[:8], e)
+        if state:
+            info.started_at = _parse_docker_ts(state.get("StartedAt"))
+            info.completed_at = _parse_docker_ts(state.get("FinishedAt"))
+            info.exit_code = state.get("ExitCode")
+            if info.exit_code and info.exit_code != 0:
+                info.error_message = state.get("Error") or f"Exit code {info.exit_code}"
 
         return info
 
@@ -748,7 +1219,7 @@ class RemoteDockerBackend(ExecutionBackend):
             pipeline_name=job_meta.get("pipeline_name", "Unknown"),
             container_image=job_meta.get("image", ""),
             backend_job_id=f"workflow_pid:{job_meta.get('runner_pid', '?')}",
-            submitted_at=job_meta.get("submitted_at"),
+            submitted_at=ns_to_datetime(job_meta.get("submitted_ns")),
         )
 
         try:
@@ -756,7 +1227,7 @@ class RemoteDockerBackend(ExecutionBackend):
                 f"cat {job_dir}/workflow_status.json 2>/dev/null", timeout=10,
             )
             if rc == 0 and stdout.strip():
-                data = json.loads(stdout.strip())
+                data = _json_loads(stdout.strip())
                 step = data.get("step", 0)
                 total = data.get("total", 0)
                 step_name = data.get("step_name", "")
@@ -797,6 +1268,7 @@ class RemoteDockerBackend(ExecutionBackend):
             f"docker stop {container_name} 2>/dev/null",
             timeout=30,
         )
+        self._invalidate_inspect(container_name)
         return exit_code == 0
 
     def get_job_logs(self, job_id: str) -> JobLogs:
@@ -816,14 +1288,38 @@ class RemoteDockerBackend(ExecutionBackend):
 
         container_name = self._get_container_name(job_id)
 
+        # Fetch only output newer than the last poll; the first poll seeds
+        # the buffer with the usual tail.
+        last_key, lines = self._log_state.get(job_id, ("", []))
+        if last_key:
+            since = last_key.rstrip("0").rstrip(".") + "Z"
+            window = f"--since {since}"
+        else:
+            window = f"--tail {LOG_TAIL_LINES}"
         exit_code, stdout, stderr = self._run(
-            f"docker logs --tail 1000 {container_name} 2>&1",
+            f"docker logs --timestamps {window} {container_name} 2>&1",
             timeout=15,
         )
+        if exit_code != 0:
+            return JobLogs(job_id=job_id, stdout="", stderr=stderr)
+
+        lines = list(lines)
+        for line in stdout.splitlines():
+            ts, sep, text = line.partition(" ")
+            if not sep:
+                continue
+            key = _log_ts_key(ts)
+            # --since is inclusive; skip lines already buffered
+            if key <= last_key:
+                continue
+            lines.append(text)
+            last_key = key
+        del lines[:-LOG_TAIL_LINES]
+        self._log_state[job_id] = (last_key, lines)
 
         return JobLogs(
             job_id=job_id,
-            stdout=stdout if exit_code == 0 else "",
+            stdout="".join(f"{line}\n" for line in lines),
             stderr=stderr,
         )
 
@@ -877,19 +1373,24 @@ class RemoteDockerBackend(ExecutionBackend):
         """Remove container and optionally job directory from remote."""
         container_name = self._get_container_name(job_id)
         self._run(f"docker rm -f {container_name} 2>/dev/null", timeout=15)
+        self._invalidate_inspect(container_name)
 
         # Optionally clean job directory
         job_dir = f"{self._work_dir}/jobs/{job_id}"
         self._run(f"rm -rf {job_dir} 2>/dev/null", timeout=15)
+        with self._cache_lock:
+            self._known_dirs = {d for d in self._known_dirs if not d.startswith(f"{job_dir}/")}
 
-        self._jobs.pop(job_id, None)
+        self._untrack_job(job_id)
+        self._log_state.pop(job_id, None)
+        self._journal({"op": "drop", "job_id": job_id, "container_name": container_name})
         return True
 
     def health_check(self) -> dict:
         """Check if remote Docker is accessible."""
         try:
-            ssh = self._ssh()
-            exit_code, stdout, stderr = self._run("docker info --format '{{.ServerVersion}}'", timeout=10)
+            self._ssh()
+            exit_code, stdout, stderr = self._run(_HEALTH_SCRIPT, timeout=10)
 
             if exit_code != 0:
                 return {
@@ -898,17 +1399,8 @@ class RemoteDockerBackend(ExecutionBackend):
                     "details": {"error": stderr.strip()},
                 }
 
-            docker_version = stdout.strip()
-
-            # Get system resources
-            _, cpu_out, _ = self._run("nproc", timeout=5)
-            _, mem_out, _ = self._run(
-                "free -g | awk '/^Mem:/{print $2}'", timeout=5
-            )
-            _, gpu_out, _ = self._run(
-                "nvidia-smi --query-gpu=name --format=csv,noheader 2>/dev/null | wc -l",
-                timeout=5,
-            )
+            probe = _parse_probe_output(stdout)
+            docker_version = probe.get("docker", [""])[0]
 
             return {
                 "healthy": True,
@@ -916,9 +1408,9 @@ class RemoteDockerBackend(ExecutionBackend):
                 "details": {
                     "docker_version": docker_version,
                     "host": self._ssh_host,
-                    "cpus": cpu_out.strip(),
-                    "memory_gb": mem_out.strip(),
-                    "gpus": gpu_out.strip(),
+                    "cpus": probe.get("cpus", [""])[0],
+                    "memory_gb": probe.get("mem", [""])[0],
+                    "gpus": probe.get("gpus", [""])[0],
                     "work_dir": self._work_dir,
                 },
             }
@@ -948,58 +1440,32 @@ class RemoteDockerBackend(ExecutionBackend):
         info: Dict = {"host": self._ssh_host, "user": self._ssh_user}
 
         try:
-            # OS info
-            _, os_out, _ = self._run("cat /etc/os-release 2>/dev/null | head -2", timeout=5)
-            for line in os_out.strip().split("\n"):
-                if line.startswith("PRETTY_NAME="):
-                    info["os"] = line.split("=", 1)[1].strip('"')
-
-            # CPU
-            _, cpu_model, _ = self._run(
-                "lscpu | grep 'Model name' | sed 's/Model name:\\s*//'", timeout=5
-            )
-            _, cpu_count, _ = self._run("nproc", timeout=5)
-            info["cpu_model"] = cpu_model.strip()
-            info["cpu_count"] = int(cpu_count.strip()) if cpu_count.strip().isdigit() else 0
-
-            # Memory
-            _, mem_out, _ = self._run("free -g | awk '/^Mem:/{print $2}'", timeout=5)
-            info["memory_gb"] = int(mem_out.strip()) if mem_out.strip().isdigit() else 0
-
-            # Disk
-            _, disk_out, _ = self._run(
-                f"df -BG {self._work_dir} 2>/dev/null | tail -1 | awk '{{print $4}}'",
-                timeout=5,
+            _, stdout, _ = self._run(
+                f"NI_WORK_DIR={shlex.quote(self._work_dir)}; {_SYSINFO_SCRIPT}", timeout=10,
             )
-            disk_str = disk_out.strip().rstrip("G")
-            info["disk_free_gb"] = int(disk_str) if disk_str.isdigit() else 0
-
-            # GPU
-            exit_code, gpu_out, _ = self._run(
-                "nvidia-smi --query-gpu=name,memory.total --format=csv,noheader 2>/dev/null",
-                timeout=5,
-            )
-            if exit_code == 0 and gpu_out.strip():
-                gpus = []
-                for line in gpu_out.strip().split("\n"):
-                    parts = line.split(",")
-                    gpus.append({
-                        "name": parts[0].strip(),
-                        "memory": parts[1].strip() if len(parts) > 1 else "unknown",
-                    })
-                info["gpus"] = gpus
-            else:
-                info["gpus"] = []
-
-            # Docker
-            _, docker_ver, _ = self._run("docker --version 2>/dev/null", timeout=5)
-            info["docker_version"] = docker_ver.strip()
-
-            # Running containers count
-            _, containers_out, _ = self._run(
-                'docker ps --filter "name=neuroinsight_" -q | wc -l', timeout=5
-            )
-            info["running_jobs"] = int(containers_out.strip()) if containers_out.strip().isdigit() else 0
+            probe = _parse_probe_output(stdout)
+
+            def first(key: str) -> str:
+                return probe.get(key, [""])[0]
+
+            if first("os"):
+                info["os"] = first("os")
+            info["cpu_model"] = first("cpu_model")
+            info["cpu_count"] = _int_or_zero(first("cpus"))
+            info["memory_gb"] = _int_or_zero(first("mem"))
+            info["disk_free_gb"] = _int_or_zero(first("disk").rstrip("G"))
+
+            gpus = []
+            for line in probe.get("gpu", []):
+                parts = line.split(",")
+                gpus.append({
+                    "name": parts[0].strip(),
+                    "memory": parts[1].strip() if len(parts) > 1 else "unknown",
+                })
+            info["gpus"] = gpus
+
+            info["docker_version"] = first("docker")
+            info["running_jobs"] = _int_or_zero(first("running"))
 
         except Exception as e:
             logger.warning(f"Failed to get remote system info: {e}")
@@ -1018,9 +1484,5 @@ class RemoteDockerBackend(ExecutionBackend):
         return self._container_name(job_id)
 
     def _job_id_from_container(self, container_name: str) -> Optional[str]:
-        """Reverse-lookup job_id from container name."""
-        for jid, meta in self._jobs.items():
-            if meta.get("container_name") == container_name:
-                return jid
-        # If not tracked, return None (orphaned container)
-        return None
+        """Reverse-lookup job_id from container name (None if orphaned)."""
+        return self._container_to_job.get(container_name)
@@ -16,10 +16,17 @@ import json
 import logging
 import os
 import re
+import secrets
+import shlex
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from backend.core.execution import (
     ExecutionBackend,
@@ -32,24 +39,229 @@ from backend.core.execution import (
     JobLogs,
     ResourceSpec,
 )
+from backend.core.config import get_settings
+from backend.core.database import get_db_context
+from backend.core.phase_milestones import get_milestones
+from backend.core.plugin_registry import get_command_template, get_plugin_workflow_registry
 from backend.core.progress_utils import quantize_progress
+from backend.core.squeue_watcher import SqueueWatcher, get_squeue_watcher
 from backend.core.ssh_manager import (
     SSHManager,
     SSHConnectionError,
     SSHCommandError,
     get_ssh_manager,
 )
+from backend.core.templating import fill_template, shell_params
 from backend.execution.workflow_nir_env import apply_workflow_nir_input_root_command_overrides
+from backend.models.job import Job
 
 logger = logging.getLogger(__name__)
 
+# Per-job directory layout on the HPC, created in one mkdir before staging
+JOB_SUBDIRS = ("scripts", "logs", "inputs", "outputs/native", "outputs/bundle", "outputs/logs")
+
+# Upper bound on DB-resolved SLURM IDs (and cached sacct records) remembered
+# per backend instance
+SLURM_ID_CACHE_SIZE = 4096
+
+# Job IDs per batched sacct call (keeps the command line well under ARG_MAX)
+SACCT_BATCH_SIZE = 500
+
+# sacct records are reused for this long (records of finished jobs until
+# invalidated), so status, info and list calls arriving together cost one
+# slurmdbd query
+SACCT_CACHE_TTL_S = 15.0
+
+# Concurrent sacct batches; each runs on its own channel of the shared SSH
+# connection. Kept small so a large refresh does not flood slurmdbd.
+SACCT_WORKERS = 4
+
+# Bytes read from the end of a log file for progress parsing and log views
+LOG_TAIL_BYTES = 65536
+
+# Bytes re-read before the last progress offset so a milestone line split
+# across two polls is still matched
+LOG_OVERLAP_BYTES = 4096
+
+# sacct fields parsed by _parse_sacct_fields
+_SACCT_FORMAT = "JobID,State,ExitCode,Start,End"
+
+_FINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# sacct placeholders for a start/end time that has not happened
+_SACCT_NO_TIME = frozenset({"Unknown", "None", ""})
+
+# Printed between the outputs of commands batched by _ssh_exec_multi
+_EXEC_SEP = "___NI_SEP___"
+_EXEC_SEP_RE = re.compile(rf"\n{_EXEC_SEP} (\d+)\n")
+
+_SBATCH_ID_RE = re.compile(r"Submitted batch job (\d+)")
+_SUBJECT_ID_RE = re.compile(r"sub-([A-Za-z0-9]+)")
+_UNSAFE_JOB_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+_DATA_INPUT_REF_RE = re.compile(r"/data/inputs/(\w+)")
+
+# Characters that make a milestone marker more than a plain literal
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# SLURM job state -> JobStatus
+_SLURM_STATUS_MAP = {
+    "PENDING": JobStatus.PENDING,
+    "CONFIGURING": JobStatus.PENDING,
+    "RUNNING": JobStatus.RUNNING,
+    "COMPLETING": JobStatus.RUNNING,
+    "COMPLETED": JobStatus.COMPLETED,
+    "FAILED": JobStatus.FAILED,
+    "CANCELLED": JobStatus.CANCELLED,
+    "TIMEOUT": JobStatus.FAILED,
+    "OUT_OF_MEMORY": JobStatus.FAILED,
+    "NODE_FAIL": JobStatus.FAILED,
+    "PREEMPTED": JobStatus.FAILED,
+    "SUSPENDED": JobStatus.PENDING,
+}
+
+# Fixed parts of the generated sbatch script, filled with str.format_map by
+# _generate_sbatch_script.  The header requests resources, loads modules,
+# picks the container runtime (singularity <-> apptainer fallback) and
+# collects per-item input bind mounts: symlinks in inputs/ point to host
+# paths invisible inside the container, so each item is mounted on its own,
+# via a bash array so paths with spaces survive exec expansion.
+_SBATCH_HEADER_TEMPLATE = """#!/bin/bash
+#SBATCH --job-name={job_name}
+#SBATCH --partition={partition}
+#SBATCH --mem={mem_gb}G
+#SBATCH --cpus-per-task={cpus}
+#SBATCH --time={time_hours}:00:00
+#SBATCH --output={job_dir}/logs/slurm-%j.out
+#SBATCH --error={job_dir}/logs/slurm-%j.err
+{directives}
+set -euo pipefail
+
+{modules_block}# Detect container runtime (prefer configured, fallback to alternative)
+CONTAINER_RT=""
+if command -v {runtime} &>/dev/null; then
+    CONTAINER_RT="{runtime}"
+elif command -v {alt_runtime} &>/dev/null; then
+    CONTAINER_RT="{alt_runtime}"
+    echo "WARNING: {runtime} not found, falling back to {alt_runtime}"
+else
+    # Try loading via module system
+    module load {runtime} 2>/dev/null || module load {alt_runtime} 2>/dev/null || true
+    if command -v {runtime} &>/dev/null; then
+        CONTAINER_RT="{runtime}"
+    elif command -v {alt_runtime} &>/dev/null; then
+        CONTAINER_RT="{alt_runtime}"
+    else
+        echo "ERROR: Neither {runtime} nor {alt_runtime} found on this system"
+        exit 1
+    fi
+fi
+echo "Using container runtime: $CONTAINER_RT"
+
+# Job environment
+export NEUROINSIGHT_JOB_ID="{job_id}"
+export OMP_NUM_THREADS={threads}
+export ITK_GLOBAL_DEFAULT_NUMBER_OF_THREADS={threads}
+
+# Build per-item input bind mounts (resolves symlinks)
+declare -a INPUT_BINDS_ARR=()
+for item in {job_dir}/inputs/*; do
+  [ -e "$item" ] || [ -L "$item" ] || continue
+  name=$(basename "$item")
+  if [ -L "$item" ]; then
+    target=$(readlink -f "$item")
+    INPUT_BINDS_ARR+=(--bind "$target:/data/inputs/$name:ro")
+    echo "Input (resolved symlink): $target -> /data/inputs/$name"
+  else
+    INPUT_BINDS_ARR+=(--bind "$item:/data/inputs/$name:ro")
+    echo "Input (direct): $item -> /data/inputs/$name"
+  fi
+done"""
+
+# Post-container tail: generate stats CSVs with the uploaded converter
+_SBATCH_FOOTER_TEMPLATE = """echo "Pipeline exited with code $PIPELINE_EXIT"
+
+# Post-processing: generate stats CSVs
+CONVERTER="{job_dir}/scripts/stats_converter.py"
+OUTPUT_DIR="{job_dir}/outputs"
+if [ -f "$CONVERTER" ] && command -v python3 &>/dev/null; then
+  echo "Generating stats CSVs..."
+  python3 << 'NI_STATS_EOF'
+import sys; sys.path.insert(0, "{job_dir}/scripts")
+from stats_converter import FileProvider, generate_stats_csvs
+from pathlib import Path
+fp = FileProvider(local_dir="{job_dir}/outputs")
+sheets = generate_stats_csvs("{pipeline_name}", fp)
+if sheets:
+    csv_dir = Path("{job_dir}/outputs/bundle/csv")
+    csv_dir.mkdir(parents=True, exist_ok=True)
+    for s in sheets:
+        (csv_dir / s.filename).write_text(s.to_csv_string())
+    print(f"Generated {{len(sheets)}} stats CSVs")
+else:
+    print("No stats to convert")
+NI_STATS_EOF
+fi
+
+echo "NeuroInsight job completed with exit code $PIPELINE_EXIT"
+exit $PIPELINE_EXIT
+"""
+
+
+def _required_literal(marker: str) -> Optional[str]:
+    """Longest substring every match of ``marker`` must contain, if easy to tell.
+
+    Handles plain literals and literals joined by ``.*``; anything else
+    (alternation, classes, escapes) returns None.
+    """
+    pieces = marker.split(".*")
+    if any(_REGEX_META.intersection(piece) for piece in pieces):
+        return None
+    return max(pieces, key=len) or None
 
-def _shell_value(value):
-    """Render a param for a shell template: Python bools -> lowercase true/false
-    (templates test `[ "{flag}" = "true" ]`; str(True) is "True" and would fail)."""
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    return str(value)
+
+@lru_cache(maxsize=128)
+def _compiled_milestones(plugin_id: str) -> tuple:
+    """A plugin's phase milestones as ``(pattern, anchor, pct, label)``, highest pct first.
+
+    ``anchor`` is a literal that must appear in the log for the milestone
+    to match, checked before running the regex. ``pattern`` is None when
+    the anchor alone decides: plain-literal markers, and markers that are
+    not valid regexes (matched as substrings).
+    """
+    compiled = []
+    for marker, pct, label in get_milestones(plugin_id):
+        anchor = _required_literal(marker)
+        if anchor == marker:
+            pattern = None
+        else:
+            try:
+                pattern = re.compile(marker)
+            except re.error:
+                pattern, anchor = None, marker
+        compiled.append((pattern, anchor, pct, label))
+    # Stable sort keeps list order among equal percentages
+    return tuple(sorted(compiled, key=lambda m: m[2], reverse=True))
+
+
+@dataclass(slots=True)
+class _JobEntry:
+    """Locally tracked state of a submitted SLURM job."""
+    job_id: str
+    slurm_id: str = ""
+    status: JobStatus = JobStatus.UNKNOWN
+    job_dir: str = ""
+    script_path: str = ""
+    submitted_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    exit_code: Optional[int] = None
+    error_message: Optional[str] = None
+    progress: int = 0
+    current_phase: str = ""
+    log_offset: int = 0
+    pipeline_name: str = ""
+    container_image: str = ""
+    plugin_id: Optional[str] = None
 
 
 class SLURMBackend(ExecutionBackend):
@@ -103,9 +315,21 @@ class SLURMBackend(ExecutionBackend):
 
         # SSH connection
         self._ssh = ssh_manager or get_ssh_manager()
+        # Live queue states from one streaming squeue, shared with the API's
+        # progress poller when both use the global SSH manager
+        self._squeue = SqueueWatcher(ssh_manager) if ssh_manager else get_squeue_watcher()
 
         # Local job tracking (supplementary to DB)
-        self._jobs: Dict[str, dict] = {}
+        self._jobs: Dict[str, _JobEntry] = {}
+        # job_id -> SLURM ID for jobs found only in the DB (e.g. after a restart)
+        self._slurm_id_cache: Dict[str, str] = {}
+        # slurm_id -> (monotonic fetch time, parsed sacct record)
+        self._sacct_cache: Dict[str, Tuple[float, dict]] = {}
+        self._sacct_lock = threading.Lock()
+        # "fs"/"meld" -> local license path, once found (see _local_license)
+        self._local_licenses: Dict[str, str] = {}
+        # Shared remote copy of stats_converter.py ("" = not available locally)
+        self._converter_remote: Optional[str] = None
 
         logger.info(
             f"SLURMBackend initialized: {ssh_user}@{ssh_host}, "
@@ -160,7 +384,11 @@ class SLURMBackend(ExecutionBackend):
         base = str(PurePosixPath(self.work_dir)).rstrip("/")
         if base.endswith("/neuroinsight"):
             return base
-        return str(PurePosixPath(base) / "neuroinsight")
+        return f"{base}/neuroinsight"
+
+    def _job_dir(self, job_id: str) -> str:
+        """Remote working directory of a job (paths on the HPC are POSIX)."""
+        return f"{self._hpc_neuroinsight_root()}/jobs/{job_id}"
 
     # ------------------------------------------------------------------
     # Connection helpers
@@ -195,10 +423,42 @@ class SLURMBackend(ExecutionBackend):
         except SSHConnectionError as e:
             raise BackendUnavailableError(f"SSH command failed: {e}")
 
+    def _ssh_exec_ec(self, command: str, timeout: int = 60) -> Tuple[int, str]:
+        """Execute command via SSH and return ``(exit_code, stdout)``.
+
+        For probes (``test -d``, ``command -v``) where the exit status is the
+        answer; never raises on a non-zero exit.
+        """
+        self._ensure_ssh()
+        try:
+            exit_code, stdout, _ = self._ssh.execute(command, timeout=timeout)
+            return exit_code, stdout
+        except SSHConnectionError as e:
+            raise BackendUnavailableError(f"SSH command failed: {e}")
+
+    def _ssh_exec_multi_ec(self, cmds: List[str], timeout: int = 60) -> List[Tuple[int, str]]:
+        """Run independent commands in one SSH exec.
+
+        Each command runs in its own subshell. Returns ``(exit_code, stdout)``
+        per command, in order; commands that never reported (e.g. the exec
+        timed out) get ``(-1, "")``.
+        """
+        script = "".join(f"({cmd}); printf '\\n{_EXEC_SEP} %d\\n' $?; " for cmd in cmds)
+        _, stdout = self._ssh_exec_ec(script, timeout=timeout)
+        # [out0, ec0, out1, ec1, ..., trailing]
+        parts = _EXEC_SEP_RE.split(stdout)
+        results = [(int(parts[i + 1]), parts[i]) for i in range(0, len(parts) - 1, 2)]
+        results = results[:len(cmds)]
+        return results + [(-1, "")] * (len(cmds) - len(results))
+
+    def _ssh_exec_multi(self, cmds: List[str], timeout: int = 60) -> List[str]:
+        """Like :meth:`_ssh_exec_multi_ec` but returns stdout only (``check=False``)."""
+        return [out for _, out in self._ssh_exec_multi_ec(cmds, timeout=timeout)]
+
     def _remote_path_exists(self, path: str) -> bool:
         """Check whether a path exists on the HPC host."""
-        out = self._ssh_exec(f'test -e "{path}" && echo yes || echo no', check=False, timeout=20)
-        return "yes" in out
+        exit_code, _ = self._ssh_exec_ec(f'test -e "{path}"', timeout=20)
+        return exit_code == 0
 
     def _remote_dir_nonempty(self, path: str) -> bool:
         """Check whether a directory exists and is non-empty on the HPC host."""
@@ -335,8 +595,8 @@ class SLURMBackend(ExecutionBackend):
         Steps:
         1. Generate sbatch script from plugin command template
         2. Create working directory on HPC
-        3. Upload sbatch script via SFTP
-        4. Execute sbatch and parse SLURM job ID
+        3. Write sbatch script + job spec and run sbatch in one SSH exec
+        4. Parse SLURM job ID
         5. Track job in local state + database
         """
         if job_id is None:
@@ -346,9 +606,8 @@ class SLURMBackend(ExecutionBackend):
         self._resolve_work_dir()
 
         # Create remote working directory
-        job_dir = str(PurePosixPath(self._hpc_neuroinsight_root()) / "jobs" / job_id)
-        for sub in ("scripts", "logs", "inputs", "outputs/native", "outputs/bundle", "outputs/logs"):
-            self._ssh_exec(f"mkdir -p {job_dir}/{sub}")
+        job_dir = self._job_dir(job_id)
+        self._ssh_exec("mkdir -p " + " ".join(shlex.quote(f"{job_dir}/{sub}") for sub in JOB_SUBDIRS))
 
         # Symlink input files into the job inputs directory, renaming to match
         # the names expected by the command template (e.g. T1w.nii.gz).
@@ -358,7 +617,6 @@ class SLURMBackend(ExecutionBackend):
         command_template = ""
         workflow_step_info: List[dict] = []
         try:
-            from backend.core.plugin_registry import get_plugin_workflow_registry
             registry = get_plugin_workflow_registry()
 
             workflow_steps = spec.parameters.get("_workflow_steps", [])
@@ -379,21 +637,19 @@ class SLURMBackend(ExecutionBackend):
                         "Workflow %s: %d steps with separate containers",
                         spec.pipeline_name, len(workflow_step_info),
                     )
-            else:
-                plugin = registry.get_plugin(spec.plugin_id) if spec.plugin_id else None
-                if plugin:
-                    command_template = plugin.command_template or plugin.command
+            elif spec.plugin_id:
+                command_template = get_command_template(spec.plugin_id)
         except Exception as e:
             logger.debug(f"Could not load plugin registry for command template: {e}")
 
-        # Generate and upload sbatch script
+        # Generate sbatch script
         sbatch_script = self._generate_sbatch_script(
             spec, job_id, job_dir, command_template, workflow_step_info,
         )
         script_path = f"{job_dir}/scripts/run.sh"
-        self._ssh.write_file(script_path, sbatch_script, mode=0o755)
 
-        # Save job spec for audit trail
+        # Save job spec for audit trail (compact: machine-read, pipe through
+        # `python -m json.tool` to inspect by hand)
         spec_json = json.dumps({
             "job_id": job_id,
             "pipeline_name": spec.pipeline_name,
@@ -408,31 +664,18 @@ class SLURMBackend(ExecutionBackend):
             },
             "plugin_id": spec.plugin_id,
             "workflow_id": spec.workflow_id,
-        }, indent=2)
-        self._ssh.write_file(f"{job_dir}/scripts/job_spec.json", spec_json)
+        })
 
-        # Upload stats_converter.py for post-container CSV generation
-        try:
-            converter_path = Path(__file__).parent.parent / "services" / "stats_converter.py"
-            if converter_path.exists():
-                self._ssh.write_file(
-                    f"{job_dir}/scripts/stats_converter.py",
-                    converter_path.read_text(encoding="utf-8"),
-                )
-                logger.debug("Uploaded stats_converter.py to HPC for job %s", job_id[:8])
-        except Exception as e:
-            logger.debug("Could not upload stats_converter.py: %s", e)
-
-        # Submit via sbatch (use absolute path — sbatch may not expand ~ in the path)
+        # Write the script and spec, copy in stats_converter.py for post-container
+        # CSV generation, and sbatch -- all in one SSH round trip.
+        submit_cmd = self._build_submit_command(
+            script_path, sbatch_script, spec_json, self._stage_stats_converter(),
+        )
         try:
-            abs_script = self._ssh_exec(
-                f'readlink -f "{script_path}" 2>/dev/null || realpath "{script_path}" 2>/dev/null || echo "{script_path}"',
-                check=False,
-                timeout=30,
-            ).strip()
-            if not abs_script.startswith("/"):
-                abs_script = script_path
-            stdout = self._ssh_exec(f'sbatch "{abs_script}"')
+            self._ensure_ssh()
+            exit_code, stdout, stderr = self._ssh.execute(submit_cmd, timeout=60)
+            if exit_code != 0:
+                raise ExecutionError(f"exit {exit_code}: {stderr[:500]}")
             slurm_job_id = self._parse_slurm_job_id(stdout)
             logger.info(f"Submitted job {job_id[:8]} -> SLURM {slurm_job_id}")
         except Exception as e:
@@ -440,31 +683,21 @@ class SLURMBackend(ExecutionBackend):
 
         # Track locally (include spec metadata for get_job_info/progress lookup)
         now = datetime.utcnow()
-        self._jobs[job_id] = {
-            "job_id": job_id,
-            "slurm_id": slurm_job_id,
-            "status": JobStatus.PENDING,
-            "job_dir": job_dir,
-            "script_path": script_path,
-            "submitted_at": now,
-            "started_at": None,
-            "completed_at": None,
-            "exit_code": None,
-            "error_message": None,
-            "progress": 0,
-            "current_phase": "Queued in SLURM",
-            "spec": {
-                "pipeline_name": spec.pipeline_name,
-                "container_image": spec.container_image,
-                "plugin_id": spec.plugin_id,
-            },
-        }
+        self._jobs[job_id] = _JobEntry(
+            job_id=job_id,
+            slurm_id=slurm_job_id,
+            status=JobStatus.PENDING,
+            job_dir=job_dir,
+            script_path=script_path,
+            submitted_at=now,
+            current_phase="Queued in SLURM",
+            pipeline_name=spec.pipeline_name,
+            container_image=spec.container_image,
+            plugin_id=spec.plugin_id,
+        )
 
         # Create DB record
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             job_model = Job.from_spec(job_id, "slurm", spec)
             job_model.backend_job_id = slurm_job_id
             job_model.output_dir = f"{job_dir}/outputs"
@@ -482,37 +715,73 @@ class SLURMBackend(ExecutionBackend):
         if not slurm_id:
             raise JobNotFoundError(f"Job {job_id} not found")
 
-        # Try squeue first (for running/pending jobs)
-        try:
-            stdout = self._ssh_exec(
-                f"squeue -j {slurm_id} --noheader -o '%T' 2>/dev/null || true",
-                check=False,
-            )
-            status_str = stdout.strip()
-            if status_str:
-                return self._parse_slurm_status(status_str)
-        except Exception as e:
-            logger.debug("squeue status query failed for %s: %s", slurm_id, e)
+        # squeue (running/pending) and sacct (finished) in one round trip,
+        # falling back to the local cache
+        status = self.get_job_statuses([job_id]).get(job_id)
+        if status is None:
+            raise JobNotFoundError(f"Cannot determine status for job {job_id}")
+        return status
 
-        # Fall back to sacct (for completed/failed jobs)
-        try:
-            stdout = self._ssh_exec(
-                f"sacct -j {slurm_id} --noheader --format=State -P 2>/dev/null | head -1",
-                check=False,
-            )
-            status_str = stdout.strip().split("+")[0]  # Handle "CANCELLED+" etc.
-            if " " in status_str:
-                status_str = status_str.split()[0]  # Handle "CANCELLED by UID"
-            if status_str:
-                return self._parse_slurm_status(status_str)
-        except Exception as e:
-            logger.debug(f"sacct status query failed for {slurm_id}: {e}")
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, JobStatus]:
+        """Query the status of several jobs with one squeue and one sacct call.
 
-        # Check local cache
-        if job_id in self._jobs:
-            return self._jobs[job_id]["status"]
+        Live squeue states take precedence over sacct records. Jobs SLURM no
+        longer reports fall back to the local cache; jobs with no status at
+        all are omitted.
+
+        Args:
+            job_ids: Internal job identifiers
 
-        raise JobNotFoundError(f"Cannot determine status for job {job_id}")
+        Returns:
+            Dict of job_id -> JobStatus
+        """
+        job_by_slurm_id: Dict[str, str] = {}
+        for job_id in job_ids:
+            slurm_id = self._get_slurm_id(job_id)
+            if slurm_id:
+                job_by_slurm_id[slurm_id] = job_id
+
+        statuses: Dict[str, JobStatus] = {
+            job_by_slurm_id[slurm_id]: record["status"]
+            for slurm_id, record in self._cached_sacct(job_by_slurm_id).items()
+            if "status" in record
+        }
+        stale = [sid for sid, job_id in job_by_slurm_id.items() if job_id not in statuses]
+        queued = self._squeue.states() if stale else None
+        if queued is not None:
+            # Live queue mirror: queued jobs are answered from it; anything
+            # missing has left the queue, so only sacct knows its outcome
+            for sid in stale:
+                if sid in queued:
+                    statuses[job_by_slurm_id[sid]] = self._parse_slurm_status(queued[sid])
+            gone = [sid for sid in stale if sid not in queued]
+            for slurm_id, record in self._query_sacct_bulk(gone).items():
+                if "status" in record:
+                    statuses[job_by_slurm_id[slurm_id]] = record["status"]
+        elif stale:
+            id_list = ",".join(stale)
+            try:
+                squeue_out, sacct_out = self._ssh_exec_multi([
+                    f"squeue -j {id_list} --noheader -o '%i|%T' 2>/dev/null",
+                    f"sacct -j {id_list} --noheader -P --format={_SACCT_FORMAT} 2>/dev/null",
+                ])
+            except Exception as e:
+                logger.debug("Batched SLURM status query failed: %s", e)
+                squeue_out = sacct_out = ""
+            for line in squeue_out.splitlines():
+                slurm_id, _, state = line.partition("|")
+                job_id = job_by_slurm_id.get(slurm_id.strip())
+                if job_id and state.strip():
+                    statuses[job_id] = self._parse_slurm_status(state.split()[0])
+            for slurm_id, record in self._store_sacct(sacct_out, set(stale)).items():
+                job_id = job_by_slurm_id[slurm_id]
+                if job_id not in statuses and "status" in record:
+                    statuses[job_id] = record["status"]
+
+        for job_id in job_ids:
+            if job_id not in statuses and job_id in self._jobs:
+                statuses[job_id] = self._jobs[job_id].status
+        return statuses
 
     def get_job_info(self, job_id: str) -> JobInfo:
         """Get detailed SLURM job information from sacct."""
@@ -522,13 +791,13 @@ class SLURMBackend(ExecutionBackend):
 
         # Query sacct for detailed info
         info = self._query_sacct(slurm_id)
-        local = self._jobs.get(job_id, {})
+        local = self._jobs.get(job_id) or _JobEntry(job_id)
 
-        status = info.get("status", local.get("status", JobStatus.UNKNOWN))
+        status = info.get("status", local.status)
 
         # Parse progress from log file
-        progress = local.get("progress", 0)
-        current_phase = local.get("current_phase", "")
+        progress = local.progress
+        current_phase = local.current_phase
         if status == JobStatus.RUNNING:
             try:
                 progress, current_phase = self._parse_progress(job_id)
@@ -538,17 +807,17 @@ class SLURMBackend(ExecutionBackend):
         return JobInfo(
             job_id=job_id,
             status=status,
-            pipeline_name=local.get("spec", {}).get("pipeline_name", ""),
-            container_image=local.get("spec", {}).get("container_image", ""),
+            pipeline_name=local.pipeline_name,
+            container_image=local.container_image,
             backend_job_id=slurm_id,
             progress=progress,
             current_phase=current_phase,
-            submitted_at=local.get("submitted_at"),
-            started_at=info.get("start_time") or local.get("started_at"),
-            completed_at=info.get("end_time") or local.get("completed_at"),
-            exit_code=info.get("exit_code") or local.get("exit_code"),
-            error_message=local.get("error_message"),
-            output_dir=local.get("job_dir", ""),
+            submitted_at=local.submitted_at,
+            started_at=info.get("start_time") or local.started_at,
+            completed_at=info.get("end_time") or local.completed_at,
+            exit_code=info.get("exit_code") or local.exit_code,
+            error_message=local.error_message,
+            output_dir=local.job_dir,
         )
 
     def cancel_job(self, job_id: str) -> bool:
@@ -560,16 +829,15 @@ class SLURMBackend(ExecutionBackend):
         try:
             self._ssh_exec(f"scancel {slurm_id}")
             logger.info(f"Cancelled SLURM job {slurm_id} (job {job_id[:8]})")
+            self._invalidate_sacct(slurm_id)
 
-            if job_id in self._jobs:
-                self._jobs[job_id]["status"] = JobStatus.CANCELLED
-                self._jobs[job_id]["completed_at"] = datetime.utcnow()
+            local = self._jobs.get(job_id)
+            if local is not None:
+                local.status = JobStatus.CANCELLED
+                local.completed_at = datetime.utcnow()
 
             # Update DB
             try:
-                from backend.core.database import get_db_context
-                from backend.models.job import Job
-
                 with get_db_context() as db:
                     job = db.query(Job).filter_by(id=job_id).first()
                     if job:
@@ -584,19 +852,22 @@ class SLURMBackend(ExecutionBackend):
             logger.error(f"Failed to cancel SLURM job {slurm_id}: {e}")
             return False
 
-    def get_job_logs(self, job_id: str) -> JobLogs:
-        """Retrieve job logs from HPC via SFTP."""
-        local = self._jobs.get(job_id, {})
-        job_dir = local.get("job_dir", "")
-        slurm_id = local.get("slurm_id", "")
+    def get_job_logs(self, job_id: str, full: bool = False) -> JobLogs:
+        """Retrieve job logs from the HPC.
+
+        Args:
+            job_id: Internal job identifier
+            full: Return whole log files instead of their last LOG_TAIL_BYTES
+        """
+        local = self._jobs.get(job_id) or _JobEntry(job_id)
+        job_dir = local.job_dir
+        slurm_id = local.slurm_id
         stdout = ""
         stderr = ""
 
         if not job_dir:
             # Try to reconstruct from DB
             try:
-                from backend.core.database import get_db_context
-                from backend.models.job import Job
                 with get_db_context() as db:
                     job = db.query(Job).filter_by(id=job_id).first()
                     if job and job.output_dir:
@@ -608,41 +879,27 @@ class SLURMBackend(ExecutionBackend):
         if not job_dir:
             raise JobNotFoundError(f"Job {job_id} not found or no job directory")
 
-        self._ensure_ssh()
-
-        # Read SLURM output file
-        stdout_path = f"{job_dir}/logs/slurm-{slurm_id}.out"
-        stderr_path = f"{job_dir}/logs/slurm-{slurm_id}.err"
-
-        try:
-            if self._ssh.file_exists(stdout_path):
-                stdout = self._ssh.read_file(stdout_path)
-        except Exception as e:
-            logger.debug(f"Could not read stdout log: {e}")
-
+        # SLURM output files plus the container log (used when the SLURM
+        # stdout is empty), fetched in one round trip
+        read = "cat" if full else f"tail -c {LOG_TAIL_BYTES}"
+        log_paths = (
+            f"{job_dir}/logs/slurm-{slurm_id}.out",
+            f"{job_dir}/logs/slurm-{slurm_id}.err",
+            f"{job_dir}/outputs/logs/container.log",
+        )
         try:
-            if self._ssh.file_exists(stderr_path):
-                stderr = self._ssh.read_file(stderr_path)
+            stdout, stderr, container_log = self._ssh_exec_multi(
+                [f"{read} {shlex.quote(path)} 2>/dev/null" for path in log_paths]
+            )
+            stdout = stdout or container_log
         except Exception as e:
-            logger.debug(f"Could not read stderr log: {e}")
-
-        # Also try container log
-        if not stdout:
-            container_log = f"{job_dir}/outputs/logs/container.log"
-            try:
-                if self._ssh.file_exists(container_log):
-                    stdout = self._ssh.read_file(container_log)
-            except Exception as e:
-                logger.debug(f"Could not read container log for job {job_id[:8]}: {e}")
+            logger.debug(f"Could not read logs for job {job_id[:8]}: {e}")
 
         return JobLogs(job_id=job_id, stdout=stdout, stderr=stderr)
 
     def list_jobs(self, status_filter: Optional[List[str]] = None, limit: int = 100) -> List[JobInfo]:
         """List jobs from database with optional SLURM status refresh."""
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
-
             with get_db_context() as db:
                 query = db.query(Job).filter(
                     Job.deleted == False,
@@ -651,22 +908,31 @@ class SLURMBackend(ExecutionBackend):
                 if status_filter:
                     query = query.filter(Job.status.in_(status_filter))
                 query = query.order_by(Job.submitted_at.desc()).limit(limit)
+                rows = query.all()
+
+                # One batched sacct refresh for jobs the DB still has as active
+                active_ids = [
+                    job.backend_job_id for job in rows
+                    if job.status in (JobStatus.PENDING.value, JobStatus.RUNNING.value)
+                ]
+                live = self._query_sacct_bulk(active_ids) if active_ids else {}
 
                 jobs = []
-                for job in query.all():
-                    status = self._parse_slurm_status(job.status.upper()) if job.status else JobStatus.UNKNOWN
+                for job in rows:
+                    status = _SLURM_STATUS_MAP.get(job.status.upper(), JobStatus.UNKNOWN) if job.status else JobStatus.UNKNOWN
+                    sacct = live.get(job.backend_job_id, {})
                     jobs.append(JobInfo(
                         job_id=job.id,
-                        status=status,
+                        status=sacct.get("status", status),
                         pipeline_name=job.pipeline_name or "",
                         container_image=job.container_image or "",
                         backend_job_id=job.backend_job_id,
                         progress=job.progress or 0,
                         current_phase=job.current_phase,
                         submitted_at=job.submitted_at,
-                        started_at=job.started_at,
-                        completed_at=job.completed_at,
-                        exit_code=job.exit_code,
+                        started_at=sacct.get("start_time") or job.started_at,
+                        completed_at=sacct.get("end_time") or job.completed_at,
+                        exit_code=sacct.get("exit_code") or job.exit_code,
                         error_message=job.error_message,
                         output_dir=job.output_dir,
                     ))
@@ -677,8 +943,8 @@ class SLURMBackend(ExecutionBackend):
 
     def cleanup_job(self, job_id: str) -> bool:
         """Clean up job files on HPC."""
-        local = self._jobs.get(job_id, {})
-        job_dir = local.get("job_dir", "")
+        local = self._jobs.get(job_id)
+        job_dir = local.job_dir if local else ""
 
         if not job_dir:
             return False
@@ -686,11 +952,11 @@ class SLURMBackend(ExecutionBackend):
         try:
             self._ssh_exec(f"rm -rf {job_dir}")
             self._jobs.pop(job_id, None)
+            self._slurm_id_cache.pop(job_id, None)
+            self._invalidate_sacct(local.slurm_id)
 
             # Soft-delete DB record
             try:
-                from backend.core.database import get_db_context
-                from backend.models.job import Job
                 with get_db_context() as db:
                     job = db.query(Job).filter_by(id=job_id).first()
                     if job:
@@ -728,78 +994,74 @@ class SLURMBackend(ExecutionBackend):
 
         result["details"]["ssh_connected"] = True
 
-        # Check SLURM availability
+        # Probe SLURM, partitions, container runtimes and the work dir in
+        # one round trip
+        alt = "apptainer" if self.container_runtime == "singularity" else "singularity"
         try:
-            version_out = self._ssh_exec("sinfo --version 2>/dev/null || echo 'not found'", check=False)
-            if "not found" in version_out:
-                result["message"] = "SLURM not available on remote host"
-                result["details"]["slurm_available"] = False
-                return result
-
-            result["details"]["slurm_version"] = version_out.strip()
-            result["details"]["slurm_available"] = True
+            (
+                (version_ec, version_out),
+                (_, partitions_out),
+                (runtime_ec, _),
+                (alt_ec, _),
+                (work_dir_ec, _),
+            ) = self._ssh_exec_multi_ec([
+                "sinfo --version 2>/dev/null",
+                "sinfo --noheader -o '%P %a %l %D' 2>/dev/null",
+                f"command -v {self.container_runtime} >/dev/null",
+                f"command -v {alt} >/dev/null",
+                f"test -d {self.work_dir}",
+            ])
         except Exception as e:
             result["message"] = f"Cannot check SLURM: {e}"
             return result
 
+        # Check SLURM availability
+        if version_ec != 0:
+            result["message"] = "SLURM not available on remote host"
+            result["details"]["slurm_available"] = False
+            return result
+
+        result["details"]["slurm_version"] = version_out.strip()
+        result["details"]["slurm_available"] = True
+
         # Check partition exists
-        try:
-            partitions_out = self._ssh_exec(
-                "sinfo --noheader -o '%P %a %l %D' 2>/dev/null", check=False
-            )
-            partitions = []
-            for line in partitions_out.strip().split("\n"):
-                parts = line.split()
-                if parts:
-                    name = parts[0].rstrip("*")
-                    partitions.append({
-                        "name": name,
-                        "available": parts[1] if len(parts) > 1 else "unknown",
-                        "timelimit": parts[2] if len(parts) > 2 else "unknown",
-                        "nodes": parts[3] if len(parts) > 3 else "unknown",
-                    })
-            result["details"]["partitions"] = partitions
-
-            partition_names = [p["name"] for p in partitions]
-            if self.partition not in partition_names:
-                result["message"] = f"Partition '{self.partition}' not found. Available: {', '.join(partition_names)}"
-                result["details"]["partition_valid"] = False
-                return result
-
-            result["details"]["partition_valid"] = True
-        except Exception as e:
-            logger.debug(f"Could not fetch partition info for health check: {e}")
+        partitions = []
+        for line in partitions_out.strip().split("\n"):
+            parts = line.split()
+            if parts:
+                name = parts[0].rstrip("*")
+                partitions.append({
+                    "name": name,
+                    "available": parts[1] if len(parts) > 1 else "unknown",
+                    "timelimit": parts[2] if len(parts) > 2 else "unknown",
+                    "nodes": parts[3] if len(parts) > 3 else "unknown",
+                })
+        result["details"]["partitions"] = partitions
+
+        partition_names = [p["name"] for p in partitions]
+        if self.partition not in partition_names:
+            result["message"] = f"Partition '{self.partition}' not found. Available: {', '.join(partition_names)}"
+            result["details"]["partition_valid"] = False
+            return result
+
+        result["details"]["partition_valid"] = True
 
         # Check container runtime (with auto-fallback)
-        try:
-            runtime_out = self._ssh_exec(
-                f"which {self.container_runtime} 2>/dev/null || echo 'not found'",
-                check=False,
+        runtime_available = runtime_ec == 0
+        result["details"]["container_runtime"] = self.container_runtime
+        result["details"]["container_runtime_available"] = runtime_available
+        if not runtime_available and alt_ec == 0:
+            logger.info(
+                f"Container runtime '{self.container_runtime}' not found on HPC, "
+                f"auto-switching to '{alt}'"
             )
-            runtime_available = "not found" not in runtime_out
-            result["details"]["container_runtime"] = self.container_runtime
-            result["details"]["container_runtime_available"] = runtime_available
-            if not runtime_available:
-                alt = "apptainer" if self.container_runtime == "singularity" else "singularity"
-                alt_out = self._ssh_exec(f"which {alt} 2>/dev/null || echo 'not found'", check=False)
-                if "not found" not in alt_out:
-                    logger.info(
-                        f"Container runtime '{self.container_runtime}' not found on HPC, "
-                        f"auto-switching to '{alt}'"
-                    )
-                    self.container_runtime = alt
-                    result["details"]["container_runtime"] = alt
-                    result["details"]["container_runtime_available"] = True
-                    result["details"]["container_runtime_switched"] = True
-        except Exception as e:
-            logger.debug("Could not check container runtime: %s", e)
+            self.container_runtime = alt
+            result["details"]["container_runtime"] = alt
+            result["details"]["container_runtime_available"] = True
+            result["details"]["container_runtime_switched"] = True
 
         # Check work directory
-        try:
-            self._ssh_exec(f"test -d {self.work_dir} && echo 'exists'", check=False)
-            result["details"]["work_dir_accessible"] = True
-        except Exception:
-            result["details"]["work_dir_accessible"] = False
+        result["details"]["work_dir_accessible"] = work_dir_ec == 0
 
         result["healthy"] = True
         result["message"] = f"Connected to {self.ssh_host} (SLURM {result['details'].get('slurm_version', 'OK')})"
@@ -914,7 +1176,6 @@ class SLURMBackend(ExecutionBackend):
         expected_inputs: list[tuple[str, str]] = []
         expected_names: list[str] = []
         try:
-            from backend.core.plugin_registry import get_plugin_workflow_registry
             registry = get_plugin_workflow_registry()
 
             plugin_ids_to_check: list[str] = []
@@ -1179,21 +1440,98 @@ class SLURMBackend(ExecutionBackend):
                 except Exception as e:
                     logger.warning("Failed to upload %s: %s", item, e)
 
+    def _local_license(self, kind: str) -> Optional[str]:
+        """Local FreeSurfer ("fs") or MELD ("meld") license path.
+
+        Resolving probes several well-known locations, so a found path is
+        remembered. A miss is re-checked next time, so a license uploaded
+        through Settings after startup is still picked up.
+        """
+        path = self._local_licenses.get(kind)
+        if path is None:
+            settings = get_settings()
+            path = settings.fs_license_resolved if kind == "fs" else settings.meld_license_resolved
+            if path:
+                self._local_licenses[kind] = path
+        return path
+
+    def _stage_stats_converter(self) -> Optional[str]:
+        """Upload stats_converter.py to a shared HPC location once per backend.
+
+        Returns the remote path, or None if the converter is unavailable.
+        Jobs copy it into their own scripts dir at submit time.
+        """
+        if self._converter_remote is not None:
+            return self._converter_remote or None
+        remote = f"{self._hpc_neuroinsight_root()}/scripts/stats_converter.py"
+        try:
+            converter_path = Path(__file__).parent.parent / "services" / "stats_converter.py"
+            if not converter_path.exists():
+                self._converter_remote = ""
+                return None
+            self._ssh.write_file(remote, converter_path.read_text(encoding="utf-8"))
+            logger.debug("Uploaded stats_converter.py to %s", remote)
+        except Exception as e:
+            # Retry on the next submission
+            logger.debug("Could not upload stats_converter.py: %s", e)
+            return None
+        self._converter_remote = remote
+        return remote
+
+    @staticmethod
+    def _build_submit_command(
+        script_path: str, sbatch_script: str, spec_json: str, converter: Optional[str],
+    ) -> str:
+        """Shell script that writes run.sh and job_spec.json, then runs sbatch.
+
+        Files are written through quoted heredocs, so their content is not
+        expanded. The sentinel is random per call so it cannot collide with
+        the content (the sbatch script embeds heredocs of its own).
+        """
+        eof = f"NI_EOF_{secrets.token_hex(8)}"
+        while eof in sbatch_script or eof in spec_json:
+            eof = f"NI_EOF_{secrets.token_hex(8)}"
+        scripts_dir = str(PurePosixPath(script_path).parent)
+        script_q = shlex.quote(script_path)
+
+        def heredoc(path: str, content: str) -> str:
+            if not content.endswith("\n"):
+                content += "\n"
+            return f"cat > {shlex.quote(path)} <<'{eof}'\n{content}{eof}\n"
+
+        parts = [
+            "set -e\n",
+            heredoc(script_path, sbatch_script),
+            f"chmod 755 {script_q}\n",
+            heredoc(f"{scripts_dir}/job_spec.json", spec_json),
+        ]
+        if converter:
+            parts.append(f"cp {shlex.quote(converter)} {shlex.quote(scripts_dir)}/ 2>/dev/null || true\n")
+        # Absolute path: sbatch may not expand ~ in the path
+        parts.append(
+            f'sbatch "$(readlink -f {script_q} 2>/dev/null || realpath {script_q} 2>/dev/null '
+            f'|| echo {script_q})"\n'
+        )
+        return "".join(parts)
+
     def _ensure_bids_description(self, bids_dir: str) -> None:
         """Create a minimal dataset_description.json if missing from a BIDS dir."""
         desc_path = f"{bids_dir}/dataset_description.json"
+        desc_json = json.dumps({
+            "Name": PurePosixPath(bids_dir).name,
+            "BIDSVersion": "1.6.0",
+            "DatasetType": "raw",
+            "GeneratedBy": [{"Name": "NeuroInsight Research"}],
+        })
+        desc_q = shlex.quote(desc_path)
+        # Check and write in one round trip
         try:
-            exit_code, stdout, _ = self._ssh.execute(
-                f'test -f "{desc_path}" && echo EXISTS || echo MISSING', timeout=5
+            _, out = self._ssh_exec_ec(
+                f"test -f {desc_q} || {{ printf '%s' {shlex.quote(desc_json)} > {desc_q} "
+                f"&& chmod 644 {desc_q} && echo created; }}",
+                timeout=10,
             )
-            if stdout.strip() == "MISSING":
-                desc_json = json.dumps({
-                    "Name": PurePosixPath(bids_dir).name,
-                    "BIDSVersion": "1.6.0",
-                    "DatasetType": "raw",
-                    "GeneratedBy": [{"Name": "NeuroInsight Research"}],
-                })
-                self._ssh.write_file(desc_path, desc_json)
+            if out.strip() == "created":
                 logger.info("Created missing dataset_description.json in %s", bids_dir)
         except Exception as e:
             logger.warning("Could not ensure BIDS description in %s: %s", bids_dir, e)
@@ -1227,7 +1565,6 @@ class SLURMBackend(ExecutionBackend):
 
         # Plugin default parameters
         try:
-            from backend.core.plugin_registry import get_plugin_workflow_registry
             registry = get_plugin_workflow_registry()
 
             plugin_ids = spec.parameters.get("_workflow_steps", [])
@@ -1258,7 +1595,7 @@ class SLURMBackend(ExecutionBackend):
         # Auto-detect subject_id from BIDS paths (sub-XXXX pattern)
         if "subject_id" not in resolved and spec.input_files:
             for f in spec.input_files:
-                match = re.search(r"sub-([A-Za-z0-9]+)", f)
+                match = _SUBJECT_ID_RE.search(f)
                 if match:
                     resolved["subject_id"] = match.group(1)
                     logger.info("Auto-detected subject_id from path: %s", match.group(1))
@@ -1273,7 +1610,7 @@ class SLURMBackend(ExecutionBackend):
                         )
                         sub_dir = stdout.strip()
                         if sub_dir:
-                            match = re.search(r"sub-([A-Za-z0-9]+)", sub_dir)
+                            match = _SUBJECT_ID_RE.search(sub_dir)
                             if match:
                                 resolved["subject_id"] = match.group(1)
                                 logger.info("Auto-detected subject_id from BIDS directory listing: %s", match.group(1))
@@ -1310,7 +1647,6 @@ class SLURMBackend(ExecutionBackend):
         effective_cpus = res.cpus
         if workflow_steps:
             try:
-                from backend.core.plugin_registry import get_plugin_workflow_registry
                 registry = get_plugin_workflow_registry()
                 total_time = 0
                 max_mem = res.memory_gb
@@ -1336,91 +1672,37 @@ class SLURMBackend(ExecutionBackend):
             except Exception as e:
                 logger.debug("Could not compute workflow resources from steps: %s", e)
 
-        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", spec.pipeline_name[:20])
-        lines = [
-            "#!/bin/bash",
-            f"#SBATCH --job-name=ni-{safe_name}-{job_id[:8]}",
-            f"#SBATCH --partition={self.partition}",
-            f"#SBATCH --mem={effective_mem}G",
-            f"#SBATCH --cpus-per-task={effective_cpus}",
-            f"#SBATCH --time={effective_time}:00:00",
-            f"#SBATCH --output={job_dir}/logs/slurm-%j.out",
-            f"#SBATCH --error={job_dir}/logs/slurm-%j.err",
-        ]
-
+        safe_name = _UNSAFE_JOB_NAME_RE.sub("_", spec.pipeline_name[:20])
+        directives = []
         if self.account:
-            lines.append(f"#SBATCH --account={self.account}")
+            directives.append(f"#SBATCH --account={self.account}")
         if self.qos:
-            lines.append(f"#SBATCH --qos={self.qos}")
+            directives.append(f"#SBATCH --qos={self.qos}")
         if res.gpu:
-            lines.append("#SBATCH --gpus-per-node=1")
-
-        lines.append("")
-        lines.append("set -euo pipefail")
-        lines.append("")
-
-        # Load environment modules
+            directives.append("#SBATCH --gpus-per-node=1")
+        modules_block = ""
         if self.modules:
-            lines.append("# Load environment modules")
-            for mod in self.modules:
-                lines.append(f"module load {mod}")
-            lines.append("")
+            modules_block = "# Load environment modules\n" + "".join(
+                f"module load {mod}\n" for mod in self.modules
+            ) + "\n"
 
-        # Detect container runtime (auto-fallback singularity <-> apptainer)
-        lines.append("# Detect container runtime (prefer configured, fallback to alternative)")
-        lines.append(f'CONTAINER_RT=""')
-        lines.append(f'if command -v {self.container_runtime} &>/dev/null; then')
-        lines.append(f'    CONTAINER_RT="{self.container_runtime}"')
-        alt_runtime = "apptainer" if self.container_runtime == "singularity" else "singularity"
-        lines.append(f'elif command -v {alt_runtime} &>/dev/null; then')
-        lines.append(f'    CONTAINER_RT="{alt_runtime}"')
-        lines.append(f'    echo "WARNING: {self.container_runtime} not found, falling back to {alt_runtime}"')
-        lines.append(f'else')
-        lines.append(f'    # Try loading via module system')
-        lines.append(f'    module load {self.container_runtime} 2>/dev/null || module load {alt_runtime} 2>/dev/null || true')
-        lines.append(f'    if command -v {self.container_runtime} &>/dev/null; then')
-        lines.append(f'        CONTAINER_RT="{self.container_runtime}"')
-        lines.append(f'    elif command -v {alt_runtime} &>/dev/null; then')
-        lines.append(f'        CONTAINER_RT="{alt_runtime}"')
-        lines.append(f'    else')
-        lines.append(f'        echo "ERROR: Neither {self.container_runtime} nor {alt_runtime} found on this system"')
-        lines.append(f'        exit 1')
-        lines.append(f'    fi')
-        lines.append(f'fi')
-        lines.append(f'echo "Using container runtime: $CONTAINER_RT"')
-        lines.append("")
-
-        # Set environment variables
-        lines.append("# Job environment")
-        lines.append(f'export NEUROINSIGHT_JOB_ID="{job_id}"')
-        lines.append(f'export OMP_NUM_THREADS={res.cpus}')
-        lines.append(f'export ITK_GLOBAL_DEFAULT_NUMBER_OF_THREADS={res.cpus}')
-        lines.append("")
-
-        # Prepare bind mounts for Singularity/Apptainer
-        lines.append("# Prepare directories")
-        lines.append(f"mkdir -p {job_dir}/outputs/native {job_dir}/outputs/bundle {job_dir}/outputs/logs")
-        lines.append("")
-
-        # Build per-item input bind mounts to avoid Singularity nested-mount issues.
-        # Symlinks in inputs/ point to host paths invisible inside the container,
-        # so we mount each item individually instead of the parent directory.
-        lines.append("# Build per-item input bind mounts (resolves symlinks)")
-        # Use a bash array so paths with spaces (e.g. .../Sample Data/...) survive exec expansion.
-        lines.append("declare -a INPUT_BINDS_ARR=()")
-        lines.append(f'for item in {job_dir}/inputs/*; do')
-        lines.append('  [ -e "$item" ] || [ -L "$item" ] || continue')
-        lines.append('  name=$(basename "$item")')
-        lines.append('  if [ -L "$item" ]; then')
-        lines.append('    target=$(readlink -f "$item")')
-        lines.append('    INPUT_BINDS_ARR+=(--bind "$target:/data/inputs/$name:ro")')
-        lines.append('    echo "Input (resolved symlink): $target -> /data/inputs/$name"')
-        lines.append('  else')
-        lines.append('    INPUT_BINDS_ARR+=(--bind "$item:/data/inputs/$name:ro")')
-        lines.append('    echo "Input (direct): $item -> /data/inputs/$name"')
-        lines.append('  fi')
-        lines.append('done')
-        lines.append("")
+        lines = [
+            _SBATCH_HEADER_TEMPLATE.format_map({
+                "job_name": f"ni-{safe_name}-{job_id[:8]}",
+                "partition": self.partition,
+                "mem_gb": effective_mem,
+                "cpus": effective_cpus,
+                "time_hours": effective_time,
+                "job_dir": job_dir,
+                "directives": "".join(f"{d}\n" for d in directives),
+                "modules_block": modules_block,
+                "runtime": self.container_runtime,
+                "alt_runtime": "apptainer" if self.container_runtime == "singularity" else "singularity",
+                "job_id": job_id,
+                "threads": res.cpus,
+            }),
+            "",
+        ]
 
         # Build container command
         image = spec.container_image
@@ -1440,12 +1722,11 @@ class SLURMBackend(ExecutionBackend):
         # For HPC jobs, use explicit HPC paths if configured; otherwise upload
         # the local license file to the job directory on the HPC.
         try:
-            from backend.core.config import get_settings
             settings = get_settings()
 
             fs_hpc = settings.hpc_fs_license_path
             if not fs_hpc:
-                local_fs = settings.fs_license_resolved
+                local_fs = self._local_license("fs")
                 if local_fs and Path(local_fs).exists():
                     fs_hpc = f"{job_dir}/scripts/license.txt"
                     try:
@@ -1460,7 +1741,7 @@ class SLURMBackend(ExecutionBackend):
 
             meld_hpc = settings.hpc_meld_license_path
             if not meld_hpc:
-                local_meld = settings.meld_license_resolved
+                local_meld = self._local_license("meld")
                 if local_meld and Path(local_meld).exists():
                     meld_hpc = f"{job_dir}/scripts/meld_license.txt"
                     try:
@@ -1492,8 +1773,8 @@ class SLURMBackend(ExecutionBackend):
                         f"{self.work_dir}/freesurfer_mcr/MCRv97",
                     ]:
                         try:
-                            exit_code, out = self._ssh_exec(f"test -d {candidate} && echo yes || echo no")
-                            if exit_code == 0 and "yes" in out:
+                            exit_code, _ = self._ssh_exec_ec(f"test -d {candidate}")
+                            if exit_code == 0:
                                 mcr_path = candidate
                                 break
                         except Exception as e:
@@ -1536,7 +1817,6 @@ class SLURMBackend(ExecutionBackend):
             # baked assets are shadowed.
             deterministic_meld_image = False
             try:
-                from backend.core.plugin_registry import get_plugin_workflow_registry
                 registry = get_plugin_workflow_registry()
                 meld_plugin = registry.get_plugin("meld_graph")
                 meld_image = (meld_plugin.container_image or "") if meld_plugin else ""
@@ -1559,17 +1839,11 @@ class SLURMBackend(ExecutionBackend):
         binds_str = " ".join(f'--bind "{b}"' for b in bind_mounts)
         envs_str = " ".join(f"--env {k}={v}" for k, v in container_envs.items())
 
-        all_params = self._resolve_all_params(spec)
-        dangerous_chars = set(";|&`$(){}!><\n\r")
+        # Sanitised once; reused for every workflow step's template
+        param_values = shell_params(self._resolve_all_params(spec))
 
         def _substitute_params(template: str) -> str:
-            result = template
-            for key, value in all_params.items():
-                if not str(key).startswith("_"):
-                    safe_val = "".join(c for c in _shell_value(value) if c not in dangerous_chars)
-                    result = result.replace(f"{{{key}}}", safe_val)
-                    result = result.replace(f"${{{key}}}", safe_val)
-            return result
+            return fill_template(template, param_values)
 
         def _patch_single_plugin_nir_input_root_for_staging(script: str) -> str:
             """Inputs are mounted at /data/inputs/<basename>; templates must not use /data/inputs alone."""
@@ -1645,7 +1919,7 @@ class SLURMBackend(ExecutionBackend):
                         if not host_out:
                             continue
                         full_host_path = f"{job_dir}/outputs/{host_out}"
-                        for m in re.finditer(r'/data/inputs/(\w+)', cmd_script):
+                        for m in _DATA_INPUT_REF_RE.finditer(cmd_script):
                             input_name = m.group(1)
                             container_input = f"/data/inputs/{input_name}"
                             if (prev_pid in input_name
@@ -1797,36 +2071,10 @@ class SLURMBackend(ExecutionBackend):
             lines.append("set -e")
 
         lines.append("")
-        lines.append('echo "Pipeline exited with code $PIPELINE_EXIT"')
-        lines.append("")
-
-        # Post-container: generate stats CSVs if converter is available
-        lines.append("# Post-processing: generate stats CSVs")
-        lines.append(f'CONVERTER="{job_dir}/scripts/stats_converter.py"')
-        lines.append(f'OUTPUT_DIR="{job_dir}/outputs"')
-        pipeline_name_escaped = spec.pipeline_name.replace("'", "'\\''")
-        lines.append('if [ -f "$CONVERTER" ] && command -v python3 &>/dev/null; then')
-        lines.append('  echo "Generating stats CSVs..."')
-        lines.append("  python3 << 'NI_STATS_EOF'")
-        lines.append(f'import sys; sys.path.insert(0, "{job_dir}/scripts")')
-        lines.append('from stats_converter import FileProvider, generate_stats_csvs')
-        lines.append('from pathlib import Path')
-        lines.append(f'fp = FileProvider(local_dir="{job_dir}/outputs")')
-        lines.append(f'sheets = generate_stats_csvs("{pipeline_name_escaped}", fp)')
-        lines.append('if sheets:')
-        lines.append(f'    csv_dir = Path("{job_dir}/outputs/bundle/csv")')
-        lines.append('    csv_dir.mkdir(parents=True, exist_ok=True)')
-        lines.append('    for s in sheets:')
-        lines.append('        (csv_dir / s.filename).write_text(s.to_csv_string())')
-        lines.append('    print(f"Generated {len(sheets)} stats CSVs")')
-        lines.append('else:')
-        lines.append('    print("No stats to convert")')
-        lines.append('NI_STATS_EOF')
-        lines.append('fi')
-        lines.append("")
-        lines.append('echo "NeuroInsight job completed with exit code $PIPELINE_EXIT"')
-        lines.append('exit $PIPELINE_EXIT')
-        lines.append("")
+        lines.append(_SBATCH_FOOTER_TEMPLATE.format_map({
+            "job_dir": job_dir,
+            "pipeline_name": spec.pipeline_name.replace("'", "'\\''"),
+        }))
 
         return "\n".join(lines)
 
@@ -1834,15 +2082,18 @@ class SLURMBackend(ExecutionBackend):
         """Look up SLURM job ID from local cache or database."""
         # Check local cache
         if job_id in self._jobs:
-            return self._jobs[job_id].get("slurm_id")
+            return self._jobs[job_id].slurm_id
+        if job_id in self._slurm_id_cache:
+            return self._slurm_id_cache[job_id]
 
-        # Check database
+        # Check database (misses are not cached: the row may appear later)
         try:
-            from backend.core.database import get_db_context
-            from backend.models.job import Job
             with get_db_context() as db:
                 job = db.query(Job).filter_by(id=job_id).first()
                 if job and job.backend_job_id:
+                    if len(self._slurm_id_cache) >= SLURM_ID_CACHE_SIZE:
+                        self._slurm_id_cache.clear()
+                    self._slurm_id_cache[job_id] = job.backend_job_id
                     return job.backend_job_id
         except Exception as e:
             logger.debug(f"Could not look up slurm_id from DB for job {job_id[:8]}: {e}")
@@ -1851,100 +2102,172 @@ class SLURMBackend(ExecutionBackend):
 
     def _parse_slurm_job_id(self, sbatch_output: str) -> str:
         """Parse SLURM job ID from sbatch output."""
-        match = re.search(r"Submitted batch job (\d+)", sbatch_output)
+        match = _SBATCH_ID_RE.search(sbatch_output)
         if match:
             return match.group(1)
         raise ExecutionError(f"Failed to parse SLURM job ID from: {sbatch_output}")
     
     def _parse_slurm_status(self, status_str: str) -> JobStatus:
         """Map SLURM state string to JobStatus enum."""
-        status_map = {
-            "PENDING": JobStatus.PENDING,
-            "CONFIGURING": JobStatus.PENDING,
-            "RUNNING": JobStatus.RUNNING,
-            "COMPLETING": JobStatus.RUNNING,
-            "COMPLETED": JobStatus.COMPLETED,
-            "FAILED": JobStatus.FAILED,
-            "CANCELLED": JobStatus.CANCELLED,
-            "TIMEOUT": JobStatus.FAILED,
-            "OUT_OF_MEMORY": JobStatus.FAILED,
-            "NODE_FAIL": JobStatus.FAILED,
-            "PREEMPTED": JobStatus.FAILED,
-            "SUSPENDED": JobStatus.PENDING,
-        }
-        clean = status_str.strip().upper().split("+")[0]  # Handle "CANCELLED+"
-        return status_map.get(clean, JobStatus.UNKNOWN)
+        # Handle "CANCELLED+" and sacct's "CANCELLED by <uid>"
+        clean = status_str.strip().upper().partition(" ")[0].partition("+")[0]
+        return _SLURM_STATUS_MAP.get(clean, JobStatus.UNKNOWN)
 
-    def _query_sacct(self, slurm_id: str) -> dict:
-        """Query sacct for detailed job info."""
+    def _parse_sacct_fields(self, parts: List[str]) -> dict:
+        """Parse a ``JobID|State|ExitCode|Start|End[|...]`` sacct row."""
         info: dict = {}
+        if len(parts) < 5:
+            return info
+        _, state_raw, exit_raw, start_raw, end_raw = parts[:5]
+        info["status"] = self._parse_slurm_status(state_raw)
+
+        # Parse exit code (format: "0:0" -> exitcode:signal)
+        exit_code, sep, _ = exit_raw.partition(":")
+        if sep:
+            info["exit_code"] = int(exit_code)
+
+        # Parse times (sacct prints ISO 8601 without a zone)
+        for key, value in (("start_time", start_raw), ("end_time", end_raw)):
+            if value in _SACCT_NO_TIME:
+                continue
+            try:
+                info[key] = datetime.fromisoformat(value)
+            except ValueError as e:
+                logger.debug("Could not parse sacct %s '%s': %s", key, value, e)
+        return info
+
+    def _query_sacct(self, slurm_id: str) -> dict:
+        """Query sacct for one job's info ({} if sacct has no record)."""
+        return self._query_sacct_bulk([slurm_id]).get(slurm_id, {})
+
+    def _query_sacct_bulk(self, slurm_ids: List[str]) -> Dict[str, dict]:
+        """Query sacct for many jobs, SACCT_BATCH_SIZE IDs per SSH call.
+
+        Records cached within SACCT_CACHE_TTL_S (or of finished jobs) are
+        reused; several batches of the rest are queried concurrently (up to
+        SACCT_WORKERS).
+
+        Returns:
+            Dict of slurm_id -> parsed sacct info (see _parse_sacct_fields);
+            jobs sacct does not report are omitted.
+        """
+        results = self._cached_sacct(slurm_ids)
+        missing = [sid for sid in slurm_ids if sid not in results]
+        batches = [
+            set(missing[i:i + SACCT_BATCH_SIZE])
+            for i in range(0, len(missing), SACCT_BATCH_SIZE)
+        ]
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(SACCT_WORKERS, len(batches))) as pool:
+                outputs = list(pool.map(self._query_sacct_batch, batches))
+        else:
+            outputs = [self._query_sacct_batch(b) for b in batches]
+
+        for batch, stdout in zip(batches, outputs):
+            results.update(self._store_sacct(stdout, batch))
+        return results
+
+    def _cached_sacct(self, slurm_ids) -> Dict[str, dict]:
+        """Cached sacct records still usable for ``slurm_ids``."""
+        now = time.monotonic()
+        hits: Dict[str, dict] = {}
+        with self._sacct_lock:
+            for sid in slurm_ids:
+                entry = self._sacct_cache.get(sid)
+                if entry is not None and (
+                    now - entry[0] < SACCT_CACHE_TTL_S
+                    or entry[1].get("status") in _FINAL_STATUSES
+                ):
+                    hits[sid] = entry[1]
+        return hits
+
+    def _store_sacct(self, stdout: str, slurm_ids: set) -> Dict[str, dict]:
+        """Parse sacct output for ``slurm_ids`` and cache the records."""
+        records: Dict[str, dict] = {}
+        for line in stdout.splitlines():
+            parts = line.strip().split("|")
+            # Step rows (e.g. "123.batch") follow the job's own row
+            if parts[0] in slurm_ids and parts[0] not in records:
+                records[parts[0]] = self._parse_sacct_fields(parts)
+        now = time.monotonic()
+        with self._sacct_lock:
+            if len(self._sacct_cache) >= SLURM_ID_CACHE_SIZE:
+                self._sacct_cache.clear()
+            for sid, record in records.items():
+                self._sacct_cache[sid] = (now, record)
+        return records
+
+    def _invalidate_sacct(self, slurm_id: str) -> None:
+        """Drop a cached sacct record after changing the job's state."""
+        with self._sacct_lock:
+            self._sacct_cache.pop(slurm_id, None)
+
+    def _query_sacct_batch(self, batch: set) -> str:
+        """Raw sacct output for one batch of SLURM IDs ("" on failure)."""
         try:
-            stdout = self._ssh_exec(
-                f"sacct -j {slurm_id} --noheader -P "
-                f"--format=JobID,State,ExitCode,Start,End,Elapsed,MaxRSS,NNodes,NCPUS 2>/dev/null | head -1",
+            return self._ssh_exec(
+                f"sacct -j {','.join(sorted(batch))} --noheader -P "
+                f"--format={_SACCT_FORMAT} 2>/dev/null",
                 check=False,
             )
-            parts = stdout.strip().split("|")
-            if len(parts) >= 5:
-                state = parts[1].split("+")[0] if len(parts) > 1 else ""
-                info["status"] = self._parse_slurm_status(state)
-
-                # Parse exit code (format: "0:0" -> exitcode:signal)
-                if len(parts) > 2 and ":" in parts[2]:
-                    info["exit_code"] = int(parts[2].split(":")[0])
-
-                # Parse times
-                if len(parts) > 3 and parts[3] != "Unknown":
-                    try:
-                        info["start_time"] = datetime.strptime(parts[3], "%Y-%m-%dT%H:%M:%S")
-                    except ValueError as e:
-                        logger.debug(f"Could not parse sacct start_time '{parts[3]}': {e}")
-                if len(parts) > 4 and parts[4] != "Unknown":
-                    try:
-                        info["end_time"] = datetime.strptime(parts[4], "%Y-%m-%dT%H:%M:%S")
-                    except ValueError as e:
-                        logger.debug("Could not parse sacct end_time '%s': %s", parts[4], e)
         except Exception as e:
-            logger.debug(f"sacct query failed for {slurm_id}: {e}")
-
-        return info
+            logger.debug("Batched sacct query failed: %s", e)
+            return ""
 
     def _parse_progress(self, job_id: str) -> tuple:
         """Parse progress from job log file using phase milestones.
 
+        Only bytes appended since the previous poll are fetched (at most
+        LOG_TAIL_BYTES of them); if the log has not grown nothing is
+        transferred. Milestones seen earlier are remembered in the local
+        job record, so progress never moves backwards.
+
         Returns (progress_int, phase_label).
         """
-        local = self._jobs.get(job_id, {})
-        job_dir = local.get("job_dir", "")
-        if not job_dir:
+        local = self._jobs.get(job_id)
+        if local is None or not local.job_dir:
             return (0, "")
+        job_dir = local.job_dir
 
         try:
-            log_path = f"{job_dir}/outputs/logs/container.log"
-            if not self._ssh.file_exists(log_path):
-                return (0, "Running")
-
-            log_content = self._ssh.read_file(log_path)
-
-            # Load milestones for this plugin
-            plugin_id = local.get("spec", {}).get("plugin_id", "")
-            from backend.core.phase_milestones import get_milestones
-            milestones = get_milestones(plugin_id)
-
+            log_path = shlex.quote(f"{job_dir}/outputs/logs/container.log")
+            offset = local.log_offset
+            start = max(0, offset - LOG_OVERLAP_BYTES)
+            # Prints the current size, then the unseen bytes unless the size
+            # is unchanged. A log that shrank was rewritten: start over.
+            output = self._ssh_exec(
+                f"s=$(stat -c %s {log_path} 2>/dev/null) || exit 0; "
+                f"o={start}; [ \"$s\" -ge {offset} ] || o=0; "
+                f"[ $((s - o)) -le {LOG_TAIL_BYTES} ] || o=$((s - {LOG_TAIL_BYTES})); "
+                f"echo \"$s\"; "
+                f"[ \"$s\" -eq {offset} ] || tail -c +$((o + 1)) {log_path} | head -c $((s - o))",
+                check=False,
+            )
+            size, _, log_content = output.partition("\n")
+            if not size.isdigit():
+                return (local.progress, local.current_phase or "Running")
+            local.log_offset = int(size)
+            if not log_content:
+                return (local.progress, local.current_phase or "Running")
+
+            # Highest-percentage milestone found in the new bytes
+            plugin_id = local.plugin_id or ""
             best_progress = 0
             best_label = "Running"
-            for marker, pct, label in milestones:
-                if pct > best_progress:
-                    try:
-                        if re.search(marker, log_content):
-                            best_progress = pct
-                            best_label = label
-                    except re.error:
-                        if marker in log_content:
-                            best_progress = pct
-                            best_label = label
-
-            return (quantize_progress(best_progress), best_label)
+            for pattern, anchor, pct, label in _compiled_milestones(plugin_id):
+                if pct <= best_progress:
+                    break
+                if anchor is not None and anchor not in log_content:
+                    continue
+                if pattern is None or pattern.search(log_content):
+                    best_progress, best_label = pct, label
+                    break
+
+            progress = quantize_progress(best_progress)
+            if progress < local.progress:
+                return (local.progress, local.current_phase or best_label)
+            local.progress, local.current_phase = progress, best_label
+            return (progress, best_label)
 
         except Exception as e:
             logger.debug(f"Could not parse progress from log for job {job_id[:8]}: {e}")
@@ -9,23 +9,44 @@ import re
 import shlex
 import shutil
 import csv
+import threading
+import fnmatch
+import functools
+import glob
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import asynccontextmanager
 from pathlib import Path, PurePosixPath
 
 from fastapi import FastAPI, Depends, HTTPException, Request, UploadFile, File, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
+from sqlalchemy.orm import Session, load_only
 from pydantic import BaseModel
 from typing import Optional, List, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to stdlib json
+    orjson = None
+
 from backend.core.config import get_settings
 from backend.core.database import init_db, get_db
+from backend.core.phase_milestones import (
+    get_milestones,
+    get_plugin_checkpoint_milestones,
+    get_workflow_milestones,
+    get_workflow_step_weights,
+)
 from backend.core.pipelines import get_pipeline_registry
 from backend.core.plugin_registry import get_plugin_workflow_registry
 from backend.core.progress_utils import quantize_progress
+from backend.core.squeue_watcher import get_squeue_watcher
+from backend.core.ssh_manager import MAX_CONCURRENT_CHANNELS, get_ssh_manager
+from backend.core.system_resources import detect_all
 from backend.core.execution import JobSpec, ResourceSpec, ExecutionError
 from backend.execution import get_backend
 from backend.models.job import Job, JobStatusEnum
@@ -45,7 +66,7 @@ settings = get_settings()
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-_FS_LICENSE_PLUGIN_IDS = {
+_FS_LICENSE_PLUGIN_IDS = frozenset({
     "fmriprep",
     "fastsurfer",
     "segmentha_t1",
@@ -54,7 +75,57 @@ _FS_LICENSE_PLUGIN_IDS = {
     "freesurfer_longitudinal",
     "freesurfer_longitudinal_stats",
     "bem_source_space",
-}
+})
+
+
+# Encoded response bodies derived only from the pipeline/plugin/workflow
+# registries, keyed by endpoint and arguments. The registries only change on
+# /api/registry/reload, which clears this.
+_registry_payloads: dict[tuple, bytes] = {}
+
+# Host resources change rarely; nvidia-smi alone can take a second
+_SYSTEM_RESOURCES_TTL_S = 30.0
+_system_resources_cache: Optional[tuple[float, dict]] = None
+
+
+def _registry_payload(key: tuple, build) -> Response:
+    """Memoised JSON response for ``key``, built and encoded on first request."""
+    body = _registry_payloads.get(key)
+    if body is None:
+        body = _registry_payloads[key] = _JSONResponse(jsonable_encoder(build())).body
+    return Response(content=body, media_type="application/json")
+
+
+# Every open tab polls /api/jobs/progress; within this window they share one
+# result (and one DB read + SSH poll) instead of each computing it. Endpoints
+# that add, cancel or delete jobs bump the generation once their change is
+# written, so a result computed before that is never served afterwards.
+_JOBS_PROGRESS_TTL_S = 2.0
+_jobs_progress_lock = threading.Lock()
+_jobs_progress_cache: Optional[tuple[float, int, dict]] = None
+_jobs_progress_gen = 0
+
+
+def _invalidate_jobs_progress() -> None:
+    """Discard the shared /api/jobs/progress result after a job change."""
+    global _jobs_progress_gen
+    _jobs_progress_gen += 1
+
+
+def _invalidates_jobs_progress(handler):
+    """Bump the /api/jobs/progress generation when ``handler`` returns or raises.
+
+    Bumping after the handler rather than before matters: a poll that runs
+    while the job is being written caches its result under the old
+    generation, which the bump then discards.
+    """
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            _invalidate_jobs_progress()
+    return wrapper
 
 
 def _plugin_needs_fs_license(plugin) -> bool:
@@ -129,7 +200,6 @@ async def lifespan(app):
                 "Found persisted HPC config: %s@%s — attempting auto-reconnect",
                 cfg["ssh_user"], cfg["ssh_host"],
             )
-            from backend.core.ssh_manager import get_ssh_manager
             ssh = get_ssh_manager()
             ssh.configure(
                 host=cfg["ssh_host"],
@@ -187,17 +257,32 @@ async def lifespan(app):
     yield
 
     logger.info("Shutting down...")
+    if _redis_client is not None:
+        _redis_client.close()
 
 
 # ---------------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------------
 
+class _ORJSONResponse(ORJSONResponse):
+    """orjson-encoded response that accepts the same content as JSONResponse."""
+
+    def render(self, content: Any) -> bytes:
+        # Non-string keys (e.g. step indexes) are stringified like json.dumps
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+_JSONResponse = _ORJSONResponse if orjson is not None else JSONResponse
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="HPC-native neuroimaging pipeline execution platform",
     lifespan=lifespan,
+    # Large registry/docs/job listings serialise several times faster
+    default_response_class=_JSONResponse,
 )
 
 app.add_middleware(
@@ -245,45 +330,85 @@ def root(request: Request):
     }
 
 
-@app.get("/health")
-def health_check():
-    """Health check -- reports status of all infrastructure."""
-    services = {}
+def _probe_database() -> dict:
+    from backend.core.database import health_check as db_health
+    return db_health()
 
-    # Database health
-    try:
-        from backend.core.database import health_check as db_health
-        services["database"] = db_health()
-    except Exception as e:
-        services["database"] = {"healthy": False, "message": str(e)}
 
-    # Redis health
-    try:
+# Shared client for the Redis probe; its connection pool keeps the socket
+# (and AUTH) across health checks instead of reconnecting on every call
+_redis_client = None
+
+
+def _probe_redis() -> dict:
+    global _redis_client
+    if _redis_client is None:
         import redis
-        r = redis.Redis(
+        _redis_client = redis.Redis(
             host=settings.redis_host,
             port=settings.redis_port,
             password=settings.redis_password,
             socket_timeout=3,
+            socket_connect_timeout=3,
+            max_connections=4,
         )
-        r.ping()
-        services["redis"] = {"healthy": True, "message": "Redis connection OK"}
-    except Exception as e:
-        services["redis"] = {"healthy": False, "message": str(e)}
+    _redis_client.ping()
+    return {"healthy": True, "message": "Redis connection OK"}
 
-    # MinIO health
-    try:
-        from backend.core.storage import storage
-        services["minio"] = storage.health_check()
-    except Exception as e:
-        services["minio"] = {"healthy": False, "message": str(e)}
 
-    # Execution backend health
-    try:
-        backend = get_backend()
-        services["execution"] = backend.health_check()
-    except Exception as e:
-        services["execution"] = {"healthy": False, "message": str(e)}
+def _probe_minio() -> dict:
+    from backend.core.storage import storage
+    return storage.health_check()
+
+
+def _probe_execution() -> dict:
+    return get_backend().health_check()
+
+
+_HEALTH_PROBES = (
+    ("database", _probe_database),
+    ("redis", _probe_redis),
+    ("minio", _probe_minio),
+    ("execution", _probe_execution),
+)
+# Probes run side by side, so /health takes as long as the slowest one
+# rather than the sum; one that hangs past this is reported unhealthy
+_HEALTH_TIMEOUT_S = 5.0
+_health_probe_pool = ThreadPoolExecutor(
+    max_workers=len(_HEALTH_PROBES), thread_name_prefix="health-probe",
+)
+# Last probe submitted per service.  A probe still running from an earlier
+# request is not submitted again, so a hung dependency holds at most one
+# worker and healthy probes never queue behind it.
+_health_inflight: dict = {}
+_health_inflight_lock = threading.Lock()
+
+
+@app.get("/health")
+def health_check():
+    """Health check -- reports status of all infrastructure."""
+    futures = {}
+    with _health_inflight_lock:
+        for name, probe in _HEALTH_PROBES:
+            previous = _health_inflight.get(name)
+            if previous is not None and not previous.done():
+                futures[name] = None
+                continue
+            futures[name] = _health_inflight[name] = _health_probe_pool.submit(probe)
+    wait([f for f in futures.values() if f is not None], timeout=_HEALTH_TIMEOUT_S)
+
+    services = {}
+    for name, future in futures.items():
+        if future is None:
+            services[name] = {"healthy": False, "message": "Previous check still running"}
+            continue
+        if not future.done():
+            services[name] = {"healthy": False, "message": f"No response within {_HEALTH_TIMEOUT_S:g}s"}
+            continue
+        try:
+            services[name] = future.result()
+        except Exception as e:
+            services[name] = {"healthy": False, "message": str(e)}
 
     all_healthy = all(s.get("healthy", False) for s in services.values())
 
@@ -316,8 +441,13 @@ def get_app_config():
 @app.get("/api/system/resources")
 def get_system_resources():
     """Detect host machine CPU, RAM, and GPU capabilities."""
-    from backend.core.system_resources import detect_all
-    return detect_all()
+    global _system_resources_cache
+    now = time.monotonic()
+    if _system_resources_cache and now - _system_resources_cache[0] < _SYSTEM_RESOURCES_TTL_S:
+        return _system_resources_cache[1]
+    resources = detect_all()
+    _system_resources_cache = (now, resources)
+    return resources
 
 
 @app.post("/api/jobs/reap-stale")
@@ -335,6 +465,10 @@ def reap_stale_jobs_endpoint():
 @app.get("/api/pipelines")
 def list_pipelines():
     """List available pipelines."""
+    return _registry_payload(("pipelines",), _pipelines_payload)
+
+
+def _pipelines_payload() -> dict:
     registry = get_pipeline_registry()
     pipelines = registry.list_pipelines()
     return {
@@ -381,7 +515,7 @@ def get_pipeline_details(pipeline_name: str):
     pipeline = registry.get_pipeline(pipeline_name)
     if not pipeline:
         raise HTTPException(status_code=404, detail="Pipeline not found")
-    return {
+    return _registry_payload(("pipeline", pipeline_name), lambda: {
         "name": pipeline.name,
         "version": pipeline.version,
         "description": pipeline.description,
@@ -392,7 +526,7 @@ def get_pipeline_details(pipeline_name: str):
         "outputs": [vars(out) for out in pipeline.outputs],
         "authors": pipeline.authors,
         "references": pipeline.references,
-    }
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -402,12 +536,14 @@ def get_pipeline_details(pipeline_name: str):
 @app.get("/api/plugins")
 def list_plugins(user_selectable_only: bool = True):
     """List available plugins."""
-    pw_registry = get_plugin_workflow_registry()
-    plugins = pw_registry.list_plugins(user_selectable_only=user_selectable_only)
-    return {
-        "plugins": [p.to_api_dict() for p in plugins],
-        "total": len(plugins),
-    }
+    def build():
+        pw_registry = get_plugin_workflow_registry()
+        plugins = pw_registry.list_plugins(user_selectable_only=user_selectable_only)
+        return {
+            "plugins": [p.to_api_dict() for p in plugins],
+            "total": len(plugins),
+        }
+    return _registry_payload(("plugins", user_selectable_only), build)
 
 
 @app.get("/api/plugins/{plugin_id}")
@@ -427,23 +563,24 @@ def get_plugin_yaml(plugin_id: str):
     plugin = pw_registry.get_plugin(plugin_id)
     if not plugin:
         raise HTTPException(status_code=404, detail=f"Plugin '{plugin_id}' not found")
-    import yaml
-    return {
+    return _registry_payload(("plugin_yaml", plugin_id), lambda: {
         "id": plugin.id,
         "name": plugin.name,
-        "yaml": yaml.dump(plugin.raw_yaml, default_flow_style=False, sort_keys=False),
-    }
+        "yaml": plugin.yaml_text,
+    })
 
 
 @app.get("/api/workflows")
 def list_workflows():
     """List available workflows with enriched step info."""
-    pw_registry = get_plugin_workflow_registry()
-    workflows = pw_registry.list_workflows()
-    return {
-        "workflows": [w.to_api_dict(plugin_registry=pw_registry.plugins) for w in workflows],
-        "total": len(workflows),
-    }
+    def build():
+        pw_registry = get_plugin_workflow_registry()
+        workflows = pw_registry.list_workflows()
+        return {
+            "workflows": [w.to_api_dict(plugin_registry=pw_registry.plugins) for w in workflows],
+            "total": len(workflows),
+        }
+    return _registry_payload(("workflows",), build)
 
 
 @app.get("/api/workflows/{workflow_id}")
@@ -463,12 +600,11 @@ def get_workflow_yaml(workflow_id: str):
     workflow = pw_registry.get_workflow(workflow_id)
     if not workflow:
         raise HTTPException(status_code=404, detail=f"Workflow '{workflow_id}' not found")
-    import yaml
-    return {
+    return _registry_payload(("workflow_yaml", workflow_id), lambda: {
         "id": workflow.id,
         "name": workflow.name,
-        "yaml": yaml.dump(workflow.raw_yaml, default_flow_style=False, sort_keys=False),
-    }
+        "yaml": workflow.yaml_text,
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -478,11 +614,13 @@ def get_workflow_yaml(workflow_id: str):
 @app.get("/api/registry/versions")
 def get_registry_versions():
     """Get current plugin/workflow version summary."""
-    pw_registry = get_plugin_workflow_registry()
-    return {
-        "plugins": pw_registry.get_plugin_versions(),
-        "workflows": pw_registry.get_workflow_versions(),
-    }
+    def build():
+        pw_registry = get_plugin_workflow_registry()
+        return {
+            "plugins": pw_registry.get_plugin_versions(),
+            "workflows": pw_registry.get_workflow_versions(),
+        }
+    return _registry_payload(("versions",), build)
 
 
 @app.get("/api/registry/lockfile")
@@ -513,6 +651,7 @@ def reload_registry():
     """
     pw_registry = get_plugin_workflow_registry()
     pw_registry.reload()
+    _registry_payloads.clear()
     return {
         "plugins": len(pw_registry.plugins),
         "workflows": len(pw_registry.workflows),
@@ -527,22 +666,25 @@ def reload_registry():
 @app.get("/api/docs/all")
 def get_docs_all():
     """Get all plugins and workflows with full details for the docs page."""
+    return _registry_payload(("docs",), _docs_payload)
+
+
+def _docs_payload() -> dict:
     pw_registry = get_plugin_workflow_registry()
     plugins = pw_registry.list_plugins(user_selectable_only=False)
     workflows = pw_registry.list_workflows()
-    import yaml
     return {
         "plugins": [
             {
                 **p.to_api_dict(),
-                "yaml": yaml.dump(p.raw_yaml, default_flow_style=False, sort_keys=False),
+                "yaml": p.yaml_text,
             }
             for p in plugins
         ],
         "workflows": [
             {
                 **w.to_api_dict(plugin_registry=pw_registry.plugins),
-                "yaml": yaml.dump(w.raw_yaml, default_flow_style=False, sort_keys=False),
+                "yaml": w.yaml_text,
             }
             for w in workflows
         ],
@@ -602,15 +744,15 @@ class PluginJobSubmitRequest(BaseModel):
 
 
 # Plugins that require the MELD Graph license (meld_license.txt)
-MELD_LICENSE_PLUGINS = {"meld_graph"}
+MELD_LICENSE_PLUGINS = frozenset({"meld_graph"})
 
 # Plugins that require the FreeSurfer license (license.txt)
-FS_LICENSE_PLUGINS = {
+FS_LICENSE_PLUGINS = frozenset({
     "freesurfer_recon", "freesurfer_autorecon_volonly", "fastsurfer",
     "fmriprep", "meld_graph", "segmentha_t1", "segmentha_t2",
     "freesurfer_longitudinal", "freesurfer_longitudinal_stats",
     "bem_source_space",
-}
+})
 
 _HEAVY_SUBMIT_PLUGIN_IDS = {
     "fmriprep",
@@ -653,8 +795,8 @@ def _check_licenses(plugin_ids: List[str]):
 
     Raises HTTPException with a clear message if a license is missing.
     """
-    needs_fs = any(pid in FS_LICENSE_PLUGINS for pid in plugin_ids)
-    needs_meld = any(pid in MELD_LICENSE_PLUGINS for pid in plugin_ids)
+    needs_fs = not FS_LICENSE_PLUGINS.isdisjoint(plugin_ids)
+    needs_meld = not MELD_LICENSE_PLUGINS.isdisjoint(plugin_ids)
 
     if needs_fs and not settings.fs_license_resolved:
         raise HTTPException(
@@ -758,6 +900,7 @@ def _enforce_disk_guard_for_submission(plugin_ids: List[str], submission_label:
 
 
 @app.post("/api/plugins/{plugin_id}/submit")
+@_invalidates_jobs_progress
 def submit_plugin_job(plugin_id: str, request: PluginJobSubmitRequest, db: Session = Depends(get_db)):
     """Submit a job that runs a single plugin."""
     pw_registry = get_plugin_workflow_registry()
@@ -842,6 +985,7 @@ class WorkflowJobSubmitRequest(BaseModel):
 
 
 @app.post("/api/workflows/{workflow_id}/submit")
+@_invalidates_jobs_progress
 def submit_workflow_job(workflow_id: str, request: WorkflowJobSubmitRequest, db: Session = Depends(get_db)):
     """Submit a workflow job that chains multiple plugins."""
     pw_registry = get_plugin_workflow_registry()
@@ -958,7 +1102,15 @@ class WorkflowBatchSubmitRequest(BaseModel):
     data_source_dataset_id: Optional[str] = None
 
 
+# Subjects of one workflow batch are submitted concurrently; sized to the SSH
+# connection's channel limit, which bounds SLURM submissions anyway
+_batch_submit_pool = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_CHANNELS, thread_name_prefix="batch-submit",
+)
+
+
 @app.post("/api/workflows/{workflow_id}/submit-batch")
+@_invalidates_jobs_progress
 def submit_workflow_batch(workflow_id: str, request: WorkflowBatchSubmitRequest, db: Session = Depends(get_db)):
     """Submit a workflow job for every subject in a BIDS directory.
 
@@ -984,7 +1136,6 @@ def submit_workflow_batch(workflow_id: str, request: WorkflowBatchSubmitRequest,
         backend_type = getattr(backend, "backend_type", "local")
 
         if backend_type == "slurm":
-            from backend.core.ssh_manager import get_ssh_manager
             ssh = get_ssh_manager()
             if not ssh.is_connected:
                 raise HTTPException(status_code=503, detail="SSH not connected to HPC")
@@ -998,8 +1149,7 @@ def submit_workflow_batch(workflow_id: str, request: WorkflowBatchSubmitRequest,
                 if d.strip().startswith("sub-")
             ]
         else:
-            from pathlib import Path as _P
-            bids_path = _P(bids_dir)
+            bids_path = Path(bids_dir)
             if not bids_path.is_dir():
                 raise HTTPException(status_code=400, detail=f"BIDS directory not found: {bids_dir}")
             subject_ids = sorted(
@@ -1035,50 +1185,55 @@ def submit_workflow_batch(workflow_id: str, request: WorkflowBatchSubmitRequest,
     batch_root.mkdir(parents=True, exist_ok=True)
 
     # Submit one job per subject
-    submitted = []
-    errors = []
     backend = get_backend()
 
-    for sid in subject_ids:
-        try:
-            job_id = str(uuid.uuid4())
-            output_dir = str(batch_root / job_id / "outputs")
-
-            params = dict(normalized_base_params)
-            params["subject_id"] = sid
-            params["_plugin_id"] = step_plugin_ids[0] if len(step_plugin_ids) == 1 else ""
-            params["_workflow_steps"] = step_plugin_ids
-            params["_workflow_id"] = workflow_id
-            params["_batch_id"] = batch_id
-
-            spec = JobSpec(
-                pipeline_name=workflow.name,
-                container_image=first_plugin.container_image,
-                input_files=[bids_dir],
-                output_dir=output_dir,
-                parameters=params,
-                resources=resources,
-                workflow_id=workflow_id,
-                execution_mode="workflow",
-            )
+    def submit_subject(sid: str) -> dict:
+        job_id = str(uuid.uuid4())
+        output_dir = str(batch_root / job_id / "outputs")
 
-            backend.submit_job(spec, job_id=job_id)
+        params = dict(normalized_base_params)
+        params["subject_id"] = sid
+        params["_plugin_id"] = step_plugin_ids[0] if len(step_plugin_ids) == 1 else ""
+        params["_workflow_steps"] = step_plugin_ids
+        params["_workflow_id"] = workflow_id
+        params["_batch_id"] = batch_id
 
-            if request.data_source_platform:
-                try:
-                    job_row = db.query(Job).filter(Job.id == job_id).first()
-                    if job_row:
-                        job_row.data_source_platform = request.data_source_platform
-                        job_row.data_source_dataset_id = request.data_source_dataset_id
-                        db.commit()
-                except Exception:
-                    db.rollback()
+        spec = JobSpec(
+            pipeline_name=workflow.name,
+            container_image=first_plugin.container_image,
+            input_files=[bids_dir],
+            output_dir=output_dir,
+            parameters=params,
+            resources=resources,
+            workflow_id=workflow_id,
+            execution_mode="workflow",
+        )
 
-            submitted.append({"job_id": job_id, "subject_id": sid, "output_dir": output_dir})
+        backend.submit_job(spec, job_id=job_id)
+        return {"job_id": job_id, "subject_id": sid, "output_dir": output_dir}
+
+    # Each submission is an SSH round trip (sbatch) on SLURM; run them side by
+    # side, keeping results in subject order
+    submitted = []
+    errors = []
+    futures = [_batch_submit_pool.submit(submit_subject, sid) for sid in subject_ids]
+    for sid, future in zip(subject_ids, futures):
+        try:
+            submitted.append(future.result())
         except Exception as e:
             errors.append({"subject_id": sid, "error": str(e)})
             logger.error("Batch submit failed for subject %s: %s", sid, e)
 
+    if request.data_source_platform and submitted:
+        try:
+            db.query(Job).filter(Job.id.in_([s["job_id"] for s in submitted])).update({
+                Job.data_source_platform: request.data_source_platform,
+                Job.data_source_dataset_id: request.data_source_dataset_id,
+            }, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+
     return {
         "batch_id": batch_id,
         "batch_output_dir": str(batch_root),
@@ -1104,6 +1259,7 @@ class JobSubmitRequest(BaseModel):
 
 
 @app.post("/api/jobs/submit")
+@_invalidates_jobs_progress
 def submit_job(request: JobSubmitRequest, db: Session = Depends(get_db)):
     """Submit a job for execution (legacy pipeline mode)."""
     pipeline_name = request.pipeline_name
@@ -1117,14 +1273,10 @@ def submit_job(request: JobSubmitRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail=f"Pipeline '{pipeline_name}' not found")
 
     # Merge parameters with pipeline defaults
-    merged_params = {}
-    for param in pipeline.parameters:
-        if param.default is not None:
-            merged_params[param.name] = param.default
-    merged_params.update(parameters)
-
-    # Build resource spec
-    res = vars(pipeline.resources)
+    merged_params = {**pipeline.default_params, **parameters}
+
+    # Build resource spec (copy: vars() is the shared registry object's dict)
+    res = dict(vars(pipeline.resources))
     if custom_resources:
         res.update(custom_resources)
 
@@ -1167,11 +1319,37 @@ class BatchSubmitRequest(BaseModel):
     file_pattern: str = "*.nii.gz"
 
 
+_GLOB_META = re.compile(r"[*?\[]")
+
+
+def _match_input_files(directory: Path, file_pattern: str) -> list[str]:
+    """Sorted paths under ``directory`` matching a glob ``file_pattern``.
+
+    A single-component pattern is matched against one ``os.scandir`` pass
+    with the pattern compiled once, skipping dot-files like glob does; the
+    common ``*.ext`` form is a plain suffix test. Patterns that reach into
+    subdirectories go through glob.
+    """
+    if "/" in file_pattern:
+        return sorted(glob.glob(str(directory / file_pattern)))
+    suffix = file_pattern[1:]
+    if file_pattern.startswith("*") and not _GLOB_META.search(suffix):
+        def match(name: str) -> bool:
+            return name.endswith(suffix)
+    else:
+        match = re.compile(fnmatch.translate(file_pattern)).match
+    hidden_ok = file_pattern.startswith(".")
+    with os.scandir(directory) as entries:
+        return sorted(
+            e.path for e in entries
+            if (hidden_ok or not e.name.startswith(".")) and match(e.name) and e.is_file()
+        )
+
+
 @app.post("/api/jobs/submit-batch")
+@_invalidates_jobs_progress
 def submit_batch_job(request: BatchSubmitRequest, db: Session = Depends(get_db)):
     """Submit batch job to process all files in a directory."""
-    import glob as glob_module
-
     registry = get_pipeline_registry()
     pipeline = registry.get_pipeline(request.pipeline_name)
     if not pipeline:
@@ -1181,8 +1359,7 @@ def submit_batch_job(request: BatchSubmitRequest, db: Session = Depends(get_db))
     if not input_path.exists() or not input_path.is_dir():
         raise HTTPException(status_code=400, detail=f"Input directory not found: {request.input_dir}")
 
-    pattern = str(input_path / request.file_pattern)
-    input_files = sorted(glob_module.glob(pattern))
+    input_files = _match_input_files(input_path, request.file_pattern)
     if not input_files:
         raise HTTPException(
             status_code=400,
@@ -1190,6 +1367,7 @@ def submit_batch_job(request: BatchSubmitRequest, db: Session = Depends(get_db))
         )
 
     job_ids = []
+    specs = []
     backend = get_backend()
 
     batch_id = str(uuid.uuid4())
@@ -1216,9 +1394,11 @@ def submit_batch_job(request: BatchSubmitRequest, db: Session = Depends(get_db))
             resources=resources,
             pipeline_version=pipeline.version,
         )
-
-        backend.submit_job(spec, job_id=job_id)
         job_ids.append(job_id)
+        specs.append(spec)
+
+    # One DB transaction + one broker round-trip for the whole batch
+    backend.submit_jobs(specs, job_ids=job_ids)
 
     return {
         "batch_id": batch_id,
@@ -1427,8 +1607,8 @@ def list_reusable_outputs(
         for itype, consumers in _INPUT_ACCEPTS.items():
             if plugin_id in consumers:
                 wanted_types.add(itype)
+    pw_registry = get_plugin_workflow_registry()
     if workflow_id:
-        pw_registry = get_plugin_workflow_registry()
         wf = pw_registry.get_workflow(workflow_id)
         if wf:
             for step in wf.steps:
@@ -1457,7 +1637,6 @@ def list_reusable_outputs(
         pipeline = job.pipeline_name or ""
         if pipeline.startswith("workflow:"):
             wf_id = pipeline.replace("workflow:", "")
-            pw_registry = get_plugin_workflow_registry()
             wf = pw_registry.get_workflow(wf_id)
             if wf:
                 plugin_ids_in_job.extend(s.uses for s in wf.steps)
@@ -1532,10 +1711,31 @@ def get_jobs_progress(db: Session = Depends(get_db)):
 
     Frontend polls this at ~2-3s intervals to animate progress bars.
     For SLURM jobs, queries live status from the HPC scheduler via SSH.
-    Uses a single batched squeue call instead of one per job.
+    Uses a single batched squeue call instead of one per job. Concurrent
+    and back-to-back polls within _JOBS_PROGRESS_TTL_S share one result.
     """
+    global _jobs_progress_cache
+    with _jobs_progress_lock:
+        cached = _jobs_progress_cache
+        if (cached and cached[1] == _jobs_progress_gen
+                and time.monotonic() - cached[0] < _JOBS_PROGRESS_TTL_S):
+            return cached[2]
+        gen = _jobs_progress_gen
+        payload = _collect_jobs_progress(db)
+        _jobs_progress_cache = (time.monotonic(), gen, payload)
+        return payload
+
+
+def _collect_jobs_progress(db: Session) -> dict:
+    # Only the columns the status transitions and log polls touch; skips the
+    # JSON inputs/resources/tags on every row.
     active_jobs = (
         db.query(Job)
+        .options(load_only(
+            Job.id, Job.backend_type, Job.backend_job_id, Job.status,
+            Job.progress, Job.current_phase, Job.started_at, Job.completed_at,
+            Job.exit_code, Job.error_message, Job.parameters, Job.output_dir,
+        ))
         .filter(Job.deleted == False, Job.status.in_(["pending", "running"]))
         .all()
     )
@@ -1554,10 +1754,13 @@ def get_jobs_progress(db: Session = Depends(get_db)):
     remote_active = [j for j in active_jobs if j.backend_type == "remote_docker"]
     remote_statuses: dict[str, str] = _poll_remote_docker_status_batch(remote_active)
 
-    import time as _t
-    _progress_deadline = _t.time() + 12  # max 12s on log polling
+    _progress_deadline = time.time() + 12  # max 12s on log polling
 
+    # Rows are only touched when their status or progress actually moved; all
+    # changes go out in one commit after the loop.
+    dirty = False
     results = []
+    to_poll: list[int] = []  # indexes of running remote jobs whose logs to read
     for j in active_jobs:
         status = j.status
         progress = quantize_progress(j.progress or 0)
@@ -1569,12 +1772,10 @@ def get_jobs_progress(db: Session = Depends(get_db)):
                 status = new_status
                 j.status = status
                 if status == "running" and not j.started_at:
-                    from datetime import datetime
                     j.started_at = datetime.utcnow()
                     phase = "Running on HPC"
                     j.current_phase = phase
                 if status in ("completed", "failed", "cancelled"):
-                    from datetime import datetime
                     j.completed_at = datetime.utcnow()
                     if status == "completed":
                         progress = 100
@@ -1596,10 +1797,7 @@ def get_jobs_progress(db: Session = Depends(get_db)):
                             j.exit_code = 130
                     _slurm_progress_cache.pop(j.id, None)
                     _slurm_progress_state.pop(j.id, None)
-                try:
-                    db.commit()
-                except Exception:
-                    db.rollback()
+                dirty = True
 
         elif j.backend_type == "remote_docker":
             new_status = remote_statuses.get(j.id)
@@ -1607,14 +1805,12 @@ def get_jobs_progress(db: Session = Depends(get_db)):
                 status = new_status
                 j.status = status
                 if status == "running" and not j.started_at:
-                    from datetime import datetime
 
                     j.started_at = datetime.utcnow()
                     if not j.current_phase:
                         phase = "Running on remote server"
                         j.current_phase = phase
                 if status in ("completed", "failed", "cancelled"):
-                    from datetime import datetime
 
                     j.completed_at = datetime.utcnow()
                     if status == "completed":
@@ -1629,24 +1825,10 @@ def get_jobs_progress(db: Session = Depends(get_db)):
                             j.error_message = "Remote job reported FAILED"
                         if j.exit_code is None:
                             j.exit_code = 1
-                try:
-                    db.commit()
-                except Exception:
-                    db.rollback()
-
-            if status == "running" and _t.time() < _progress_deadline:
-                prog_result = _poll_slurm_progress(j)
-                if prog_result:
-                    new_progress, new_phase = prog_result
-                    if new_progress > progress:
-                        progress = new_progress
-                        phase = new_phase
-                        j.progress = progress
-                        j.current_phase = phase
-                        try:
-                            db.commit()
-                        except Exception:
-                            db.rollback()
+                dirty = True
+
+            if status == "running":
+                to_poll.append(len(results))
 
         results.append({
             "id": j.id,
@@ -1655,6 +1837,33 @@ def get_jobs_progress(db: Session = Depends(get_db)):
             "current_phase": phase,
         })
 
+    # Each log poll is its own SSH round trip; run them side by side and
+    # leave any that miss the deadline at their stored progress.
+    if to_poll:
+        futures = {
+            _progress_poll_pool.submit(_poll_slurm_progress, active_jobs[i]): i
+            for i in to_poll
+        }
+        done, _ = wait(futures, timeout=max(0.0, _progress_deadline - time.time()))
+        for fut in done:
+            prog_result = fut.result()
+            if not prog_result:
+                continue
+            i = futures[fut]
+            new_progress, new_phase = prog_result
+            entry = results[i]
+            if new_progress > entry["progress"]:
+                entry["progress"] = quantize_progress(new_progress)
+                entry["current_phase"] = new_phase
+                active_jobs[i].progress = new_progress
+                active_jobs[i].current_phase = new_phase
+                dirty = True
+
+    if dirty:
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
     return {"jobs": results}
 
 
@@ -1675,7 +1884,6 @@ def _reconcile_live_slurm_queue_for_listing(db: Session) -> int:
     live job.
     """
     try:
-        from backend.core.ssh_manager import get_ssh_manager
         ssh = get_ssh_manager()
         if not ssh.is_connected:
             if ssh.host and ssh.username:
@@ -1701,7 +1909,7 @@ def _reconcile_live_slurm_queue_for_listing(db: Session) -> int:
             if len(parts) < 3:
                 continue
             slurm_id = parts[0].strip()
-            state_raw = parts[1].split("+")[0].strip().upper()
+            state_raw = parts[1].strip().upper().partition(" ")[0].partition("+")[0]
             job_name = parts[2].strip()
             mapped = _SLURM_STATUS_MAP.get(state_raw)
             if mapped not in ("pending", "running"):
@@ -1887,11 +2095,19 @@ def _poll_remote_docker_status_batch(jobs: list["Job"]) -> dict[str, str]:
     if getattr(backend, "backend_type", None) != "remote_docker":
         return out
 
-    import time as _t
 
-    deadline = _t.time() + 12  # bound total SSH time, like the SLURM poller
+    # One `docker ps` primes the backend's status cache for every container,
+    # so the per-job calls below are answered without further SSH round trips.
+    refresh = getattr(backend, "refresh_all_statuses", None)
+    if refresh is not None:
+        try:
+            refresh()
+        except Exception as e:
+            logger.debug("remote_docker bulk status refresh failed: %s", e)
+
+    deadline = time.time() + 12  # bound total SSH time, like the SLURM poller
     for j in jobs:
-        if _t.time() >= deadline:
+        if time.time() >= deadline:
             break
         try:
             st = backend.get_job_status(j.id)
@@ -1913,7 +2129,6 @@ def _poll_slurm_status_batch(slurm_job_ids: list[str]) -> dict[str, str]:
         return {}
 
     try:
-        from backend.core.ssh_manager import get_ssh_manager
         ssh = get_ssh_manager()
         if not ssh.is_connected:
             if ssh.host and ssh.username:
@@ -1925,6 +2140,19 @@ def _poll_slurm_status_batch(slurm_job_ids: list[str]) -> dict[str, str]:
             if not ssh.is_connected:
                 return {}
 
+        results: dict[str, str] = {}
+        # Queued jobs come from the live squeue mirror; only jobs that have
+        # left the queue still need a scheduler query
+        queued = get_squeue_watcher().states()
+        if queued is not None:
+            for jid in slurm_job_ids:
+                mapped = _SLURM_STATUS_MAP.get(queued.get(jid, "").partition("+")[0])
+                if mapped:
+                    results[jid] = mapped
+            slurm_job_ids = [jid for jid in slurm_job_ids if jid not in queued]
+            if not slurm_job_ids:
+                return results
+
         id_list = ",".join(slurm_job_ids)
         exit_code, stdout, _ = ssh.execute(
             f"squeue -j {id_list} --noheader -o '%i %T' 2>/dev/null; "
@@ -1932,7 +2160,6 @@ def _poll_slurm_status_batch(slurm_job_ids: list[str]) -> dict[str, str]:
             timeout=15,
         )
 
-        results: dict[str, str] = {}
         for line in stdout.strip().splitlines():
             # sacct -P uses '|' delimiter, squeue uses spaces
             if "|" in line:
@@ -1940,8 +2167,8 @@ def _poll_slurm_status_batch(slurm_job_ids: list[str]) -> dict[str, str]:
             else:
                 parts = line.split()
             if len(parts) >= 2:
-                jid = parts[0].split(".")[0].strip()
-                state = parts[1].split("+")[0].strip().upper()
+                jid = parts[0].strip().partition(".")[0]
+                state = parts[1].strip().upper().partition(" ")[0].partition("+")[0]
                 if jid in slurm_job_ids:
                     mapped = _SLURM_STATUS_MAP.get(state)
                     if mapped and jid not in results:
@@ -1961,13 +2188,15 @@ def _poll_slurm_status(slurm_job_id: str) -> str | None:
 # ---------------------------------------------------------------------------
 # SLURM Log-Based Progress Tracking
 # ---------------------------------------------------------------------------
-import time as _time
-import re as _re
 
 # Per-job progress cache/state keyed by job.id to keep concurrent jobs isolated.
 _slurm_progress_cache: dict[str, tuple[float, int, str]] = {}
 _slurm_progress_state: dict[str, dict] = {}
 _SLURM_PROGRESS_POLL_INTERVAL = 30  # seconds between log reads per job
+# Log reads in one /api/jobs/progress call share the SSH connection's channels
+_progress_poll_pool = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_CHANNELS, thread_name_prefix="progress-poll",
+)
 _WORKFLOW_MILESTONE_LOOKAHEAD = 4
 _PLUGIN_MILESTONE_LOOKAHEAD = 3
 
@@ -2013,23 +2242,29 @@ def _build_job_display_fields(job: "Job") -> dict:
     }
 
 
-def _get_remote_file_size(ssh, remote_path: str) -> int:
-    """Return remote file size in bytes (0 if missing/unreadable)."""
-    qpath = shlex.quote(remote_path)
-    _, stdout, _ = ssh.execute(f"wc -c < {qpath} 2>/dev/null || echo 0", timeout=10)
-    try:
-        return int((stdout or "0").strip().splitlines()[-1])
-    except Exception:
-        return 0
+def _get_remote_file_sizes(ssh, remote_paths: list[str]) -> dict[str, int]:
+    """Sizes in bytes of several remote files, in one round trip.
 
+    Missing or unreadable files are omitted.
+    """
+    quoted = " ".join(shlex.quote(p) for p in remote_paths)
+    _, stdout, _ = ssh.execute(f"stat -L -c '%s %n' -- {quoted} 2>/dev/null", timeout=10)
+    sizes: dict[str, int] = {}
+    for line in (stdout or "").splitlines():
+        size, _, path = line.partition(" ")
+        if size.isdigit():
+            sizes[path] = int(size)
+    return sizes
 
-def _read_remote_log_delta(ssh, remote_path: str, offset: int, max_bytes: int = 262144) -> tuple[str, int]:
-    """Read only newly appended bytes from a remote log file.
+
+def _read_remote_log_delta(
+    ssh, remote_path: str, offset: int, size: int, max_bytes: int = 262144,
+) -> tuple[str, int]:
+    """Read only newly appended bytes from a remote log file of known ``size``.
 
     Returns (new_text, current_file_size). If the file shrank (rotation/truncate),
-    offset is reset to 0.
+    offset is reset to 0. An unchanged size costs no round trip.
     """
-    size = _get_remote_file_size(ssh, remote_path)
     if size <= 0:
         return "", 0
 
@@ -2041,7 +2276,7 @@ def _read_remote_log_delta(ssh, remote_path: str, offset: int, max_bytes: int =
 
     qpath = shlex.quote(remote_path)
     _, stdout, _ = ssh.execute(
-        f"dd if={qpath} bs=1 skip={safe_offset} count={max_bytes} 2>/dev/null",
+        f"tail -c +{safe_offset + 1} {qpath} 2>/dev/null | head -c {min(size - safe_offset, max_bytes)}",
         timeout=15,
     )
     return stdout or "", size
@@ -2053,43 +2288,36 @@ def _resolve_active_slurm_log_path(
     workflow_steps: list[str],
     slurm_id: str,
     workflow_id: str = "",
-) -> tuple[str, str, int, float]:
+) -> tuple[str, str, int, float, int]:
     """Pick the currently active log path and workflow offset context.
 
-    Returns (log_path, active_plugin_id, active_step_idx, step_offset_pct).
+    All candidate logs are sized in one round trip.
+
+    Returns (log_path, active_plugin_id, active_step_idx, step_offset_pct, log_size).
     """
-    active_plugin_id = ""
-    active_step_idx = 0
-    step_offset_pct = 0.0
-
-    if workflow_steps:
-        total_steps = len(workflow_steps)
-        from backend.core.phase_milestones import get_workflow_step_weights
-        weights = get_workflow_step_weights(workflow_id, total_steps)
-
-        for step_idx in range(total_steps - 1, -1, -1):
-            step_num = step_idx + 1
-            step_pid = workflow_steps[step_idx]
-            candidate = f"{output_dir}/logs/step_{step_num}_{step_pid}.log"
-            if _get_remote_file_size(ssh, candidate) > 0:
-                active_plugin_id = step_pid
-                active_step_idx = step_idx
-                step_offset_pct = sum(weights[:step_idx]) * 100
-                return candidate, active_plugin_id, active_step_idx, step_offset_pct
-
-    # Single-plugin fallback
-    container_log = f"{output_dir}/logs/container.log"
-    if _get_remote_file_size(ssh, container_log) > 0:
-        return container_log, active_plugin_id, active_step_idx, step_offset_pct
-
-    # Last-resort fallback to SLURM stdout (startup/errors)
+    # (path, step_idx) in priority order: latest step log > container log > slurm log
+    candidates: list[tuple[str, int]] = [
+        (f"{output_dir}/logs/step_{step_idx + 1}_{workflow_steps[step_idx]}.log", step_idx)
+        for step_idx in range(len(workflow_steps) - 1, -1, -1)
+    ]
+    candidates.append((f"{output_dir}/logs/container.log", -1))
     if slurm_id:
+        # Last-resort fallback to SLURM stdout (startup/errors)
         job_dir = output_dir.rstrip("/").rsplit("/outputs", 1)[0]
-        slurm_log = f"{job_dir}/logs/slurm-{slurm_id}.out"
-        if _get_remote_file_size(ssh, slurm_log) > 0:
-            return slurm_log, active_plugin_id, active_step_idx, step_offset_pct
+        candidates.append((f"{job_dir}/logs/slurm-{slurm_id}.out", -1))
+
+    sizes = _get_remote_file_sizes(ssh, [path for path, _ in candidates])
+    for path, step_idx in candidates:
+        size = sizes.get(path, 0)
+        if size <= 0:
+            continue
+        if step_idx < 0:
+            return path, "", 0, 0.0, size
+        weights = get_workflow_step_weights(workflow_id, len(workflow_steps))
+        step_offset_pct = sum(weights[:step_idx]) * 100
+        return path, workflow_steps[step_idx], step_idx, step_offset_pct, size
 
-    return "", active_plugin_id, active_step_idx, step_offset_pct
+    return "", "", 0, 0.0, 0
 
 
 def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
@@ -2099,7 +2327,7 @@ def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
     and returns (progress_pct, phase_label).  Rate-limited to avoid
     excessive SSH traffic.
     """
-    now = _time.time()
+    now = time.time()
     cached = _slurm_progress_cache.get(job.id)
     if cached:
         last_read, cached_progress, cached_phase = cached
@@ -2107,7 +2335,6 @@ def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
             return (cached_progress, cached_phase)
 
     try:
-        from backend.core.ssh_manager import get_ssh_manager
         ssh = get_ssh_manager()
         if not ssh.is_connected:
             return cached[1:] if cached else None
@@ -2120,7 +2347,7 @@ def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
         slurm_id = job.backend_job_id or ""
 
         # Resolve active log source for this poll (step log > container log > slurm log)
-        log_path, active_plugin_id, active_step_idx, _ = _resolve_active_slurm_log_path(
+        log_path, active_plugin_id, active_step_idx, _, log_size = _resolve_active_slurm_log_path(
             ssh=ssh,
             output_dir=output_dir,
             workflow_steps=workflow_steps,
@@ -2138,12 +2365,6 @@ def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
         # Per-job parser state: offset + ordered milestone cursor.
         state = _slurm_progress_state.get(job.id) or {}
         prior_milestone_idx = int(state.get("milestone_idx", -1))
-        from backend.core.phase_milestones import (
-            get_milestones,
-            get_plugin_checkpoint_milestones,
-            get_workflow_milestones,
-            get_workflow_step_weights,
-        )
         workflow_milestones = get_workflow_milestones(workflow_id) if workflow_id else []
         use_workflow_milestones = bool(workflow_milestones)
         if state.get("log_path") != log_path:
@@ -2163,6 +2384,7 @@ def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
             ssh=ssh,
             remote_path=log_path,
             offset=int(state.get("offset", 0)),
+            size=log_size,
         )
         state["offset"] = file_size
 
@@ -2196,8 +2418,8 @@ def _poll_slurm_progress(job: "Job") -> tuple[int, str] | None:
                     marker, _, _ = milestones[candidate_idx]
                     matched = False
                     try:
-                        matched = bool(_re.search(marker, log_delta))
-                    except _re.error:
+                        matched = bool(re.search(marker, log_delta))
+                    except re.error:
                         matched = marker in log_delta
                     if matched:
                         matched_idx = candidate_idx
@@ -2282,6 +2504,7 @@ def get_job(job_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/api/jobs/{job_id}/cancel")
+@_invalidates_jobs_progress
 def cancel_job(job_id: str, db: Session = Depends(get_db)):
     """Cancel a running job."""
     from backend.services.sample_eeg_jobs import SAMPLE_JOB_IDS
@@ -2308,21 +2531,33 @@ def cancel_job(job_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/api/jobs/{job_id}/logs")
-def get_job_logs(job_id: str):
-    """Get job logs."""
+def get_job_logs(job_id: str, since_offset: Optional[int] = None, full: bool = False):
+    """Get job logs.
+
+    With ``since_offset`` (local backend only) just the stdout written after
+    that byte offset is returned; poll again with the returned ``stdout_offset``.
+    SLURM logs are cut to their last LOG_TAIL_BYTES unless ``full`` is set.
+    """
     try:
         backend = get_backend()
-        logs = backend.get_job_logs(job_id)
+        if since_offset is not None and backend.backend_type == "local":
+            logs = backend.get_job_logs(job_id, since_offset=since_offset)
+        elif backend.backend_type == "slurm":
+            logs = backend.get_job_logs(job_id, full=full)
+        else:
+            logs = backend.get_job_logs(job_id)
         return {
             "job_id": job_id,
             "stdout": logs.stdout,
             "stderr": logs.stderr,
+            "stdout_offset": logs.stdout_offset,
         }
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Logs not found: {e}")
 
 
 @app.delete("/api/jobs/{job_id}")
+@_invalidates_jobs_progress
 def delete_job(job_id: str, db: Session = Depends(get_db)):
     """Delete a job -- stops the container first if still running."""
     from backend.services.sample_eeg_jobs import SAMPLE_JOB_IDS
@@ -2361,7 +2596,7 @@ def delete_job(job_id: str, db: Session = Depends(get_db)):
 # ---------------------------------------------------------------------------
 
 @app.post("/api/upload")
-async def upload_file(file: UploadFile = File(...)):
+def upload_file(file: UploadFile = File(...)):
     """Upload a single file to the server."""
     upload_dir = Path(settings.upload_dir)
     upload_dir.mkdir(parents=True, exist_ok=True)
@@ -2379,42 +2614,51 @@ async def upload_file(file: UploadFile = File(...)):
             dest_path = upload_dir / f"{stem}_{counter}{suffix}"
             counter += 1
 
-    # Write file
+    # Stream to disk in chunks (sync handler: runs in the threadpool) so a
+    # multi-GB scan is never held in memory
     with open(dest_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+        shutil.copyfileobj(file.file, f, 1 << 20)
+        size = f.tell()
 
-    return {"path": str(dest_path), "filename": safe_name, "size": len(content)}
+    return {"path": str(dest_path), "filename": safe_name, "size": size}
 
 
 @app.get("/api/browse")
 def browse_directory(path: str = ".", backend_type: str = "local"):
     """Browse directory to list files."""
-    target = Path(path).resolve()
+    target = os.path.realpath(path)
 
-    if not target.exists():
+    # Let scandir report a missing or non-directory path rather than
+    # stat-ing it twice up front
+    try:
+        # scandir entries carry the file type, so only files need a stat
+        with os.scandir(target) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Path not found: {path}")
-    if not target.is_dir():
+    except NotADirectoryError:
         raise HTTPException(status_code=400, detail=f"Not a directory: {path}")
+    except PermissionError:
+        raise HTTPException(status_code=403, detail=f"Permission denied: {path}")
 
     files = []
     directories = []
     nifti_files = []
 
     try:
-        for entry in sorted(target.iterdir()):
+        for entry in entries:
             if entry.name.startswith("."):
                 continue
             if entry.is_dir():
                 directories.append({
                     "name": entry.name,
-                    "path": str(entry),
+                    "path": entry.path,
                     "type": "directory",
                 })
             elif entry.is_file():
                 file_info = {
                     "name": entry.name,
-                    "path": str(entry),
+                    "path": entry.path,
                     "type": "file",
                     "size": entry.stat().st_size,
                 }
@@ -2427,8 +2671,8 @@ def browse_directory(path: str = ".", backend_type: str = "local"):
         raise HTTPException(status_code=403, detail=f"Permission denied: {path}")
 
     return {
-        "path": str(target),
-        "parent": str(target.parent),
+        "path": target,
+        "parent": os.path.dirname(target),
         "directories": directories,
         "files": files,
         "nifti_files": nifti_files,
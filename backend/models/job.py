@@ -67,6 +67,8 @@ class Job(Base):
         Index("idx_status_submitted", "status", "submitted_at"),
         Index("idx_user_status", "user_id", "status"),
         Index("idx_deleted", "deleted"),
+        # Job list and progress polling: live rows by status, newest first
+        Index("idx_deleted_status_submitted", "deleted", "status", "submitted_at"),
     )
 
     def __repr__(self) -> str:
@@ -11,8 +11,6 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from backend.connectors.base import BasePlatformConnector
-from backend.connectors.pennsieve import PennsieveConnector
-from backend.connectors.xnat import XNATConnector
 from backend.core.config import get_settings
 from backend.core.platform_config_store import (
     clear_platform_config,
@@ -38,12 +36,16 @@ def _get_connector(platform: str) -> BasePlatformConnector:
         )
 
     if platform not in _connectors:
+        # Connector modules pull in boto3/httpx; import them on first use so
+        # they stay off the API's startup path
         settings = get_settings()
         if platform == "pennsieve":
+            from backend.connectors.pennsieve import PennsieveConnector
             _connectors[platform] = PennsieveConnector(
                 api_url=settings.pennsieve_api_url
             )
         elif platform == "xnat":
+            from backend.connectors.xnat import XNATConnector
             _connectors[platform] = XNATConnector(
                 api_url=settings.xnat_api_url
             )
@@ -156,6 +158,7 @@ def pennsieve_agent_status():
     """Check Pennsieve Agent readiness required for uploads."""
     connector = _get_connector("pennsieve")
     _require_connected(connector)
+    from backend.connectors.pennsieve import PennsieveConnector
     if not isinstance(connector, PennsieveConnector):
         raise HTTPException(500, "Pennsieve connector is not available")
     try:
@@ -30,6 +30,66 @@ class TestHealthEndpoints:
         data = resp.json()
         assert "status" in data
 
+    def test_health_probes_run_concurrently(self, client):
+        """A slow or failing probe neither delays the others nor breaks /health."""
+        import threading
+        import backend.main as m
+        barrier = threading.Barrier(3, timeout=5)
+
+        def slow():
+            barrier.wait()
+            return {"healthy": True}
+
+        def broken():
+            raise RuntimeError("down")
+
+        probes = (("a", slow), ("b", slow), ("c", slow), ("d", broken))
+        with patch.object(m, "_HEALTH_PROBES", probes):
+            data = client.get("/health").json()
+        assert data["status"] == "degraded"
+        assert data["services"]["a"] == {"healthy": True}
+        assert data["services"]["d"] == {"healthy": False, "message": "down"}
+
+    def test_hung_probe_is_not_resubmitted(self, client):
+        """A probe stuck from an earlier request keeps one worker, not the pool."""
+        import threading
+        import backend.main as m
+        release = threading.Event()
+        calls = []
+
+        def hung():
+            calls.append(1)
+            release.wait(5)
+            return {"healthy": True}
+
+        def ok():
+            return {"healthy": True}
+
+        probes = (("slow", hung), ("a", ok), ("b", ok), ("c", ok))
+        try:
+            with patch.object(m, "_HEALTH_PROBES", probes), \
+                 patch.object(m, "_HEALTH_TIMEOUT_S", 0.2), \
+                 patch.object(m, "_health_inflight", {}):
+                first = client.get("/health").json()["services"]
+                second = client.get("/health").json()["services"]
+        finally:
+            release.set()
+        assert first["slow"]["message"] == "No response within 0.2s"
+        assert second["slow"] == {"healthy": False, "message": "Previous check still running"}
+        assert second["a"] == second["b"] == second["c"] == {"healthy": True}
+        assert len(calls) == 1
+
+    def test_redis_probe_reuses_client(self):
+        """The Redis probe connects once and pings over the pooled client."""
+        import sys
+        import backend.main as m
+        fake_redis = MagicMock()
+        with patch.object(m, "_redis_client", None), patch.dict(sys.modules, {"redis": fake_redis}):
+            assert m._probe_redis()["healthy"] is True
+            assert m._probe_redis()["healthy"] is True
+        assert fake_redis.Redis.call_count == 1
+        assert fake_redis.Redis.return_value.ping.call_count == 2
+
     def test_system_resources(self, client):
         """GET /api/system/resources returns CPU/memory info."""
         resp = client.get("/api/system/resources")
@@ -56,6 +116,29 @@ class TestPluginEndpoints:
         data = resp.json()
         assert "workflows" in data
 
+    def test_plugin_list_cached_until_reload(self, client):
+        """Registry-derived responses are built once and rebuilt after a reload."""
+        import backend.main as m
+        client.post("/api/registry/reload")
+        with patch.object(m, "get_plugin_workflow_registry",
+                          wraps=m.get_plugin_workflow_registry) as get_registry:
+            first = client.get("/api/plugins").json()
+            assert client.get("/api/plugins").json() == first
+            assert get_registry.call_count == 1
+            client.post("/api/registry/reload")
+            client.get("/api/plugins")
+            assert get_registry.call_count == 3
+
+    def test_default_response_encodes_like_stdlib_json(self):
+        """The orjson default response accepts what JSONResponse does."""
+        import json
+        import backend.main as m
+        if m.orjson is None:
+            pytest.skip("orjson not installed")
+        content = {"steps": {0: "a", 1: "b"}, "name": "x\u00e9"}
+        body = m._ORJSONResponse(content).body
+        assert json.loads(body) == json.loads(json.dumps(content))
+
     def test_get_nonexistent_plugin(self, client):
         """GET /api/plugins/nonexistent returns 404."""
         resp = client.get("/api/plugins/this_does_not_exist")
@@ -112,12 +195,125 @@ class TestBrowseEndpoint:
         assert "files" in data
         assert "directories" in data
 
+    def test_browse_lists_sorted_entries(self, client, tmp_path):
+        """Entries come back sorted by name, dot-files hidden, NIfTI highlighted."""
+        (tmp_path / "sub-02").mkdir()
+        (tmp_path / "b.nii.gz").write_bytes(b"xx")
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / ".hidden").write_text("h")
+        data = client.get("/api/browse", params={"path": str(tmp_path)}).json()
+        assert [f["name"] for f in data["files"]] == ["a.txt", "b.nii.gz"]
+        assert data["files"][1] == {"name": "b.nii.gz", "path": str(tmp_path / "b.nii.gz"),
+                                    "type": "file", "size": 2}
+        assert [d["name"] for d in data["directories"]] == ["sub-02"]
+        assert [f["name"] for f in data["nifti_files"]] == ["b.nii.gz"]
+        assert data["parent"] == str(tmp_path.parent)
+        resp = client.get("/api/browse", params={"path": str(tmp_path / "a.txt")})
+        assert resp.status_code == 400
+
+    def test_upload_streams_to_disk(self, client, tmp_path):
+        """Uploads are written in full and renamed rather than overwritten."""
+        import backend.main as m
+        data = bytes(range(256)) * 8192  # 2 MiB, more than one copy chunk
+        with patch.object(m.settings, "upload_dir", str(tmp_path)):
+            first = client.post("/api/upload", files={"file": ("scan.nii.gz", data)}).json()
+            second = client.post("/api/upload", files={"file": ("scan.nii.gz", b"x")}).json()
+        assert first["size"] == len(data)
+        assert (tmp_path / "scan.nii.gz").read_bytes() == data
+        assert second["path"] == str(tmp_path / "scan.nii_1.gz")
+        assert second["size"] == 1
+
     def test_browse_nonexistent(self, client):
         """GET /api/browse with bad path returns 404."""
         resp = client.get("/api/browse", params={"path": "/nonexistent/path/xyz"})
         assert resp.status_code == 404
 
 
+class TestBatchInputMatching:
+    """Test input file matching for batch submission."""
+
+    def test_match_input_files_follows_glob_rules(self, tmp_path):
+        """Matches files only, skips dot-files and falls back to glob for subpaths."""
+        from backend.main import _match_input_files
+        for name in ("s2.nii.gz", "s1.nii.gz", ".s0.nii.gz", "notes.txt"):
+            (tmp_path / name).write_text("x")
+        (tmp_path / "d.nii.gz").mkdir()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "s3.nii.gz").write_text("x")
+        assert _match_input_files(tmp_path, "*.nii.gz") == [
+            str(tmp_path / "s1.nii.gz"), str(tmp_path / "s2.nii.gz"),
+        ]
+        assert _match_input_files(tmp_path, "sub/*.nii.gz") == [str(tmp_path / "sub" / "s3.nii.gz")]
+        assert _match_input_files(tmp_path, "s[12].nii.gz") == _match_input_files(tmp_path, "*.nii.gz")
+        assert _match_input_files(tmp_path, "*.txt") == [str(tmp_path / "notes.txt")]
+
+
+class TestLegacySubmit:
+    """Test legacy pipeline job submission."""
+
+    def test_submit_merges_defaults_without_touching_registry(self, client):
+        """Request values override defaults; custom resources stay per-request."""
+        import backend.main as m
+        pipeline = m.get_pipeline_registry().list_pipelines()[0]
+        before = dict(vars(pipeline.resources))
+        backend = MagicMock()
+        with patch.object(m, "get_backend", return_value=backend):
+            resp = client.post("/api/jobs/submit", json={
+                "pipeline_name": pipeline.name,
+                "input_files": ["/data/t1.nii.gz"],
+                "parameters": {"extra": 1},
+                "custom_resources": {"memory_gb": 999},
+            })
+        assert resp.status_code == 200
+        spec = backend.submit_job.call_args.args[0]
+        assert spec.parameters == {**pipeline.default_params, "extra": 1}
+        assert spec.resources.memory_gb == 999
+        assert vars(pipeline.resources) == before
+
+
+class TestJobLogsEndpoint:
+    """Test the job logs endpoint."""
+
+    def test_full_passed_to_slurm_backend(self, client):
+        """SLURM logs are tailed by default and whole with ?full=true."""
+        import backend.main as m
+        from backend.core.execution import JobLogs
+        backend = MagicMock(backend_type="slurm")
+        backend.get_job_logs.return_value = JobLogs(job_id="j1", stdout="out")
+        with patch.object(m, "get_backend", return_value=backend):
+            assert client.get("/api/jobs/j1/logs").json()["stdout"] == "out"
+            client.get("/api/jobs/j1/logs", params={"full": "true"})
+        assert [c.kwargs for c in backend.get_job_logs.call_args_list] == [{"full": False}, {"full": True}]
+
+
+class TestWorkflowBatchSubmit:
+    """Test per-subject workflow batch submission."""
+
+    def test_subjects_submitted_concurrently_in_order(self, client, tmp_path):
+        """Subjects submit side by side; results keep subject order and per-subject errors."""
+        import threading
+        import backend.main as m
+        workflow_id = m.get_plugin_workflow_registry().list_workflows()[0].id
+        barrier = threading.Barrier(3, timeout=5)
+
+        def submit_job(spec, job_id):
+            barrier.wait()  # a sequential loop would never get past this
+            if spec.parameters["subject_id"] == "02":
+                raise RuntimeError("sbatch failed")
+            return job_id
+
+        backend = MagicMock(submit_job=MagicMock(side_effect=submit_job))
+        with patch.object(m, "get_backend", return_value=backend), \
+             patch.object(m, "_check_licenses"), \
+             patch.object(m, "_enforce_disk_guard_for_submission"), \
+             patch.object(m.settings, "data_dir", str(tmp_path)):
+            data = client.post(f"/api/workflows/{workflow_id}/submit-batch", json={
+                "bids_dir": str(tmp_path), "subject_ids": ["01", "02", "03"],
+            }).json()
+        assert [j["subject_id"] for j in data["jobs"]] == ["01", "03"]
+        assert data["errors"] == [{"subject_id": "02", "error": "sbatch failed"}]
+
+
 class TestDicomEndpoint:
     """Test DICOM de-identification endpoint."""
 
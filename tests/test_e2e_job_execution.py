@@ -124,28 +124,61 @@ class TestVolumePreparation:
         assert str(output_dir) in volumes
         assert volumes[str(output_dir)]["bind"] == "/data/outputs"
 
+    def test_ensure_output_layout_is_idempotent(self, temp_data_dir):
+        """_ensure_output_layout creates the full tree and tolerates reruns."""
+        from backend.execution.celery_tasks import JOB_OUTPUT_SUBDIRS, _ensure_output_layout
+
+        output_dir = temp_data_dir / "outputs" / "layout-job"
+        _ensure_output_layout(output_dir)
+        _ensure_output_layout(output_dir)
+        for sub in JOB_OUTPUT_SUBDIRS:
+            assert (output_dir / sub).is_dir()
+
 
 class TestParameterSanitization:
     """Test shell injection prevention."""
 
     def test_sanitize_param_blocks_injection(self):
-        """_sanitize_param strips dangerous shell characters."""
-        from backend.execution.celery_tasks import _sanitize_param
+        """sanitize_param strips dangerous shell characters."""
+        from backend.core.templating import sanitize_param
 
-        assert _sanitize_param("normal_value") == "normal_value"
-        assert _sanitize_param("path/to/file.nii.gz") == "path/to/file.nii.gz"
-        assert ";" not in _sanitize_param("; rm -rf /")
-        assert "|" not in _sanitize_param("| cat /etc/passwd")
-        assert "`" not in _sanitize_param("`whoami`")
-        assert "$" not in _sanitize_param("$(whoami)")
+        assert sanitize_param("normal_value") == "normal_value"
+        assert sanitize_param("path/to/file.nii.gz") == "path/to/file.nii.gz"
+        assert ";" not in sanitize_param("; rm -rf /")
+        assert "|" not in sanitize_param("| cat /etc/passwd")
+        assert "`" not in sanitize_param("`whoami`")
+        assert "$" not in sanitize_param("$(whoami)")
 
     def test_sanitize_preserves_safe_chars(self):
-        """_sanitize_param allows alphanumeric, dashes, dots, slashes."""
-        from backend.execution.celery_tasks import _sanitize_param
+        """sanitize_param allows alphanumeric, dashes, dots, slashes."""
+        from backend.core.templating import sanitize_param
+
+        assert sanitize_param("sub-01_ses-02") == "sub-01_ses-02"
+        assert sanitize_param("/data/inputs/T1w.nii.gz") == "/data/inputs/T1w.nii.gz"
+        assert sanitize_param("--threads 8") == "--threads 8"
+
+    def test_render_command_substitutes_in_one_pass(self):
+        """render_command fills known placeholders and leaves shell vars alone."""
+        from backend.core.templating import render_command
+
+        template = 'run --threads {threads} --flag {flag} --home "${HOME}" {_internal}'
+        command = render_command(template, {"threads": 8, "flag": True, "_internal": "x"})
+        assert command == 'run --threads 8 --flag true --home "${HOME}" {_internal}'
+
+    def test_shell_params_reused_across_templates(self):
+        """Precomputed shell params render each template like render_command."""
+        from backend.core.templating import fill_template, render_command, shell_params
+
+        params = {"subject_id": "sub-01;rm", "threads": 4}
+        values = shell_params(params)
+        for template in ("recon-all -s {subject_id}", "run -n {threads} ${threads}"):
+            assert fill_template(template, values) == render_command(template, params)
+
+    def test_render_command_sanitizes_values(self):
+        """Parameter values are sanitised before substitution."""
+        from backend.core.templating import render_command
 
-        assert _sanitize_param("sub-01_ses-02") == "sub-01_ses-02"
-        assert _sanitize_param("/data/inputs/T1w.nii.gz") == "/data/inputs/T1w.nii.gz"
-        assert _sanitize_param("--threads 8") == "--threads 8"
+        assert render_command("echo {name}", {"name": "a; rm -rf /"}) == "echo a rm -rf /"
 
 
 class TestImageValidation:
@@ -86,6 +86,77 @@ class TestLocalBackend:
             # submit_job may raise if DB is not available, so just test instantiation
             assert backend is not None
 
+    def test_submit_jobs_dispatches_one_group(self, tmp_dir):
+        """submit_jobs() publishes the whole batch as a single Celery group."""
+        from backend.execution.local_backend import LocalDockerBackend
+        from backend.core.execution import JobSpec
+
+        backend = LocalDockerBackend(data_dir=str(tmp_dir))
+        specs = [
+            JobSpec(pipeline_name="test", container_image="test:latest",
+                    input_files=[f"/fake/input{i}.nii.gz"], output_dir="/fake/output")
+            for i in range(3)
+        ]
+        group_result = MagicMock(id="group-1", results=[MagicMock(id=f"task-{i}") for i in range(3)])
+
+        with patch("backend.execution.local_backend.group") as mock_group, \
+                patch("backend.execution.local_backend.celery_app"), \
+                patch("backend.execution.local_backend.get_db_context"):
+            mock_group.return_value.apply_async.return_value = group_result
+            job_ids = backend.submit_jobs(specs)
+
+        assert len(job_ids) == 3
+        mock_group.assert_called_once()
+        assert len(mock_group.call_args[0][0]) == 3
+        assert [backend._jobs[j]["celery_task_id"] for j in job_ids] == ["task-0", "task-1", "task-2"]
+
+
+    def test_tracking_timestamps_convert_to_utc(self):
+        """time_ns() tracking stamps become naive-UTC datetimes for JobInfo."""
+        from datetime import datetime
+        from backend.core.execution import ns_to_datetime
+
+        assert ns_to_datetime(None) is None
+        assert ns_to_datetime(1_700_000_000_123_456_789) == datetime(2023, 11, 14, 22, 13, 20, 123456)
+
+
+class TestLocalLogOffsets:
+    """Incremental log reads for LocalDockerBackend.get_job_logs."""
+
+    def test_split_utf8_character_is_deferred(self, tmp_dir):
+        """A multi-byte character cut at EOF is returned by the next read."""
+        from backend.execution.local_backend import _read_from_offset
+
+        log = tmp_dir / "container.log"
+        encoded = "é".encode("utf-8")
+        log.write_bytes(b"step 1 " + encoded[:1])
+        text, offset = _read_from_offset(log, 0)
+        assert text == "step 1 "
+        assert offset == 7
+
+        with open(log, "ab") as f:
+            f.write(encoded[1:] + b" done")
+        text, offset = _read_from_offset(log, offset)
+        assert text == "é done"
+        assert offset == log.stat().st_size
+
+    def test_get_job_logs_since_offset(self, tmp_dir):
+        """Polling with the returned offset yields only new output."""
+        from backend.execution.local_backend import LocalDockerBackend
+
+        backend = LocalDockerBackend(data_dir=str(tmp_dir))
+        log_dir = tmp_dir / "outputs" / "job-1" / "logs"
+        log_dir.mkdir(parents=True)
+        (log_dir / "container.log").write_text("first\n")
+
+        logs = backend.get_job_logs("job-1")
+        assert logs.stdout == "first\n"
+
+        with open(log_dir / "container.log", "a") as f:
+            f.write("second\n")
+        logs = backend.get_job_logs("job-1", since_offset=logs.stdout_offset)
+        assert logs.stdout == "second\n"
+
 
 class TestRemoteDockerBackend:
     """Test RemoteDockerBackend methods."""
@@ -132,3 +203,428 @@ class TestRemoteDockerBackend:
             assert status == JobStatus.UNKNOWN
         except Exception:
             pass  # Expected when not connected
+
+    def test_inspect_cached_across_status_and_info(self):
+        """get_job_status + get_job_info share one inspect; exited containers stay cached."""
+        import json
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        from backend.core.execution import JobStatus
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        state = {"Status": "exited", "ExitCode": 0, "StartedAt": "2024-01-01T10:00:00.123Z",
+                 "FinishedAt": "2024-01-01T11:00:00.456Z"}
+        with patch.object(backend, "_run", return_value=(0, json.dumps(state), "")) as run:
+            assert backend.get_job_status("job-a") == JobStatus.COMPLETED
+            info = backend.get_job_info("job-a")
+            assert backend.get_job_status("job-a") == JobStatus.COMPLETED
+        assert run.call_count == 1
+        assert info.exit_code == 0
+        assert info.started_at.hour == 10
+
+    def test_refresh_all_statuses_primes_status_cache(self):
+        """One docker ps answers later get_job_status calls without SSH."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        from backend.core.execution import JobStatus
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        ok, bad = backend._container_name("job-ok"), backend._container_name("job-bad")
+        ps_out = f"{ok}|exited|Exited (0) 2 minutes ago\n{bad}|exited|Exited (137) 1 hour ago\n"
+        with patch.object(backend, "_run", return_value=(0, ps_out, "")) as run:
+            assert backend.refresh_all_statuses() == 2
+            assert backend.get_job_status("job-ok") == JobStatus.COMPLETED
+            assert backend.get_job_status("job-bad") == JobStatus.FAILED
+        assert run.call_count == 1
+
+    def test_refresh_all_statuses_installs_watcher_once(self):
+        """The state watcher script is shipped with the first refresh only."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        with patch.object(backend, "_run", return_value=(0, "", "")) as run:
+            backend.refresh_all_statuses()
+            backend.refresh_all_statuses()
+        first, second = (c.args[0] for c in run.call_args_list)
+        assert ".ni_watcher.sh" in first and "printf" in first
+        assert "printf" not in second and '.states"' in second
+
+    def test_resource_flags_cached_per_spec(self):
+        """Identical resources reuse the same pre-rendered docker flags."""
+        from backend.execution.remote_docker_backend import _resource_flags
+        flags = _resource_flags(4, 8)
+        assert flags == ("--cpus=4", "--memory=8g", "-e", "OMP_NUM_THREADS=4",
+                         "-e", "ITK_GLOBAL_DEFAULT_NUMBER_OF_THREADS=4")
+        assert _resource_flags(4, 8) is flags
+        assert _resource_flags(4, 8, "--gpus all")[-2:] == ("--gpus", "all")
+
+    def test_ensure_dirs_batch_skips_known_dirs(self):
+        """Directories are created in one mkdir and never requested twice."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        dirs = backend._job_dirs("j1") + backend._job_dirs("j2", workflow=True)
+        with patch.object(backend, "_run", return_value=(0, "", "")) as run:
+            backend._ensure_dirs_batch(dirs)
+            backend._ensure_dirs_batch(backend._job_dirs("j1"))
+        assert run.call_count == 1
+        assert run.call_args.args[0].startswith("mkdir -p ")
+        assert "j2/outputs/bundle" in run.call_args.args[0]
+
+    def test_ensure_image_uses_present_cache(self):
+        """Images listed by docker images are not inspected or pulled again."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        with patch.object(backend, "_run", return_value=(0, "nipreps/fmriprep:23.2.1\nubuntu:latest\n", "")) as run:
+            backend._ensure_image("nipreps/fmriprep:23.2.1")
+            backend._ensure_image("ubuntu")
+        assert run.call_count == 1
+
+    def test_cache_journal_replay(self):
+        """The remote cache journal restores jobs, terminal states and images."""
+        import json
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        journal = "\n".join(json.dumps(e) for e in [
+            {"op": "job", "job_id": "j1", "meta": {"container_name": "neuroinsight_j1",
+                                                   "submitted_ns": 1704067200 * 10**9}},
+            {"op": "job", "job_id": "j2", "meta": {"container_name": "neuroinsight_j2"}},
+            {"op": "drop", "job_id": "j2", "container_name": "neuroinsight_j2"},
+            {"op": "state", "container_name": "neuroinsight_j1",
+             "state": {"Status": "exited", "ExitCode": 0, "StartedAt": "x"}},
+            {"op": "images", "images": ["ubuntu:latest"]},
+        ])
+        ssh = MagicMock()
+        ssh.read_file.return_value = journal
+        backend._load_cache(ssh)
+        assert list(backend._jobs) == ["j1"]
+        assert backend._jobs["j1"]["submitted_ns"] == 1704067200 * 10**9
+        assert "neuroinsight_j1" in backend._inspect_cache
+        assert backend._image_present_cache == {"ubuntu:latest"}
+
+    def test_logs_fetch_only_new_lines(self):
+        """get_job_logs polls with --since and appends only unseen lines."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        first = "2024-01-01T10:00:00.5Z step 1\n2024-01-01T10:00:01.25Z step 2\n"
+        second = "2024-01-01T10:00:01.25Z step 2\n2024-01-01T10:00:02Z step 3\n"
+        with patch.object(backend, "_run", side_effect=[(0, first, ""), (0, second, "")]) as run:
+            assert backend.get_job_logs("job-a").stdout == "step 1\nstep 2\n"
+            assert backend.get_job_logs("job-a").stdout == "step 1\nstep 2\nstep 3\n"
+        assert "--tail 1000" in run.call_args_list[0][0][0]
+        assert "--since 2024-01-01T10:00:01.25Z" in run.call_args_list[1][0][0]
+
+    def test_job_id_from_container_uses_index(self):
+        """Container-name lookups follow track/untrack."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        backend._track_job("job-1", {"container_name": "neuroinsight_job1"})
+        assert backend._job_id_from_container("neuroinsight_job1") == "job-1"
+        backend._untrack_job("job-1")
+        assert backend._job_id_from_container("neuroinsight_job1") is None
+
+    def test_journal_entries_ride_along_with_next_command(self):
+        """Queued journal entries are appended by the next remote command."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        ssh = MagicMock()
+        ssh.execute.return_value = (0, "", "")
+        with patch.object(backend, "_ssh", return_value=ssh):
+            backend._journal({"op": "image", "image": "ubuntu:latest"})
+            assert ssh.execute.call_count == 0
+            backend._run("docker ps")
+        cmd = ssh.execute.call_args.args[0]
+        assert cmd.endswith("; docker ps")
+        assert '"image": "ubuntu:latest"' in cmd and ".neuroinsight_cache.json" in cmd
+
+    def test_mutable_tag_pulled_only_when_digest_changes(self, monkeypatch):
+        """With refresh enabled, :latest is pulled only when the registry digest moves."""
+        import json
+        import backend.execution.remote_docker_backend as rdb
+        monkeypatch.setattr(rdb, "REFRESH_MUTABLE_TAGS", True)
+        backend = rdb.RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        backend._image_present_cache = {"ubuntu:latest"}
+        manifest = json.dumps({"Descriptor": {"digest": "sha256:aaa"}})
+        with patch.object(backend, "_run", return_value=(0, manifest, "")) as run:
+            backend._ensure_image("ubuntu")
+            pulls = [c for c in run.call_args_list if c[0][0].startswith("docker pull")]
+            assert len(pulls) == 1
+            backend._ensure_image("ubuntu")
+            pulls = [c for c in run.call_args_list if c[0][0].startswith("docker pull")]
+            assert len(pulls) == 1
+
+    def test_terminal_workflow_info_is_memoised(self):
+        """A finished workflow job answers info/status without SSH."""
+        from backend.execution.remote_docker_backend import RemoteDockerBackend
+        from backend.core.execution import JobStatus
+        backend = RemoteDockerBackend(ssh_host="test.com", ssh_user="user")
+        backend._track_job("wf-1", {"container_name": "ni_workflow_wf1", "is_workflow": True,
+                                    "job_dir": "/w/jobs/wf-1"})
+        status_file = '{"status":"completed","step":2,"total":2,"step_name":"done","exit_code":0}'
+        with patch.object(backend, "_run", return_value=(0, status_file, "")) as run:
+            assert backend.get_job_info("wf-1").status == JobStatus.COMPLETED
+            calls = run.call_count
+            assert backend.get_job_info("wf-1").exit_code == 0
+            assert backend.get_job_status("wf-1") == JobStatus.COMPLETED
+        assert run.call_count == calls
+
+
+class TestSLURMBackend:
+    """Test SLURM backend helpers against a mocked SSH manager."""
+
+    def _backend(self):
+        from backend.execution.slurm_backend import SLURMBackend
+        ssh = MagicMock()
+        ssh.is_connected = True
+        return SLURMBackend(ssh_host="hpc.test", ssh_user="user", work_dir="/scratch/u", ssh_manager=ssh)
+
+    def test_ssh_exec_multi_splits_outputs(self):
+        """Batched commands come back as one stdout string each."""
+        backend = self._backend()
+        out = "a\nb\n\n___NI_SEP___ 0\n\n___NI_SEP___ 1\nc\n___NI_SEP___ 0\n"
+        backend._ssh.execute.return_value = (0, out, "")
+        assert backend._ssh_exec_multi(["x", "y", "z"]) == ["a\nb\n", "", "c"]
+        assert backend._ssh_exec_multi_ec(["x", "y", "z", "w"]) == [
+            (0, "a\nb\n"), (1, ""), (0, "c"), (-1, ""),
+        ]
+        assert backend._ssh.execute.call_count == 2
+
+    def test_get_job_logs_single_round_trip(self):
+        """SLURM stdout, stderr and the container log are read in one exec."""
+        from backend.execution.slurm_backend import _JobEntry
+        backend = self._backend()
+        backend._jobs["j1"] = _JobEntry("j1", slurm_id="42", job_dir="/scratch/u/neuroinsight/jobs/j1")
+        out = "\n___NI_SEP___ 0\nwarn\n\n___NI_SEP___ 0\nstep 1\n\n___NI_SEP___ 0\n"
+        backend._ssh.execute.return_value = (0, out, "")
+        logs = backend.get_job_logs("j1")
+        assert logs.stdout == "step 1\n"
+        assert logs.stderr == "warn\n"
+        assert backend._ssh.execute.call_count == 1
+
+    def test_get_job_statuses_batches_queries(self):
+        """Several jobs are resolved from one squeue + sacct round trip."""
+        from backend.execution.slurm_backend import _JobEntry
+        from backend.core.execution import JobStatus
+        backend = self._backend()
+        backend._jobs["a"] = _JobEntry("a", slurm_id="101", status=JobStatus.PENDING)
+        backend._jobs["b"] = _JobEntry("b", slurm_id="102", status=JobStatus.PENDING)
+        out = ("101|RUNNING\n\n___NI_SEP___ 0\n"
+               "101|RUNNING|0:0|2024-01-01T10:00:00|Unknown\n"
+               "102|CANCELLED by 5|0:15|2024-01-01T10:00:00|2024-01-01T10:05:00\n"
+               "102.batch|CANCELLED|0:15|2024-01-01T10:00:00|2024-01-01T10:05:00\n"
+               "\n___NI_SEP___ 0\n")
+        backend._ssh.execute.return_value = (0, out, "")
+        assert backend.get_job_statuses(["a", "b"]) == {
+            "a": JobStatus.RUNNING, "b": JobStatus.CANCELLED,
+        }
+        assert backend._ssh.execute.call_count == 1
+
+    def test_get_job_statuses_prefers_live_queue(self):
+        """Queued jobs come from the squeue mirror; only departed ones hit sacct."""
+        from backend.execution.slurm_backend import _JobEntry
+        from backend.core.execution import JobStatus
+        backend = self._backend()
+        backend._squeue = MagicMock()
+        backend._squeue.states.return_value = {"101": "RUNNING"}
+        backend._jobs["a"] = _JobEntry("a", slurm_id="101", status=JobStatus.PENDING)
+        backend._jobs["b"] = _JobEntry("b", slurm_id="102", status=JobStatus.RUNNING)
+        backend._ssh.execute.return_value = (
+            0, "102|COMPLETED|0:0|2024-01-01T10:00:00|2024-01-01T11:00:00\n", "")
+        assert backend.get_job_statuses(["a", "b"]) == {
+            "a": JobStatus.RUNNING, "b": JobStatus.COMPLETED,
+        }
+        assert backend._ssh.execute.call_count == 1
+        assert backend._ssh.execute.call_args.args[0].startswith("sacct -j 102 ")
+
+    def test_query_sacct_bulk_batches_ids(self, monkeypatch):
+        """sacct is queried once per SACCT_BATCH_SIZE IDs; step rows are ignored."""
+        from backend.execution import slurm_backend
+        from backend.core.execution import JobStatus
+        monkeypatch.setattr(slurm_backend, "SACCT_BATCH_SIZE", 2)
+        backend = self._backend()
+        # Batches run concurrently, so answer by command rather than call order
+        outputs = {
+            "sacct -j 1,2 ": "1|COMPLETED|0:0|2024-01-01T10:00:00|2024-01-01T11:00:00\n"
+                             "1.batch|COMPLETED|0:0|2024-01-01T10:00:00|2024-01-01T11:00:00\n"
+                             "2|RUNNING|0:0|2024-01-01T10:30:00|Unknown\n",
+            "sacct -j 3 ": "3|FAILED|2:0|2024-01-01T09:00:00|2024-01-01T09:05:00\n",
+        }
+        backend._ssh.execute.side_effect = lambda cmd, timeout=60: (
+            0, next(out for prefix, out in outputs.items() if cmd.startswith(prefix)), "",
+        )
+        live = backend._query_sacct_bulk(["1", "2", "3"])
+        assert backend._ssh.execute.call_count == 2
+        assert live["1"]["status"] == JobStatus.COMPLETED
+        assert live["2"]["status"] == JobStatus.RUNNING and "end_time" not in live["2"]
+        assert live["3"]["exit_code"] == 2
+
+    def test_parse_progress_reads_tail_and_never_regresses(self, monkeypatch):
+        """Progress comes from the log tail and keeps its high-water mark."""
+        from backend.execution.slurm_backend import _JobEntry
+        from backend.execution import slurm_backend
+        monkeypatch.setattr(slurm_backend, "get_milestones",
+                            lambda plugin_id: [("Stage A", 20, "A"), ("Stage (B", 60, "B")])
+        slurm_backend._compiled_milestones.cache_clear()
+        backend = self._backend()
+        backend._jobs["j1"] = _JobEntry("j1", job_dir="/w/jobs/j1", plugin_id="p")
+        try:
+            backend._ssh.execute.return_value = (0, "14\nx\nStage (B done\n", "")
+            assert backend._parse_progress("j1") == (60, "B")
+            assert "tail -c +" in backend._ssh.execute.call_args.args[0]
+            backend._ssh.execute.return_value = (0, "28\nStage A again\n", "")
+            assert backend._parse_progress("j1") == (60, "B")
+        finally:
+            slurm_backend._compiled_milestones.cache_clear()
+
+    def test_parse_sacct_fields(self):
+        """Rows parse to status, exit code and ISO times; placeholders are skipped."""
+        from datetime import datetime
+        from backend.core.execution import JobStatus
+        backend = self._backend()
+        info = backend._parse_sacct_fields(
+            "7|CANCELLED by 5|0:15|2024-01-01T10:00:00|2024-01-01T10:05:30".split("|"))
+        assert info == {
+            "status": JobStatus.CANCELLED, "exit_code": 0,
+            "start_time": datetime(2024, 1, 1, 10, 0),
+            "end_time": datetime(2024, 1, 1, 10, 5, 30),
+        }
+        info = backend._parse_sacct_fields("8|PENDING|0:0|None|Unknown".split("|"))
+        assert "start_time" not in info and "end_time" not in info
+
+    def test_required_literal(self):
+        """Only literals every match must contain are used as prefilters."""
+        from backend.execution.slurm_backend import _required_literal
+        assert _required_literal("Stage A done") == "Stage A done"
+        assert _required_literal("Running.*dcm2niix") == "dcm2niix"
+        assert _required_literal("Finished|Complete|Done") is None
+        assert _required_literal("left.*hippo[a-z]+") is None
+
+    def test_parse_progress_fetches_only_new_bytes(self):
+        """Each poll resumes from the last log size; an unchanged log skips matching."""
+        from backend.execution.slurm_backend import _JobEntry, LOG_OVERLAP_BYTES
+        backend = self._backend()
+        backend._jobs["j1"] = _JobEntry("j1", job_dir="/w/jobs/j1", progress=40, current_phase="A")
+        backend._ssh.execute.return_value = (0, "10000\n", "")
+        assert backend._parse_progress("j1") == (40, "A")
+        assert backend._jobs["j1"].log_offset == 10000
+        backend._parse_progress("j1")
+        cmd = backend._ssh.execute.call_args.args[0]
+        assert f"o={10000 - LOG_OVERLAP_BYTES};" in cmd
+        assert '[ "$s" -eq 10000 ] ||' in cmd
+
+    def test_get_job_logs_tails_unless_full(self):
+        """Logs are tailed by default and read whole with full=True."""
+        from backend.execution.slurm_backend import _JobEntry
+        backend = self._backend()
+        backend._jobs["j1"] = _JobEntry("j1", slurm_id="42", job_dir="/w/jobs/j1")
+        backend._ssh.execute.return_value = (0, "", "")
+        backend.get_job_logs("j1")
+        assert backend._ssh.execute.call_args.args[0].count("tail -c ") == 3
+        backend.get_job_logs("j1", full=True)
+        assert "tail -c" not in backend._ssh.execute.call_args.args[0]
+
+    def test_slurm_id_db_lookup_is_cached(self):
+        """A job known only to the DB is looked up once."""
+        from contextlib import contextmanager
+        backend = self._backend()
+        db = MagicMock()
+        db.query.return_value.filter_by.return_value.first.return_value = MagicMock(backend_job_id="77")
+
+        @contextmanager
+        def fake_db():
+            yield db
+
+        with patch("backend.execution.slurm_backend.get_db_context", fake_db):
+            assert backend._get_slurm_id("j1") == "77"
+            assert backend._get_slurm_id("j1") == "77"
+        assert db.query.call_count == 1
+
+    def test_build_submit_command_writes_files_and_submits(self, tmp_path):
+        """The one-shot submit script writes content verbatim, then runs sbatch."""
+        import subprocess
+        from backend.execution.slurm_backend import SLURMBackend
+        scripts = tmp_path / "scripts"
+        scripts.mkdir()
+        script = "#!/bin/bash\necho \"$HOME\" `id`\ncat << 'NI_STATS_EOF'\nx\nNI_STATS_EOF\n"
+        cmd = SLURMBackend._build_submit_command(
+            str(scripts / "run.sh"), script, '{"a":"$b"}', None,
+        ).replace('sbatch "', 'echo "Submitted batch job 42 ')
+        result = subprocess.run(["sh", "-c", cmd], capture_output=True, text=True)
+        assert result.returncode == 0
+        assert "Submitted batch job 42" in result.stdout
+        assert (scripts / "run.sh").read_text() == script
+        assert (scripts / "job_spec.json").read_text() == '{"a":"$b"}\n'
+
+    def test_health_check_uses_exit_codes(self):
+        """Probe results come from exit codes, not from parsing 'not found'."""
+        backend = self._backend()
+        backend.partition = "batch"
+        backend._ssh.execute.return_value = (0, (
+            "slurm 23.02.1\n___NI_SEP___ 0\n"
+            "batch* up 2-00:00:00 4\n\n___NI_SEP___ 0\n"
+            "\n___NI_SEP___ 1\n"
+            "\n___NI_SEP___ 0\n"
+            "\n___NI_SEP___ 1\n"
+        ), "")
+        health = backend.health_check()
+        assert health["healthy"] is True
+        assert health["details"]["slurm_version"] == "slurm 23.02.1"
+        assert health["details"]["container_runtime_switched"] is True
+        assert health["details"]["work_dir_accessible"] is False
+
+    def test_job_dir_accepts_either_work_dir_style(self):
+        """HPC_WORK_DIR may be the parent of neuroinsight/ or the folder itself."""
+        backend = self._backend()
+        assert backend._job_dir("j1") == "/scratch/u/neuroinsight/jobs/j1"
+        backend.work_dir = "/scratch/u/neuroinsight/"
+        assert backend._job_dir("j1") == "/scratch/u/neuroinsight/jobs/j1"
+
+    def test_get_job_status_single_round_trip(self):
+        """get_job_status asks squeue and sacct in one exec."""
+        from backend.execution.slurm_backend import _JobEntry
+        from backend.core.execution import JobStatus
+        backend = self._backend()
+        backend._jobs["j1"] = _JobEntry("j1", slurm_id="42", status=JobStatus.PENDING)
+        backend._ssh.execute.return_value = (0, "\n___NI_SEP___ 0\n42|COMPLETED|0:0|2024-01-01T10:00:00|2024-01-01T11:00:00\n\n___NI_SEP___ 0\n", "")
+        assert backend.get_job_status("j1") == JobStatus.COMPLETED
+        assert backend._ssh.execute.call_count == 1
+
+    def test_sacct_records_cached_until_stale_or_final(self, monkeypatch):
+        """Fresh and finished sacct records are served without SSH; cancel invalidates."""
+        from backend.execution import slurm_backend
+        from backend.core.execution import JobStatus
+        backend = self._backend()
+        backend._ssh.execute.return_value = (0, (
+            "1|RUNNING|0:0|2024-01-01T10:00:00|Unknown\n"
+            "2|COMPLETED|0:0|2024-01-01T10:00:00|2024-01-01T11:00:00\n"
+        ), "")
+        assert backend._query_sacct_bulk(["1", "2"])["1"]["status"] == JobStatus.RUNNING
+        assert backend._query_sacct_bulk(["1", "2"])["2"]["status"] == JobStatus.COMPLETED
+        assert backend._ssh.execute.call_count == 1
+
+        monkeypatch.setattr(slurm_backend, "SACCT_CACHE_TTL_S", 0)
+        backend._query_sacct_bulk(["2"])  # finished: still cached
+        assert backend._ssh.execute.call_count == 1
+        backend._query_sacct_bulk(["1"])  # running and stale: re-queried
+        assert backend._ssh.execute.call_count == 2
+
+        backend._invalidate_sacct("2")
+        backend._query_sacct_bulk(["2"])
+        assert backend._ssh.execute.call_count == 3
+
+    def test_ensure_bids_description_single_exec(self, tmp_path):
+        """Missing description is written by the same command that checks for it."""
+        import json
+        import subprocess
+        backend = self._backend()
+
+        def run(cmd, timeout=None):
+            r = subprocess.run(["sh", "-c", cmd], capture_output=True, text=True)
+            return r.returncode, r.stdout, r.stderr
+
+        backend._ssh.execute.side_effect = run
+        bids = tmp_path / "sub's bids"
+        bids.mkdir()
+        backend._ensure_bids_description(str(bids))
+        desc = json.loads((bids / "dataset_description.json").read_text())
+        assert desc["Name"] == "sub's bids"
+
+        (bids / "dataset_description.json").write_text("{}")
+        backend._ensure_bids_description(str(bids))
+        assert (bids / "dataset_description.json").read_text() == "{}"
+        assert backend._ssh.execute.call_count == 2
+        backend._ssh.write_file.assert_not_called()
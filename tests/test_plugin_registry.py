@@ -43,6 +43,20 @@ class TestPluginRegistry:
         assert "required" in api_dict["inputs"]
         assert len(api_dict["parameters"]) == 1
 
+    def test_yaml_text_round_trips_and_is_dumped_once(self, plugin_yaml_dir, workflow_yaml_dir):
+        """yaml_text renders raw_yaml and is memoised on the definition."""
+        import yaml
+        from unittest.mock import patch
+        from backend.core.plugin_registry import PluginWorkflowRegistry
+        registry = PluginWorkflowRegistry(plugin_yaml_dir, workflow_yaml_dir)
+
+        plugin = registry.get_plugin("test_plugin")
+        with patch("backend.core.plugin_registry.yaml.dump", wraps=yaml.dump) as dump:
+            text = plugin.yaml_text
+            assert plugin.yaml_text is text
+            assert dump.call_count == 1
+        assert yaml.safe_load(text) == plugin.raw_yaml
+
     def test_load_workflows(self, plugin_yaml_dir, workflow_yaml_dir):
         """Workflows load and reference plugins correctly."""
         from backend.core.plugin_registry import PluginWorkflowRegistry
@@ -84,6 +98,20 @@ class TestPluginRegistry:
         assert "content_hash" in lockfile["plugins"]["test_plugin"]
         assert "test_workflow" in lockfile["workflows"]
 
+    def test_content_hash_matches_saved_lockfiles(self, plugin_yaml_dir, workflow_yaml_dir):
+        """Memoised content hashes keep the format of existing lockfiles."""
+        import hashlib
+        import json
+        from backend.core.plugin_registry import PluginWorkflowRegistry
+        registry = PluginWorkflowRegistry(plugin_yaml_dir, workflow_yaml_dir)
+
+        plugin = registry.get_plugin("test_plugin")
+        expected = hashlib.sha256(
+            json.dumps(plugin.raw_yaml, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        assert plugin.content_hash == expected
+        assert registry.generate_lockfile()["plugins"]["test_plugin"]["content_hash"] == expected
+
     def test_verify_lockfile_ok(self, plugin_yaml_dir, workflow_yaml_dir):
         """Verifying against a current lockfile returns OK."""
         from backend.core.plugin_registry import PluginWorkflowRegistry
@@ -123,6 +151,22 @@ class TestPluginRegistry:
         registry.reload()
         assert len(registry.plugins) == 1
 
+    def test_command_template_memo_cleared_on_reload(self, plugin_yaml_dir, workflow_yaml_dir):
+        """get_command_template is memoised until the registry reloads."""
+        from unittest.mock import patch
+        from backend.core import plugin_registry
+        registry = plugin_registry.PluginWorkflowRegistry(plugin_yaml_dir, workflow_yaml_dir)
+        plugin_id = registry.get_plugin_ids()[0]
+        plugin = registry.get_plugin(plugin_id)
+
+        with patch.object(plugin_registry, "_pw_registry", registry):
+            plugin_registry.get_command_template.cache_clear()
+            assert plugin_registry.get_command_template(plugin_id) == (plugin.command_template or plugin.command)
+            assert plugin_registry.get_command_template("no_such_plugin") == ""
+            assert plugin_registry.get_command_template.cache_info().currsize == 2
+            registry.reload()
+            assert plugin_registry.get_command_template.cache_info().currsize == 0
+
     def test_empty_dirs(self, tmp_dir):
         """Registry handles empty plugin/workflow directories."""
         from backend.core.plugin_registry import PluginWorkflowRegistry
@@ -4,7 +4,7 @@ Uses a real in-memory SQLite DB (no remote host / SSH): insert a remote_docker
 job as 'pending', mock the backend to report a live status, hit the endpoint,
 and assert both the response and the persisted DB row transition correctly.
 """
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy import create_engine
@@ -55,13 +55,14 @@ def _insert_remote_job(maker, jid="job-remote-1", status="pending"):
     return jid
 
 
-def _run_progress(maker, mapped_status):
+def _run_progress(maker, mapped_status, poll_progress=None):
     """Call GET /api/jobs/progress with get_db bound to the test DB.
 
     ``_poll_remote_docker_status_batch`` (the SSH poller, unit-tested separately)
     is stubbed to report ``mapped_status`` for the remote jobs — so this test
     exercises the endpoint's status-transition handling, not the SSH round-trip.
     ``mapped_status=None`` simulates the poller returning nothing (e.g. UNKNOWN).
+    ``poll_progress`` stands in for the per-job log parser (default: no progress).
     """
     from fastapi.testclient import TestClient
     import backend.main as m
@@ -80,7 +81,8 @@ def _run_progress(maker, mapped_status):
     m.app.dependency_overrides[get_db] = override_get_db
     try:
         with patch.object(m, "_poll_remote_docker_status_batch", side_effect=fake_poll), \
-             patch.object(m, "_poll_slurm_progress", return_value=None):
+             patch.object(m, "_poll_slurm_progress", side_effect=poll_progress or (lambda job: None)), \
+             patch.object(m, "_jobs_progress_cache", None):
             client = TestClient(m.app)
             resp = client.get("/api/jobs/progress")
         assert resp.status_code == 200, resp.text
@@ -138,3 +140,122 @@ def test_remote_job_unchanged_when_status_unknown(Session):
     assert row.status == "running"
     assert row.completed_at is None
     db.close()
+
+
+def test_transitions_share_one_commit(Session):
+    from sqlalchemy import event
+
+    commits = []
+    event.listen(Session, "after_commit", lambda session: commits.append(session))
+    _insert_remote_job(Session, jid="job-remote-1")
+    _insert_remote_job(Session, jid="job-remote-2")
+    commits.clear()
+
+    jobs = _run_progress(Session, "running")
+    assert {jobs[j]["status"] for j in ("job-remote-1", "job-remote-2")} == {"running"}
+    assert len(commits) == 1
+
+    commits.clear()
+    _run_progress(Session, "running")  # nothing moved: no write at all
+    assert commits == []
+
+
+def test_log_polls_run_concurrently(Session):
+    import threading
+
+    _insert_remote_job(Session, jid="job-remote-1", status="running")
+    _insert_remote_job(Session, jid="job-remote-2", status="running")
+    # Each poll waits for the other; a sequential loop would break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def poll(job):
+        barrier.wait()
+        return (40, "Halfway")
+
+    jobs = _run_progress(Session, None, poll_progress=poll)
+    assert {(j["progress"], j["current_phase"]) for j in jobs.values()} == {(40, "Halfway")}
+
+    from backend.models.job import Job
+
+    db = Session()
+    assert {row.progress for row in db.query(Job)} == {40}
+    db.close()
+
+
+def test_progress_rows_skip_wide_columns(Session):
+    from sqlalchemy import inspect
+
+    _insert_remote_job(Session, status="running")
+    unloaded = []
+
+    def poll(job):
+        unloaded.extend(inspect(job).unloaded)
+        return None
+
+    _run_progress(Session, None, poll_progress=poll)
+    assert {"input_files", "resources", "tags"} <= set(unloaded)
+    assert "parameters" not in unloaded
+
+
+def test_polls_within_ttl_share_one_result(Session):
+    from fastapi.testclient import TestClient
+    import backend.main as m
+    from backend.core.database import get_db
+
+    _insert_remote_job(Session)
+    m.app.dependency_overrides[get_db] = lambda: Session()
+    try:
+        with patch.object(m, "_poll_remote_docker_status_batch", return_value={}) as poll, \
+             patch.object(m, "_jobs_progress_cache", None):
+            client = TestClient(m.app)
+            first = client.get("/api/jobs/progress").json()
+            assert client.get("/api/jobs/progress").json() == first
+            assert poll.call_count == 1
+            m._invalidate_jobs_progress()  # e.g. a job was submitted
+            client.get("/api/jobs/progress")
+            assert poll.call_count == 2
+    finally:
+        m.app.dependency_overrides.pop(get_db, None)
+
+
+def test_poll_during_submit_is_not_served_after_it():
+    from fastapi.testclient import TestClient
+    import backend.main as m
+
+    results = iter([{"jobs": []}, {"jobs": [{"id": "new"}]}])
+    pipeline = m.get_pipeline_registry().list_pipelines()[0]
+
+    def submit_job(spec, job_id):
+        # A tab polls while the job is still being written
+        assert m.get_jobs_progress(db=None) == {"jobs": []}
+
+    backend = MagicMock(submit_job=MagicMock(side_effect=submit_job))
+    with patch.object(m, "_collect_jobs_progress", side_effect=lambda db: next(results)), \
+         patch.object(m, "get_backend", return_value=backend), \
+         patch.object(m, "_jobs_progress_cache", None):
+        resp = TestClient(m.app).post("/api/jobs/submit", json={
+            "pipeline_name": pipeline.name, "input_files": ["/data/t1.nii.gz"],
+        })
+        assert resp.status_code == 200, resp.text
+        assert backend.submit_job.called
+        assert m.get_jobs_progress(db=None) == {"jobs": [{"id": "new"}]}
+
+
+def test_log_resolution_sizes_candidates_once():
+    from unittest.mock import MagicMock
+    import backend.main as m
+
+    ssh = MagicMock()
+    ssh.execute.return_value = (1, "0 /o/logs/step_2_b.log\n120 /o/logs/step_1_a.log\n", "")
+    path, plugin_id, step_idx, _, size = m._resolve_active_slurm_log_path(
+        ssh, "/o", ["a", "b"], slurm_id="7",
+    )
+    assert (path, plugin_id, step_idx, size) == ("/o/logs/step_1_a.log", "a", 0, 120)
+    assert ssh.execute.call_count == 1
+
+    # Unchanged size: nothing is read
+    assert m._read_remote_log_delta(ssh, path, offset=120, size=120) == ("", 120)
+    assert ssh.execute.call_count == 1
+    ssh.execute.return_value = (0, "more\n", "")
+    assert m._read_remote_log_delta(ssh, path, offset=120, size=125) == ("more\n", 125)
+    assert "tail -c +121 " in ssh.execute.call_args.args[0]
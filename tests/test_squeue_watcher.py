@@ -0,0 +1,44 @@
+"""
+Tests for the live squeue mirror.
+"""
+from unittest.mock import MagicMock
+
+
+class TestSqueueWatcher:
+    """Test SqueueWatcher listing parsing and fallback behaviour."""
+
+    def test_publishes_complete_listings(self):
+        """A listing becomes visible once the next one starts."""
+        from backend.core.squeue_watcher import SqueueWatcher
+        ssh = MagicMock()
+        ssh.stream_lines.return_value = (line for line in [
+            "Fri Oct 16 09:00:00 2026", "JOBID|STATE", "101|RUNNING", "102|PENDING",
+            "Fri Oct 16 09:00:05 2026", "JOBID|STATE", "101|COMPLETING",
+        ])
+        watcher = SqueueWatcher(ssh)
+        assert watcher.states() is None  # starts the stream
+        watcher._thread.join(5)
+        assert watcher.states() == {"101": "RUNNING", "102": "PENDING"}
+        assert "squeue -u" in ssh.stream_lines.call_args.args[0]
+
+    def test_unavailable_without_streaming(self):
+        """Managers that cannot stream leave callers on direct queries."""
+        from backend.core.squeue_watcher import SqueueWatcher
+        ssh = MagicMock(spec=["execute"])
+        watcher = SqueueWatcher(ssh)
+        watcher.states()
+        watcher._thread.join(5)
+        first = watcher._thread
+        assert watcher.states() is None
+        assert watcher._thread is first  # not restarted
+
+    def test_failed_stream_backs_off(self):
+        """A stream that dies before any listing is not retried immediately."""
+        from backend.core.squeue_watcher import SqueueWatcher
+        ssh = MagicMock()
+        ssh.stream_lines.side_effect = lambda cmd: (line for line in ["squeue: command not found"])
+        watcher = SqueueWatcher(ssh)
+        watcher.states()
+        watcher._thread.join(5)
+        watcher.states()
+        assert ssh.stream_lines.call_count == 1
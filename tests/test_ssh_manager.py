@@ -105,6 +105,49 @@ class TestSSHManager:
         assert mgr._idle_timer is None
         mgr.disconnect()
 
+    @patch("backend.core.ssh_manager.paramiko.SSHClient")
+    def test_execute_reconnects_when_transport_dropped(self, mock_ssh_cls):
+        """A channel that cannot open on a dead transport is retried once after reconnecting."""
+        from backend.core.ssh_manager import SSHManager
+        stale, fresh = MagicMock(), MagicMock()
+
+        def drop(*args, **kwargs):
+            stale.get_transport.return_value.is_active.return_value = False
+            raise EOFError("transport closed")
+
+        stale.exec_command.side_effect = drop
+        out = MagicMock()
+        out.read.return_value = b"ok\n"
+        out.channel.recv_exit_status.return_value = 0
+        err = MagicMock()
+        err.read.return_value = b""
+        fresh.exec_command.return_value = (MagicMock(), out, err)
+        mock_ssh_cls.side_effect = [stale, fresh]
+
+        mgr = SSHManager()
+        mgr.configure(host="test.host", username="user", idle_timeout=0)
+        mgr.connect()
+        assert mgr.execute("hostname") == (0, "ok\n", "")
+        assert fresh.exec_command.call_count == 1
+        mgr.disconnect()
+
+    @patch("backend.core.ssh_manager.paramiko.SSHClient")
+    def test_stream_lines_yields_and_closes(self, mock_ssh_cls):
+        """stream_lines yields stdout lines and closes its channel when done."""
+        from backend.core.ssh_manager import SSHManager
+        client = MagicMock()
+        channel = client.get_transport.return_value.open_session.return_value
+        channel.makefile.return_value = iter(["a\n", "b\n"])
+        mock_ssh_cls.return_value = client
+
+        mgr = SSHManager()
+        mgr.configure(host="test.host", username="user", idle_timeout=0)
+        mgr.connect()
+        assert list(mgr.stream_lines("squeue -i 5")) == ["a", "b"]
+        channel.exec_command.assert_called_once_with("squeue -i 5")
+        channel.close.assert_called_once()
+        mgr.disconnect()
+
 
 class TestSSHManagerExceptions:
     """Test error handling in SSHManager."""